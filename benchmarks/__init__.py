@@ -0,0 +1,17 @@
+"""Performance benchmarks for the calculator library and services.
+
+Run the suites and compare results between commits from the repository root:
+	python -m benchmarks run --output results.json
+	python -m benchmarks compare baseline.json results.json --threshold 0.15
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# The day folders hold plain modules rather than packages.
+for folder in ("day2", "day5"):
+	path = str(REPO_ROOT / folder)
+	if path not in sys.path:
+		sys.path.append(path)
@@ -0,0 +1,70 @@
+"""Command-line entry point: python -m benchmarks {run,compare}."""
+
+import argparse
+import importlib
+import sys
+
+from benchmarks.results import build_report, compare_reports, load_report, save_report
+
+
+SUITES = {
+	"micro": "benchmarks.micro",
+	"api": "benchmarks.api",
+	"http": "benchmarks.http_load",
+	"startup": "benchmarks.startup",
+}
+DEFAULT_SUITES = ["micro", "api"]
+
+
+def run_command(args) -> int:
+	results = {}
+	for suite in args.suite:
+		print(f"Running {suite} benchmarks...", file=sys.stderr)
+		results.update(importlib.import_module(SUITES[suite]).run(quick=args.quick))
+
+	for name, result in sorted(results.items()):
+		print(f"{name:<40} {result['value']:>14.2f} {result['unit']}")
+
+	if args.output:
+		save_report(build_report(results), args.output)
+	return 0
+
+
+def compare_command(args) -> int:
+	rows = compare_reports(load_report(args.baseline), load_report(args.current), args.threshold)
+	for row in rows:
+		flag = "REGRESSION" if row["regression"] else ""
+		print(
+			f"{row['name']:<40} {row['baseline']:>14.2f} {row['current']:>14.2f} "
+			f"{row['unit']:<10} {row['change']:>+8.1%} {flag}"
+		)
+
+	regressions = [row["name"] for row in rows if row["regression"]]
+	if regressions:
+		print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold:.0%}.", file=sys.stderr)
+		return 1
+	return 0
+
+
+def main() -> int:
+	parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Calculator benchmark suite.")
+	subcommands = parser.add_subparsers(dest="command", required=True)
+
+	run_parser = subcommands.add_parser("run", help="Run benchmark suites.")
+	run_parser.add_argument("--suite", nargs="+", choices=sorted(SUITES), default=DEFAULT_SUITES)
+	run_parser.add_argument("--quick", action="store_true", help="Fewer repeats and smaller inputs.")
+	run_parser.add_argument("--output", help="Write a JSON report to this path.")
+	run_parser.set_defaults(handler=run_command)
+
+	compare_parser = subcommands.add_parser("compare", help="Compare two JSON reports.")
+	compare_parser.add_argument("baseline")
+	compare_parser.add_argument("current")
+	compare_parser.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown (0.15 = 15%%).")
+	compare_parser.set_defaults(handler=compare_command)
+
+	args = parser.parse_args()
+	return args.handler(args)
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,129 @@
+"""In-process Flask throughput benchmarks using app.test_client()."""
+
+from calc_metrics import MetricsRegistry
+from calc_trace import Tracer
+from day5_flask_cals import (
+	app,
+	finish_trace,
+	record_request_metrics,
+	start_request_timer,
+	start_tracing,
+	stop_profile,
+	trace_span,
+)
+from flask import request
+
+from benchmarks.results import measurement, time_statement
+
+
+REQUESTS = {
+	"home": ("GET", "/", None),
+	"add": ("POST", "/add", {"a": 10, "b": 5}),
+	"add.decimal": ("POST", "/add", {"a": "10.25", "b": 5, "mode": "decimal"}),
+	"add.fraction": ("POST", "/add", {"a": "1/3", "b": 5, "mode": "fraction"}),
+	"div": ("POST", "/div", {"a": 10, "b": 4}),
+	"pow": ("POST", "/pow", {"a": 2, "b": 10}),
+	"div_by_zero": ("POST", "/div", {"a": 10, "b": 0}),
+	"invalid_input": ("POST", "/mul", {"a": "hello", "b": 5}),
+	"eval": ("POST", "/eval", {"expression": "(2+3)*4-sqrt(16)/2"}),
+	"batch_100": ("POST", "/batch", {"op": "mul", "a": list(range(100)), "b": list(range(100))}),
+}
+
+
+def run(quick: bool = False) -> dict[str, dict]:
+	app.config["TESTING"] = True
+	client = app.test_client()
+	results = {}
+
+	for name, (method, path, payload) in REQUESTS.items():
+		timing = time_statement(lambda: client.open(path, method=method, json=payload), repeat=3 if quick else 5)
+		seconds = timing["value"] / 1e9
+		results[f"api.{name}"] = measurement(1 / seconds, "req/s", higher_is_better=True, us_per_request=seconds * 1e6)
+
+	results.update(run_view_timings(quick))
+	results.update(run_metrics_overhead(quick))
+	results.update(run_tracing_overhead(quick))
+	return results
+
+
+def run_view_timings(quick: bool) -> dict[str, dict]:
+	"""Time each view's request parsing and response encoding on their own.
+
+	Views are called inside one request context, skipping the test client,
+	WSGI and routing, which cost an order of magnitude more than JSON handling.
+	"""
+	results = {}
+	for name, (method, path, payload) in REQUESTS.items():
+		with app.test_request_context(path, method=method, json=payload):
+			current = request._get_current_object()
+			view = app.view_functions[current.url_rule.endpoint]
+
+			def call():
+				# Drop the parsed body Werkzeug caches so every call parses it again.
+				current._cached_json = (Ellipsis, Ellipsis)
+				app.make_response(view())
+
+			results[f"api.view.{name}"] = time_statement(call, repeat=3 if quick else 5)
+	return results
+
+
+def run_metrics_overhead(quick: bool) -> dict[str, dict]:
+	"""Measure what the /metrics instrumentation adds to each request.
+
+	The before/after request hooks are timed directly inside a request context,
+	because their cost is far below the run-to-run noise of a full request.
+	"""
+	repeat = 3 if quick else 5
+	registry = MetricsRegistry()
+	observe = time_statement(lambda: registry.observe("/add", "POST", 200, 0.0004), repeat=repeat)
+
+	previous = app.config["METRICS"]
+	app.config["METRICS"] = MetricsRegistry()
+	try:
+		with app.test_request_context("/add", method="POST", json={"a": 10, "b": 5}):
+			response = app.response_class(b"{}", mimetype="application/json")
+
+			def hooks():
+				start_request_timer()
+				record_request_metrics(response)
+
+			overhead = time_statement(hooks, repeat=repeat)
+	finally:
+		app.config["METRICS"] = previous
+
+	return {
+		"api.metrics.observe": observe,
+		"api.metrics.request_overhead": measurement(overhead["value"], "ns/request", best=overhead["best"]),
+	}
+
+
+def run_tracing_overhead(quick: bool) -> dict[str, dict]:
+	"""Measure what the tracing hooks and spans add to one /add request, off and on.
+
+	Times the three request hooks plus the three spans an arithmetic view
+	opens, inside one request context like run_metrics_overhead.
+	"""
+	repeat = 3 if quick else 5
+	results = {}
+	previous = app.config["TRACER"]
+	try:
+		with app.test_request_context("/add", method="POST", json={"a": 10, "b": 5}):
+			response = app.response_class(b"{}", mimetype="application/json")
+
+			def request_with_spans():
+				start_tracing()
+				for name in ("parse_numbers", "calc.add", "serialize"):
+					with trace_span(name):
+						pass
+				finish_trace(response)
+				stop_profile()
+
+			for name, tracer in (("off", None), ("on", Tracer())):
+				app.config["TRACER"] = tracer
+				timing = time_statement(request_with_spans, repeat=repeat)
+				results[f"api.tracing.request_overhead.{name}"] = measurement(
+					timing["value"], "ns/request", best=timing["best"]
+				)
+	finally:
+		app.config["TRACER"] = previous
+	return results
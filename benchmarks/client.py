@@ -0,0 +1,65 @@
+"""Compare per-call latency of urlopen with the pooled CalcClient.
+
+Run from the repository root:
+	python -m benchmarks.client --calls 2000
+"""
+
+import argparse
+import json
+import sys
+import time
+from urllib.request import Request, urlopen
+
+from calc_client import CalcClient
+
+from benchmarks.http_load import launch_server, percentile
+
+
+HOST = "127.0.0.1"
+PORT = 5002
+
+
+def call_with_urlopen(base_url: str) -> None:
+	body = json.dumps({"a": 10, "b": 5}).encode("utf-8")
+	request = Request(f"{base_url}/add", data=body, method="POST", headers={"Content-Type": "application/json"})
+	with urlopen(request, timeout=5) as response:
+		json.loads(response.read().decode("utf-8"))
+
+
+def measure(call, calls: int) -> dict:
+	samples = []
+	for _ in range(calls):
+		started = time.perf_counter()
+		call()
+		samples.append(time.perf_counter() - started)
+
+	samples.sort()
+	return {
+		"mean_us": sum(samples) / len(samples) * 1e6,
+		"p50_us": percentile(samples, 0.50) * 1e6,
+		"p99_us": percentile(samples, 0.99) * 1e6,
+	}
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--calls", type=int, default=2000)
+	args = parser.parse_args()
+
+	base_url = f"http://{HOST}:{PORT}"
+	command = [sys.executable, "day5/day5_asgi_cals.py", "--workers", "1", "--port", str(PORT)]
+	with launch_server(command, HOST, PORT):
+		client = CalcClient(base_url)
+		results = {
+			"urlopen": measure(lambda: call_with_urlopen(base_url), args.calls),
+			"CalcClient": measure(lambda: client.calculate("add", 10, 5), args.calls),
+		}
+		client.close()
+
+	print(f"{'client':<12} {'mean us':>10} {'p50 us':>10} {'p99 us':>10}")
+	for name, result in results.items():
+		print(f"{name:<12} {result['mean_us']:>10.0f} {result['p50_us']:>10.0f} {result['p99_us']:>10.0f}")
+
+
+if __name__ == "__main__":
+	main()
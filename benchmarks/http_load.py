@@ -0,0 +1,151 @@
+"""Closed-loop HTTP load generator and local server launcher for benchmarks."""
+
+import http.client
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from benchmarks import REPO_ROOT
+
+
+def wait_for_port(host: str, port: int, timeout: float = 15.0) -> None:
+	deadline = time.monotonic() + timeout
+	while time.monotonic() < deadline:
+		try:
+			with socket.create_connection((host, port), timeout=0.5):
+				return
+		except OSError:
+			time.sleep(0.05)
+	raise TimeoutError(f"Server on {host}:{port} did not start within {timeout} s.")
+
+
+@contextmanager
+def launch_server(command: list[str], host: str, port: int | None, ready=None):
+	"""Run a server command in its own process group until the block exits.
+
+	The block starts once host:port accepts connections, or once `ready()`
+	returns when given (for servers that do not listen on TCP).
+	"""
+	process = subprocess.Popen(
+		command,
+		cwd=REPO_ROOT,
+		stdout=subprocess.DEVNULL,
+		stderr=subprocess.DEVNULL,
+		start_new_session=True,
+	)
+	try:
+		if ready is not None:
+			ready()
+		else:
+			wait_for_port(host, port)
+		yield process
+	finally:
+		os.killpg(process.pid, signal.SIGTERM)
+		try:
+			process.wait(timeout=10)
+		except subprocess.TimeoutExpired:
+			os.killpg(process.pid, signal.SIGKILL)
+			process.wait()
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+	if not sorted_values:
+		return 0.0
+	index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+	return sorted_values[index]
+
+
+def run_load(
+	host: str,
+	port: int,
+	path: str = "/add",
+	payload: dict | None = None,
+	concurrency: int = 16,
+	duration: float = 5.0,
+) -> dict:
+	"""Send POST requests from `concurrency` keep-alive clients for `duration` seconds.
+
+	Returns requests/sec, error count and latency percentiles in milliseconds.
+	"""
+	body = json.dumps(payload if payload is not None else {"a": 10, "b": 5}).encode("utf-8")
+	headers = {"Content-Type": "application/json"}
+	latencies: list[list[float]] = [[] for _ in range(concurrency)]
+	errors = [0] * concurrency
+	start_barrier = threading.Barrier(concurrency + 1)
+	stop_at = 0.0
+
+	def worker(slot: int) -> None:
+		connection = http.client.HTTPConnection(host, port, timeout=10)
+		samples = latencies[slot]
+		start_barrier.wait()
+		while time.perf_counter() < stop_at:
+			started = time.perf_counter()
+			try:
+				connection.request("POST", path, body=body, headers=headers)
+				response = connection.getresponse()
+				response.read()
+				if response.status >= 500:
+					errors[slot] += 1
+			except (OSError, http.client.HTTPException):
+				errors[slot] += 1
+				connection.close()
+				continue
+			samples.append(time.perf_counter() - started)
+		connection.close()
+
+	threads = [threading.Thread(target=worker, args=(slot,), daemon=True) for slot in range(concurrency)]
+	for thread in threads:
+		thread.start()
+
+	stop_at = time.perf_counter() + duration
+	started = time.perf_counter()
+	start_barrier.wait()
+	for thread in threads:
+		thread.join()
+	elapsed = time.perf_counter() - started
+
+	merged = sorted(sample for samples in latencies for sample in samples)
+	return {
+		"requests": len(merged),
+		"errors": sum(errors),
+		"requests_per_sec": len(merged) / elapsed,
+		"p50_ms": percentile(merged, 0.50) * 1000,
+		"p99_ms": percentile(merged, 0.99) * 1000,
+	}
+
+
+SERVERS = {
+	"flask": ([sys.executable, "day5/day5_flask_cals.py"], 5000),
+	"asgi": ([sys.executable, "day5/day5_asgi_cals.py", "--workers", "1", "--port", "5001"], 5001),
+}
+
+
+def run(quick: bool = False) -> dict[str, dict]:
+	"""Launch each server locally and measure /add throughput and tail latency."""
+	from benchmarks.results import measurement
+
+	host = "127.0.0.1"
+	duration = 2.0 if quick else 5.0
+	results = {}
+	for name, (command, port) in SERVERS.items():
+		with launch_server(command, host, port):
+			run_load(host, port, duration=0.5)
+			load = run_load(host, port, duration=duration)
+		results[f"http.{name}.add.throughput"] = measurement(load["requests_per_sec"], "req/s", higher_is_better=True)
+		results[f"http.{name}.add.p99"] = measurement(load["p99_ms"], "ms")
+	return results
+
+
+def main() -> None:
+	host, port = sys.argv[1], int(sys.argv[2])
+	print(json.dumps(run_load(host, port), indent=2))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,58 @@
+"""Micro-benchmarks for the calculator library in day2."""
+
+from fractions import Fraction
+
+import calc
+import numpy as np
+from calc_expression import evaluate
+from calc_numeric import MODES as NUMERIC_MODES
+from calc_numeric import calculate
+from calc_reduce import MODES as REDUCE_MODES
+from calc_reduce import reduce_sum
+from calc_vector import vector_addition, vector_division
+
+from benchmarks.results import measurement, time_statement
+
+
+VECTOR_SIZE = 1_000_000
+
+
+def run(quick: bool = False) -> dict[str, dict]:
+	repeat = 3 if quick else 5
+	namespace = {"calc": calc, "evaluate": evaluate, "fraction": Fraction(1, 3), "float64": np.float64(2.5)}
+	results = {}
+
+	scalar_statements = {
+		"validate_number.int": "calc._validate_number(7, 'a')",
+		"validate_number.float": "calc._validate_number(2.5, 'a')",
+		# Types outside the exact int/float fast path fall back to the numbers.Real ABC.
+		"validate_number.fraction": "calc._validate_number(fraction, 'a')",
+		"validate_number.numpy_float64": "calc._validate_number(float64, 'a')",
+		"addition": "calc.addition(2.5, 3)",
+		"subtraction": "calc.subtraction(2.5, 3)",
+		"multiplication": "calc.multiplication(2.5, 3)",
+		"division": "calc.division(2.5, 3)",
+		"square_root": "calc.square_root(2.5)",
+		"expression.cached": "evaluate('(2+3)*4-sqrt(16)/2')",
+	}
+	for name, stmt in scalar_statements.items():
+		results[f"micro.{name}"] = time_statement(stmt, namespace, repeat=repeat)
+
+	# Cost of each numeric backend for the same operations; 6.25 has a rational root.
+	for mode in NUMERIC_MODES:
+		for operation, a, b in (("add", 2.5, 3), ("div", 2.5, 3), ("sqrt", 6.25, None)):
+			stmt = lambda: calculate(operation, a, b, mode=mode)  # noqa: E731
+			results[f"micro.numeric.{mode}.{operation}"] = time_statement(stmt, repeat=repeat)
+
+	size = VECTOR_SIZE // 10 if quick else VECTOR_SIZE
+	first = np.random.default_rng(1).random(size) + 1
+	second = np.random.default_rng(2).random(size) + 1
+	for name, function in (("vector_addition", vector_addition), ("vector_division", vector_division)):
+		timing = time_statement(lambda: function(first, second), repeat=repeat)
+		results[f"micro.{name}"] = measurement(timing["value"] / size, "ns/element", best=timing["best"] / size)
+
+	for mode in REDUCE_MODES:
+		timing = time_statement(lambda: reduce_sum(first, mode=mode), repeat=repeat)
+		results[f"micro.reduce_sum.{mode}"] = measurement(timing["value"] / size, "ns/element", best=timing["best"] / size)
+
+	return results
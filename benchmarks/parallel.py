@@ -0,0 +1,52 @@
+"""Compare in-process vector operations with the process-pool path.
+
+Run from the repository root:
+	python -m benchmarks.parallel --size 20000000 --workers 4
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from calc_parallel import default_workers, parallel_compute, shutdown_executor
+
+
+def best_of(call, repeat: int) -> float:
+	timings = []
+	for _ in range(repeat):
+		started = time.perf_counter()
+		call()
+		timings.append(time.perf_counter() - started)
+	return min(timings)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--size", type=int, default=10_000_000)
+	parser.add_argument("--workers", type=int, default=default_workers())
+	parser.add_argument("--operation", default="div", choices=("add", "sub", "mul", "div", "sqrt"))
+	parser.add_argument("--repeat", type=int, default=3)
+	args = parser.parse_args()
+
+	rng = np.random.default_rng(0)
+	operands = [rng.uniform(1.0, 100.0, args.size)]
+	if args.operation != "sqrt":
+		operands.append(rng.uniform(1.0, 100.0, args.size))
+
+	# Warm the pool so worker start-up is not part of the measurement.
+	parallel_compute(args.operation, *operands, workers=args.workers, threshold=0)
+
+	serial = best_of(lambda: parallel_compute(args.operation, *operands, workers=1), args.repeat)
+	parallel = best_of(
+		lambda: parallel_compute(args.operation, *operands, workers=args.workers, threshold=0), args.repeat
+	)
+	shutdown_executor()
+
+	print(f"{'path':<24} {'seconds':>10} {'Melem/s':>10}")
+	for name, seconds in (("in-process", serial), (f"pool ({args.workers} workers)", parallel)):
+		print(f"{name:<24} {seconds:>10.3f} {args.size / seconds / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+	main()
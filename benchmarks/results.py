@@ -0,0 +1,91 @@
+"""Benchmark result records, JSON persistence and regression comparison."""
+
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from collections.abc import Callable
+
+from benchmarks import REPO_ROOT
+
+
+def measurement(value: float, unit: str, higher_is_better: bool = False, **extra) -> dict:
+	return {"value": value, "unit": unit, "higher_is_better": higher_is_better, **extra}
+
+
+def time_statement(stmt: str | Callable, namespace: dict | None = None, repeat: int = 5) -> dict:
+	"""Time a statement with timeit and return the median nanoseconds per call.
+
+	The loop count is chosen by Timer.autorange (at least 0.2 s per run), and
+	the median of `repeat` runs is reported to damp scheduler noise.
+	"""
+	timer = timeit.Timer(stmt, globals=namespace)
+	number, _ = timer.autorange()
+	per_call = sorted(run / number for run in timer.repeat(repeat=repeat, number=number))
+	return measurement(per_call[len(per_call) // 2] * 1e9, "ns/op", best=per_call[0] * 1e9, loops=number)
+
+
+def git_commit() -> str | None:
+	try:
+		output = subprocess.run(
+			["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+		)
+	except (OSError, subprocess.CalledProcessError):
+		return None
+	return output.stdout.strip()
+
+
+def build_report(results: dict[str, dict]) -> dict:
+	return {
+		"meta": {
+			"commit": git_commit(),
+			"timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+			"python": sys.version.split()[0],
+			"platform": platform.platform(),
+		},
+		"results": results,
+	}
+
+
+def save_report(report: dict, path: str) -> None:
+	with open(path, "w", encoding="utf-8") as handle:
+		json.dump(report, handle, indent=2, sort_keys=True)
+		handle.write("\n")
+
+
+def load_report(path: str) -> dict:
+	with open(path, encoding="utf-8") as handle:
+		return json.load(handle)
+
+
+def compare_reports(baseline: dict, current: dict, threshold: float) -> list[dict]:
+	"""Compare benchmarks present in both reports.
+
+	Each row holds the relative change, where positive means slower (or lower
+	throughput), and whether it exceeds `threshold` (0.15 means 15% worse).
+	"""
+	rows = []
+	baseline_results = baseline["results"]
+	for name, result in sorted(current["results"].items()):
+		previous = baseline_results.get(name)
+		if previous is None or previous["value"] == 0 or result["value"] == 0:
+			continue
+
+		if result.get("higher_is_better"):
+			change = previous["value"] / result["value"] - 1
+		else:
+			change = result["value"] / previous["value"] - 1
+
+		rows.append(
+			{
+				"name": name,
+				"unit": result["unit"],
+				"baseline": previous["value"],
+				"current": result["value"],
+				"change": change,
+				"regression": change > threshold,
+			}
+		)
+	return rows
@@ -0,0 +1,43 @@
+"""Compare the Flask development server with the ASGI worker launcher.
+
+Run from the repository root:
+	python -m benchmarks.serving --workers 4 --duration 10
+"""
+
+import argparse
+import sys
+
+from benchmarks.http_load import launch_server, run_load
+
+
+HOST = "127.0.0.1"
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--workers", type=int, default=4)
+	parser.add_argument("--concurrency", type=int, default=16)
+	parser.add_argument("--duration", type=float, default=5.0)
+	args = parser.parse_args()
+
+	servers = {
+		"flask-dev": ([sys.executable, "day5/day5_flask_cals.py"], 5000),
+		f"asgi-{args.workers}w": (
+			[sys.executable, "day5/day5_asgi_cals.py", "--workers", str(args.workers), "--port", "5001"],
+			5001,
+		),
+	}
+
+	print(f"{'server':<12} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+	for name, (command, port) in servers.items():
+		with launch_server(command, HOST, port):
+			run_load(HOST, port, concurrency=args.concurrency, duration=1.0)
+			result = run_load(HOST, port, concurrency=args.concurrency, duration=args.duration)
+		print(
+			f"{name:<12} {result['requests_per_sec']:>10.0f} {result['p50_ms']:>10.2f} "
+			f"{result['p99_ms']:>10.2f} {result['errors']:>8}"
+		)
+
+
+if __name__ == "__main__":
+	main()
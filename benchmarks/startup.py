@@ -0,0 +1,135 @@
+"""Cold-start benchmarks: module import time and time to first response.
+
+Import times are the cumulative microseconds `python -X importtime` reports
+for each entry module, in a fresh interpreter each run. Time to first
+response starts just before the server process is spawned and stops at the
+first 200 response from the given route, so it includes interpreter startup.
+"""
+
+import http.client
+import json
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks import REPO_ROOT
+from benchmarks.http_load import launch_server
+from benchmarks.results import measurement
+
+
+MODULES = {
+	"flask_app": "day5.day5_flask_cals",
+	"asgi_app": "day5.day5_asgi_cals",
+	"fast_start": "day5.day5_fast_start",
+	"streamlit_ui": "day5.day5_streamlit_cals",
+	"api_client": "day5.calc_client",
+}
+
+ADD_REQUEST = ("POST", "/add", json.dumps({"a": 10, "b": 5}).encode("utf-8"))
+HEALTH_REQUEST = ("GET", "/health", None)
+
+
+def free_port() -> int:
+	with socket.socket() as sock:
+		sock.bind(("127.0.0.1", 0))
+		return sock.getsockname()[1]
+
+
+def servers(port: int) -> dict[str, tuple[list[str], tuple]]:
+	"""Return name: (command, first request) for each server to start on port."""
+	python = sys.executable
+	return {
+		# The full app imported up front, served by the same Werkzeug server as fast_start.
+		"flask.health": (
+			[
+				python,
+				"-c",
+				"from werkzeug.serving import run_simple; from day5.day5_flask_cals import app; "
+				f"run_simple('127.0.0.1', {port}, app, threaded=True)",
+			],
+			HEALTH_REQUEST,
+		),
+		"fast_start.health": ([python, "day5/day5_fast_start.py", "--port", str(port)], HEALTH_REQUEST),
+		"fast_start.add": ([python, "day5/day5_fast_start.py", "--port", str(port)], ADD_REQUEST),
+		"asgi.health": ([python, "day5/day5_asgi_cals.py", "--workers", "1", "--port", str(port)], HEALTH_REQUEST),
+		"streamlit.health": (
+			[
+				python,
+				"-m",
+				"streamlit",
+				"run",
+				"day5/day5_streamlit_cals.py",
+				"--server.headless",
+				"true",
+				"--server.port",
+				str(port),
+				"--server.fileWatcherType",
+				"none",
+				"--browser.gatherUsageStats",
+				"false",
+			],
+			("GET", "/_stcore/health", None),
+		),
+	}
+
+
+def import_time_ms(module: str) -> float:
+	"""Return the cumulative import time of module in a fresh interpreter, in milliseconds."""
+	output = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", f"import {module}"],
+		cwd=REPO_ROOT,
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+	for line in reversed(output.stderr.splitlines()):
+		fields = line.split("|")
+		if len(fields) == 3 and fields[2].strip() == module:
+			return int(fields[1]) / 1000
+	raise RuntimeError(f"{module} does not appear in the -X importtime output.")
+
+
+def wait_for_response(port: int, request: tuple, timeout: float = 60.0) -> None:
+	"""Repeat request until it returns 200."""
+	method, path, body = request
+	headers = {"Content-Type": "application/json"} if body is not None else {}
+	deadline = time.monotonic() + timeout
+	while time.monotonic() < deadline:
+		connection = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+		try:
+			connection.request(method, path, body=body, headers=headers)
+			if connection.getresponse().status == 200:
+				return
+		except OSError:
+			time.sleep(0.005)
+		finally:
+			connection.close()
+	raise TimeoutError(f"{method} {path} on port {port} did not return 200 within {timeout} s.")
+
+
+def time_to_first_response_ms(command: list[str], request: tuple, port: int) -> float:
+	started = time.perf_counter()
+	with launch_server(command, "127.0.0.1", port, ready=lambda: wait_for_response(port, request)):
+		return (time.perf_counter() - started) * 1000
+
+
+def run(quick: bool = False) -> dict[str, dict]:
+	repeat = 1 if quick else 3
+	results = {}
+
+	for name, module in MODULES.items():
+		runs = [import_time_ms(module) for _ in range(repeat)]
+		results[f"startup.import.{name}"] = measurement(statistics.median(runs), "ms", best=min(runs))
+
+	for name in servers(0):
+		runs = []
+		for _ in range(repeat):
+			# A fresh port per run, so a server still shutting down cannot answer.
+			port = free_port()
+			command, request = servers(port)[name]
+			runs.append(time_to_first_response_ms(command, request, port))
+		results[f"startup.first_response.{name}"] = measurement(statistics.median(runs), "ms", best=min(runs))
+
+	return results
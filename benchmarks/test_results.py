@@ -0,0 +1,41 @@
+import unittest
+
+from benchmarks.results import build_report, compare_reports, measurement, time_statement
+
+
+class TestBenchmarkResults(unittest.TestCase):
+    def report(self, **values):
+        return {"results": values}
+
+    def test_lower_is_better_regression(self):
+        baseline = self.report(op=measurement(100.0, "ns/op"))
+        current = self.report(op=measurement(120.0, "ns/op"))
+        [row] = compare_reports(baseline, current, threshold=0.15)
+        self.assertAlmostEqual(row["change"], 0.20)
+        self.assertTrue(row["regression"])
+
+    def test_higher_is_better_regression(self):
+        baseline = self.report(api=measurement(1000.0, "req/s", higher_is_better=True))
+        current = self.report(api=measurement(900.0, "req/s", higher_is_better=True))
+        [row] = compare_reports(baseline, current, threshold=0.15)
+        self.assertAlmostEqual(row["change"], 1000 / 900 - 1)
+        self.assertFalse(row["regression"])
+
+    def test_improvements_and_new_benchmarks_are_not_regressions(self):
+        baseline = self.report(op=measurement(100.0, "ns/op"))
+        current = self.report(op=measurement(50.0, "ns/op"), new=measurement(1.0, "ns/op"))
+        rows = compare_reports(baseline, current, threshold=0.0)
+        self.assertEqual([row["name"] for row in rows], ["op"])
+        self.assertFalse(rows[0]["regression"])
+
+    def test_time_statement_and_report_metadata(self):
+        result = time_statement("sum(range(10))", repeat=1)
+        self.assertEqual(result["unit"], "ns/op")
+        self.assertGreater(result["value"], 0)
+        report = build_report({"sum": result})
+        self.assertIn("timestamp", report["meta"])
+        self.assertEqual(report["results"]["sum"], result)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Compare the Flask JSON API with the binary wire-protocol server.
+
+Run from the repository root:
+	python -m benchmarks.wire --calls 5000 --records 1000000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from calc_client import CalcClient
+from calc_wire_client import WireClient
+
+from benchmarks.http_load import SERVERS, launch_server
+
+
+HOST = "127.0.0.1"
+WIRE_PORT = 5010
+
+
+def wait_for_socket(path: str, timeout: float = 15.0) -> None:
+	deadline = time.monotonic() + timeout
+	while not os.path.exists(path):
+		if time.monotonic() > deadline:
+			raise TimeoutError(f"Server did not create {path} within {timeout} s.")
+		time.sleep(0.05)
+
+
+def calls_per_second(call, calls: int) -> float:
+	started = time.perf_counter()
+	for _ in range(calls):
+		call()
+	return calls / (time.perf_counter() - started)
+
+
+def measure_wire(address: str, calls: int, records: int) -> dict[str, float]:
+	a = np.random.default_rng(1).random(records) + 1
+	b = np.random.default_rng(2).random(records) + 1
+	with WireClient(address) as client:
+		single = calls_per_second(lambda: client.calculate("add", 10, 5), calls)
+
+		started = time.perf_counter()
+		client.evaluate_many("add", a[:calls], b[:calls], frame_records=1, depth=64)
+		pipelined = calls / (time.perf_counter() - started)
+
+		started = time.perf_counter()
+		client.evaluate_many("add", a, b)
+		batched = records / (time.perf_counter() - started)
+	return {"one call at a time": single, "pipelined, 1 record/frame": pipelined, "batched, 4096 records/frame": batched}
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+	parser.add_argument("--calls", type=int, default=5000)
+	parser.add_argument("--records", type=int, default=1_000_000)
+	args = parser.parse_args()
+
+	results = {}
+	flask_command, flask_port = SERVERS["flask"]
+	with launch_server(flask_command, HOST, flask_port):
+		client = CalcClient(f"http://{HOST}:{flask_port}")
+		results["Flask JSON (dev server)"] = calls_per_second(lambda: client.calculate("add", 10, 5), args.calls)
+		client.close()
+
+	wire_command = [sys.executable, "day5/day5_wire_cals.py", "--port", str(WIRE_PORT)]
+	with launch_server(wire_command, HOST, WIRE_PORT):
+		for name, rate in measure_wire(f"{HOST}:{WIRE_PORT}", args.calls, args.records).items():
+			results[f"wire TCP, {name}"] = rate
+
+	with tempfile.TemporaryDirectory() as directory:
+		path = os.path.join(directory, "calc.sock")
+		command = [sys.executable, "day5/day5_wire_cals.py", "--unix", path]
+		with launch_server(command, HOST, None, ready=lambda: wait_for_socket(path)):
+			for name, rate in measure_wire(f"unix:{path}", args.calls, args.records).items():
+				results[f"wire Unix, {name}"] = rate
+
+	print(f"{'path':<48} {'ops/s':>12}")
+	for name, rate in results.items():
+		print(f"{name:<48} {rate:>12,.0f}")
+
+
+if __name__ == "__main__":
+	main()
@@ -4,6 +4,18 @@ import math
 from numbers import Real
 
 
+def is_real_number(value: object) -> bool:
+	"""Return True if value is a real number calc.py accepts (bool excluded).
+
+	Exact int and float are recognised by type identity; only other types
+	(Decimal, Fraction, NumPy scalars) pay for the numbers.Real ABC check.
+	"""
+	kind = type(value)
+	if kind is float or kind is int:
+		return True
+	return kind is not bool and isinstance(value, Real)
+
+
 def _validate_number(value: Real, name: str) -> None:
 	"""Validate that the provided value is a real number (int or float).
 
@@ -15,8 +27,17 @@ def _validate_number(value: Real, name: str) -> None:
 		TypeError: If value is not an int or float (excluding bool).
 		ValueError: If value is NaN or infinity.
 	"""
+	# Fast path for the common exact types; bool is a distinct type so never matches.
+	kind = type(value)
+	if kind is float:
+		if not math.isfinite(value):
+			raise ValueError(f"{name} must be a finite number.")
+		return
+	if kind is int:
+		return
+
 	# Reject booleans even though bool is a subclass of int.
-	if isinstance(value, bool) or not isinstance(value, Real):
+	if kind is bool or not isinstance(value, Real):
 		raise TypeError(f"{name} must be a real number (int or float).")
 
 	# Reject NaN and infinity to keep arithmetic safe and deterministic.
@@ -60,6 +81,41 @@ def division(a: Real, b: Real) -> float:
 	return float(a / b)
 
 
+def power(a: Real, b: Real) -> float:
+	"""Return a raised to the power b.
+
+	A result too large for a float is returned as a signed infinity, as
+	multiplication does, rather than raising OverflowError.
+
+	Raises:
+		ZeroDivisionError: If a is zero and b is negative.
+		ValueError: If a is negative and b is not a whole number.
+	"""
+	_validate_number(a, "a")
+	_validate_number(b, "b")
+
+	if a == 0 and b < 0:
+		raise ZeroDivisionError("Cannot raise zero to a negative power.")
+	if a < 0 and b != int(b):
+		raise ValueError("Cannot raise a negative number to a fractional power.")
+
+	return float_power(float(a), float(b))
+
+
+def float_power(a: float, b: float) -> float:
+	"""Return a ** b for floats without validation, as NumPy's power does.
+
+	Overflow gives a signed infinity instead of OverflowError, and non-finite
+	operands follow IEEE 754 (2 ** inf is inf). Callers must rule out zero to
+	a negative power and fractional powers of negative numbers first.
+	"""
+	try:
+		return a**b
+	except OverflowError:
+		# Only a negative base with an odd exponent overflows to -inf.
+		return -math.inf if a < 0 and b % 2 == 1 else math.inf
+
+
 def square_root(value: Real) -> float:
 	"""Return the square root of a non-negative number.
 
@@ -0,0 +1,242 @@
+"""Command-line bulk calculator over CSV or raw float64 files.
+
+Operand rows are read in fixed-size chunks (binary input is memory-mapped), so
+memory use depends on the chunk size and not on the file size. Every row is
+validated with the rules and messages of calc.py. Results are written in
+input order as each chunk completes. Rows that fail get an empty CSV cell or
+NaN in binary output, plus a line in the error report.
+
+Usage:
+	python day2/calc_bulk.py div operands.csv --skip-header -o results.csv --errors errors.csv
+	python day2/calc_bulk.py add operands.f64 --format binary -o results.f64
+
+Binary input is raw little-endian float64 with operands interleaved per row:
+a0 b0 a1 b1 ... for binary operations, or one value per row for sqrt.
+The exit status is 0 when every row succeeded, 1 when any row failed and 2
+for usage errors.
+"""
+
+import argparse
+import csv
+import os
+import sys
+import time
+from contextlib import ExitStack
+from itertools import islice
+
+import numpy as np
+
+
+DEFAULT_CHUNK_ROWS = 262_144
+OPERATIONS = {
+	"add": np.add,
+	"sub": np.subtract,
+	"mul": np.multiply,
+	"div": np.divide,
+	"sqrt": np.sqrt,
+}
+BINARY_DTYPE = np.dtype("<f8")
+
+
+def operand_names(operation: str) -> tuple[str, ...]:
+	return ("value",) if operation == "sqrt" else ("a", "b")
+
+
+def error_messages(operation: str) -> list[str]:
+	"""Return the row error messages; a row's error code indexes this list, 0 means success."""
+	messages = [""]
+	for name in operand_names(operation):
+		messages += [f"{name} must be a real number (int or float).", f"{name} must be a finite number."]
+	if operation == "div":
+		messages.append("Cannot divide by zero.")
+	elif operation == "sqrt":
+		messages.append("Cannot calculate square root of a negative number.")
+	return messages
+
+
+def evaluate_chunk(operation: str, operands: list[np.ndarray], unparsed: list[np.ndarray] | None = None):
+	"""Compute one chunk of rows and classify the rows that fail.
+
+	Args:
+		operation: One of OPERATIONS.
+		operands: float64 arrays of equal length, one per operand.
+		unparsed: Optional boolean masks of fields that were not numbers.
+
+	Returns:
+		(results, codes): results are NaN where codes is non-zero; codes index
+		error_messages(operation) and follow calc.py's check order.
+	"""
+	size = operands[0].size
+	codes = np.zeros(size, dtype=np.uint8)
+
+	def flag(mask: np.ndarray, code: int) -> None:
+		codes[mask & (codes == 0)] = code
+
+	for position, values in enumerate(operands):
+		type_code = 1 + 2 * position
+		if unparsed is not None:
+			flag(unparsed[position], type_code)
+		flag(~np.isfinite(values), type_code + 1)
+
+	domain_code = 1 + 2 * len(operands)
+	if operation == "div":
+		flag(operands[1] == 0, domain_code)
+	elif operation == "sqrt":
+		flag(operands[0] < 0, domain_code)
+
+	with np.errstate(all="ignore"):
+		results = OPERATIONS[operation](*operands)
+	results[codes != 0] = np.nan
+	return results, codes
+
+
+def _parse_column(rows: list[list[str]], column: int) -> tuple[np.ndarray, np.ndarray]:
+	try:
+		return np.array([row[column] for row in rows], dtype=np.float64), np.zeros(len(rows), dtype=bool)
+	except (ValueError, IndexError):
+		pass
+
+	# Some field is missing or not a number: parse row by row and mark the failures.
+	values = np.zeros(len(rows), dtype=np.float64)
+	unparsed = np.zeros(len(rows), dtype=bool)
+	for index, row in enumerate(rows):
+		try:
+			values[index] = float(row[column])
+		except (ValueError, IndexError):
+			unparsed[index] = True
+	return values, unparsed
+
+
+def read_csv_chunks(handle, columns: tuple[int, ...], chunk_rows: int, skip_header: bool = False):
+	"""Yield (operands, unparsed masks) for successive chunks of CSV rows."""
+	reader = csv.reader(handle)
+	if skip_header:
+		next(reader, None)
+	while True:
+		rows = list(islice(reader, chunk_rows))
+		if not rows:
+			return
+		parsed = [_parse_column(rows, column) for column in columns]
+		yield [values for values, _ in parsed], [unparsed for _, unparsed in parsed]
+
+
+def check_binary_input(path: str, width: int) -> None:
+	"""Raise ValueError unless path holds a whole number of width-value float64 rows."""
+	size = os.path.getsize(path)
+	if size % (width * BINARY_DTYPE.itemsize):
+		raise ValueError(f"{path} is {size} bytes, not a whole number of {width}-value float64 rows.")
+
+
+def read_binary_chunks(path: str, width: int, chunk_rows: int):
+	"""Yield (operands, None) for successive chunks of a memory-mapped float64 file."""
+	check_binary_input(path, width)
+	if os.path.getsize(path) == 0:
+		return
+
+	table = np.memmap(path, dtype=BINARY_DTYPE, mode="r").reshape(-1, width)
+	for start in range(0, len(table), chunk_rows):
+		block = np.asarray(table[start : start + chunk_rows], dtype=np.float64)
+		yield [block[:, column] for column in range(width)], None
+
+
+def write_csv_results(handle, results: np.ndarray, codes: np.ndarray) -> None:
+	lines = [repr(value) for value in results.tolist()]
+	for index in np.flatnonzero(codes):
+		lines[index] = ""
+	handle.write("\n".join(lines) + "\n")
+
+
+def write_binary_results(handle, results: np.ndarray) -> None:
+	handle.write(results.astype(BINARY_DTYPE, copy=False).tobytes())
+
+
+def write_error_report(handle, codes: np.ndarray, start: int, messages: list[str]) -> int:
+	failed = np.flatnonzero(codes)
+	if failed.size:
+		handle.write("".join(f"{start + index},{messages[code]}\n" for index, code in zip(failed.tolist(), codes[failed].tolist())))
+	return int(failed.size)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+	parser = argparse.ArgumentParser(description="Run a calculator operation over every row of a file.")
+	parser.add_argument("operation", choices=OPERATIONS)
+	parser.add_argument("input", help="CSV file (or - for stdin) or raw little-endian float64 file.")
+	parser.add_argument("--format", choices=("csv", "binary"), default="csv")
+	parser.add_argument("-o", "--output", default="-", help="Results file (default: stdout).")
+	parser.add_argument("--errors", default="-", help="Error report as row,message CSV (default: stderr).")
+	parser.add_argument("--columns", default=None, help="Comma-separated CSV operand column indices (default: 0,1).")
+	parser.add_argument("--skip-header", action="store_true", help="Ignore the first CSV line.")
+	parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+	args = parser.parse_args(argv)
+
+	width = len(operand_names(args.operation))
+	if args.columns is None:
+		args.columns = tuple(range(width))
+	else:
+		try:
+			args.columns = tuple(int(column) for column in args.columns.split(","))
+		except ValueError:
+			parser.error("--columns must be comma-separated integers.")
+		if len(args.columns) != width or min(args.columns) < 0:
+			parser.error(f"{args.operation} needs {width} non-negative column indices.")
+	if args.chunk_rows <= 0:
+		parser.error("--chunk-rows must be positive.")
+	if args.format == "binary" and args.input == "-":
+		parser.error("binary input must be a file so it can be memory-mapped.")
+	return args
+
+
+def _open(path: str, mode: str, standard):
+	if path == "-":
+		return open(standard.fileno(), mode, closefd=False)
+	return open(path, mode, **({} if "b" in mode else {"newline": ""}))
+
+
+def main(argv=None) -> int:
+	args = parse_args(argv)
+	messages = error_messages(args.operation)
+	binary = args.format == "binary"
+
+	if binary:
+		try:
+			check_binary_input(args.input, len(args.columns))
+		except (OSError, ValueError) as error:
+			print(f"error: {error}", file=sys.stderr)
+			return 2
+
+	started = time.perf_counter()
+	rows = 0
+	failures = 0
+	with ExitStack() as files:
+		# The input is opened first, so a missing file leaves no empty output behind.
+		try:
+			if not binary:
+				source = files.enter_context(_open(args.input, "r", sys.stdin))
+			output = files.enter_context(_open(args.output, "wb" if binary else "w", sys.stdout))
+			errors = files.enter_context(_open(args.errors, "w", sys.stderr))
+		except OSError as error:
+			print(f"error: {error}", file=sys.stderr)
+			return 2
+
+		if binary:
+			chunks = read_binary_chunks(args.input, len(args.columns), args.chunk_rows)
+		else:
+			chunks = read_csv_chunks(source, args.columns, args.chunk_rows, args.skip_header)
+
+		for operands, unparsed in chunks:
+			results, codes = evaluate_chunk(args.operation, operands, unparsed)
+			if binary:
+				write_binary_results(output, results)
+			else:
+				write_csv_results(output, results, codes)
+			failures += write_error_report(errors, codes, rows, messages)
+			rows += results.size
+
+	elapsed = time.perf_counter() - started
+	rate = rows / elapsed if elapsed > 0 else 0.0
+	print(f"Processed {rows} rows ({failures} failed) in {elapsed:.3f} s: {rate:,.0f} rows/s", file=sys.stderr)
+	return 1 if failures else 0
+
+
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,149 @@
+"""Arithmetic expression engine built on the validated calculator functions.
+
+Expressions support +, -, *, /, unary minus/plus, parentheses and sqrt(...)
+with the usual precedence. Each distinct expression text is compiled once into
+a compact postfix program and kept in a bounded LRU cache, so evaluating a
+repeated expression skips tokenizing and parsing entirely.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+from calc import addition, division, multiplication, square_root, subtraction
+
+
+EXPRESSION_CACHE_SIZE = 1024
+MAX_EXPRESSION_LENGTH = 1000
+
+_TOKEN = re.compile(
+	r"\s*(?:"
+	r"(?P<number>(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?)"
+	r"|(?P<function>sqrt)"
+	r"|(?P<symbol>[-+*/()])"
+	r")"
+)
+
+
+def _negate(value: float) -> float:
+	return multiplication(value, -1)
+
+
+# Binary operators map to (precedence, calculator function).
+_BINARY_OPERATORS = {
+	"+": (1, addition),
+	"-": (1, subtraction),
+	"*": (2, multiplication),
+	"/": (2, division),
+}
+_UNARY_PRECEDENCE = 3
+
+
+def _tokenize(text: str):
+	position = 0
+	end = len(text.rstrip())
+	while position < end:
+		match = _TOKEN.match(text, position)
+		if match is None or match.end() == position:
+			raise ValueError(f"Invalid expression: unexpected character at position {position}.")
+		position = match.end()
+		yield match.lastgroup, match.group(match.lastgroup)
+
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def compile_expression(text: str) -> tuple:
+	"""Compile an expression into a postfix program.
+
+	The program is a tuple of (function, operand) pairs: constants are
+	(None, value), unary operations (function, 1) and binary operations
+	(function, 2). Results are cached by expression text.
+
+	Raises:
+		ValueError: If the expression is empty, too long or malformed.
+	"""
+	if len(text) > MAX_EXPRESSION_LENGTH:
+		raise ValueError(f"Invalid expression: longer than {MAX_EXPRESSION_LENGTH} characters.")
+
+	program = []
+	# Pending operators as (precedence, function, arity); "(" markers are (0, None, 0).
+	pending = []
+	expect_operand = True
+	expect_call = False
+
+	for kind, token in _tokenize(text):
+		if expect_call and token != "(":
+			raise ValueError("Invalid expression: sqrt must be followed by '('.")
+		expect_call = False
+
+		if expect_operand:
+			if kind == "number":
+				value = float(token)
+				if not math.isfinite(value):
+					raise ValueError(f"Invalid expression: number '{token}' is out of range.")
+				program.append((None, value))
+				expect_operand = False
+			elif kind == "function":
+				pending.append((_UNARY_PRECEDENCE, square_root, 1))
+				expect_call = True
+			elif token == "(":
+				pending.append((0, None, 0))
+			elif token == "-":
+				pending.append((_UNARY_PRECEDENCE, _negate, 1))
+			elif token != "+":
+				raise ValueError(f"Invalid expression: expected a number before '{token}'.")
+		elif kind == "symbol" and token in _BINARY_OPERATORS:
+			precedence, function = _BINARY_OPERATORS[token]
+			while pending and pending[-1][0] >= precedence:
+				_, pending_function, arity = pending.pop()
+				program.append((pending_function, arity))
+			pending.append((precedence, function, 2))
+			expect_operand = True
+		elif token == ")":
+			while pending and pending[-1][1] is not None:
+				_, pending_function, arity = pending.pop()
+				program.append((pending_function, arity))
+			if not pending:
+				raise ValueError("Invalid expression: unbalanced parentheses.")
+			pending.pop()
+		else:
+			raise ValueError(f"Invalid expression: expected an operator before '{token}'.")
+
+	if expect_operand:
+		raise ValueError("Invalid expression: incomplete expression.")
+
+	while pending:
+		_, function, arity = pending.pop()
+		if function is None:
+			raise ValueError("Invalid expression: unbalanced parentheses.")
+		program.append((function, arity))
+
+	return tuple(program)
+
+
+def evaluate_compiled(program: tuple) -> float:
+	"""Evaluate a program produced by compile_expression.
+
+	Raises:
+		ZeroDivisionError: If the expression divides by zero.
+		ValueError: If an intermediate or the final result is not finite, or
+			a square root argument is negative.
+	"""
+	stack = []
+	for function, operand in program:
+		if function is None:
+			stack.append(operand)
+		elif operand == 1:
+			stack.append(function(stack.pop()))
+		else:
+			right = stack.pop()
+			stack[-1] = function(stack[-1], right)
+
+	# The calculator functions validate their inputs, so only the last result can still overflow.
+	if not math.isfinite(stack[0]):
+		raise ValueError("Expression result is not a finite number.")
+	return stack[0]
+
+
+def evaluate(text: str) -> float:
+	"""Compile (or fetch from cache) and evaluate an expression."""
+	return evaluate_compiled(compile_expression(text))
@@ -0,0 +1,273 @@
+"""Selectable numeric backends for the calculator operations.
+
+calc.py is the float backend and stays the fast default. This module adds
+two exact backends for callers who cannot accept binary rounding or float
+overflow (1e308 + 1e308 is inf as a float, 2E+308 as a Decimal):
+
+	float     calc.py unchanged: results are Python floats.
+	decimal   decimal.Decimal arithmetic under a decimal.Context, so
+	          precision, rounding and exponent range are configurable.
+	fraction  fractions.Fraction arithmetic with no rounding at all.
+
+The exact backends accept int, float, Decimal, Fraction and numeric strings
+such as "0.1", "1e400" or (fraction mode) "1/3". Floats are converted from
+their shortest repr, so 0.1 means one tenth rather than the nearest binary
+double. Validation follows calc.py: booleans and non-numbers raise TypeError,
+NaN and infinity raise ValueError, division by zero and zero to a negative
+power raise ZeroDivisionError, and negative square roots and fractional
+powers of negative numbers raise ValueError. Fraction mode only takes whole
+exponents, since other powers are rarely rational.
+"""
+
+import decimal
+import math
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Integral, Real
+
+from calc import addition, division, multiplication, power, square_root, subtraction
+
+
+MODES = ("float", "decimal", "fraction")
+OPERATIONS = ("add", "sub", "mul", "div", "pow", "sqrt")
+
+# Same precision and traps as Python's default context, but a private copy so
+# results never depend on whatever the calling thread did to getcontext().
+DEFAULT_CONTEXT = decimal.Context(
+	prec=28,
+	traps=[decimal.InvalidOperation, decimal.DivisionByZero, decimal.Overflow],
+)
+
+# Bounds that keep fraction mode from building enormous integers: strings are
+# limited in length, decimal exponents in size, and numerators/denominators in
+# bits, so one operation's result always stays printable.
+MAX_OPERAND_LENGTH = 1000
+MAX_FRACTION_EXPONENT = 1000
+MAX_FRACTION_BITS = 4096
+
+DECIMAL_METHODS = {"add": "add", "sub": "subtract", "mul": "multiply", "div": "divide", "pow": "power"}
+FLOAT_FUNCTIONS = {
+	"add": addition,
+	"sub": subtraction,
+	"mul": multiplication,
+	"div": division,
+	"pow": power,
+	"sqrt": lambda a, b: square_root(a),
+}
+
+
+def make_context(precision: int = 28) -> decimal.Context:
+	"""Return a decimal context like DEFAULT_CONTEXT with the given precision."""
+	if precision < 1:
+		raise ValueError("precision must be at least 1.")
+	context = DEFAULT_CONTEXT.copy()
+	context.prec = precision
+	return context
+
+
+def _check_type(value, name: str) -> None:
+	if isinstance(value, bool) or not isinstance(value, (Real, Decimal, str)):
+		raise TypeError(f"{name} must be a number (int, float, Decimal, Fraction or numeric string).")
+
+
+def _parse_decimal(text: str, name: str) -> Decimal:
+	if len(text) > MAX_OPERAND_LENGTH:
+		raise ValueError(f"{name} is longer than {MAX_OPERAND_LENGTH} characters.")
+	try:
+		return Decimal(text)
+	except decimal.InvalidOperation:
+		raise ValueError(f"{name} is not a valid number.") from None
+
+
+def _finite_decimal(value: Decimal, name: str) -> Decimal:
+	if not value.is_finite():
+		raise ValueError(f"{name} must be a finite number.")
+	return value
+
+
+def to_decimal(value, name: str = "value", context: decimal.Context = DEFAULT_CONTEXT) -> Decimal:
+	"""Convert an operand to a finite Decimal.
+
+	Conversion is exact except for fractions such as 1/3, which are rounded
+	by context.
+
+	Raises:
+		TypeError: If value is a bool or not a number or string.
+		ValueError: If value is NaN, infinite, too long or not a valid number.
+	"""
+	# Exact int, float and str are by far the most common operands.
+	kind = type(value)
+	if kind is int:
+		return Decimal(value)
+	if kind is not float and kind is not str:
+		_check_type(value, name)
+	if isinstance(value, Decimal):
+		return _finite_decimal(value, name)
+	if isinstance(value, str):
+		return _finite_decimal(_parse_decimal(value, name), name)
+	if isinstance(value, Integral):
+		return Decimal(int(value))
+	if isinstance(value, Fraction):
+		return context.divide(Decimal(value.numerator), Decimal(value.denominator))
+
+	value = float(value)
+	if not math.isfinite(value):
+		raise ValueError(f"{name} must be a finite number.")
+	return Decimal(repr(value))
+
+
+def _general_fraction(value, name: str) -> Fraction:
+	_check_type(value, name)
+	if isinstance(value, Fraction):
+		return value
+	if isinstance(value, Integral):
+		return Fraction(int(value))
+	if isinstance(value, str) and "/" in value:
+		if len(value) > MAX_OPERAND_LENGTH:
+			raise ValueError(f"{name} is longer than {MAX_OPERAND_LENGTH} characters.")
+		try:
+			return Fraction(value)
+		except (ValueError, ZeroDivisionError):
+			raise ValueError(f"{name} is not a valid number.") from None
+
+	# Decimals carry their exponent, so huge ones are refused before the
+	# integer 10**exponent is ever built.
+	exact = to_decimal(value, name)
+	if abs(exact.adjusted()) > MAX_FRACTION_EXPONENT:
+		raise ValueError(f"{name} is too large for fraction mode.")
+	return Fraction(exact)
+
+
+def to_fraction(value, name: str = "value") -> Fraction:
+	"""Convert an operand to an exact Fraction.
+
+	Raises:
+		TypeError: If value is a bool or not a number or string.
+		ValueError: If value is NaN, infinite, too large or not a valid number.
+	"""
+	kind = type(value)
+	if kind is int:
+		result = Fraction(value)
+	elif kind is float:
+		# Float exponents are far inside MAX_FRACTION_EXPONENT.
+		result = Fraction(to_decimal(value, name))
+	else:
+		result = _general_fraction(value, name)
+
+	if max(result.numerator.bit_length(), result.denominator.bit_length()) > MAX_FRACTION_BITS:
+		raise ValueError(f"{name} is too large for fraction mode.")
+	return result
+
+
+def _check_power(a, b) -> None:
+	if a == 0 and b < 0:
+		raise ZeroDivisionError("Cannot raise zero to a negative power.")
+	# Converting b to int would build every digit of a huge exponent such as 1e999999999.
+	whole = b.denominator == 1 if isinstance(b, Fraction) else b == b.to_integral_value()
+	if a < 0 and not whole:
+		raise ValueError("Cannot raise a negative number to a fractional power.")
+
+
+def _decimal_calculate(operation: str, a, b, context: decimal.Context) -> Decimal:
+	a = to_decimal(a, "value" if operation == "sqrt" else "a", context)
+	if operation == "sqrt":
+		if a < 0:
+			raise ValueError("Cannot calculate square root of a negative number.")
+		function = context.sqrt
+		args = (a,)
+	else:
+		b = to_decimal(b, "b", context)
+		if operation == "div" and b == 0:
+			raise ZeroDivisionError("Cannot divide by zero.")
+		if operation == "pow":
+			_check_power(a, b)
+			if b == 0:
+				# Decimal leaves 0 ** 0 undefined; calc.power returns 1.
+				return Decimal(1)
+		function = getattr(context, DECIMAL_METHODS[operation])
+		args = (a, b)
+
+	try:
+		return function(*args)
+	except decimal.Overflow:
+		raise ValueError("Result is outside the decimal context's exponent range.") from None
+
+
+def _fraction_sqrt(value: Fraction) -> Fraction:
+	numerator = math.isqrt(value.numerator)
+	denominator = math.isqrt(value.denominator)
+	if numerator * numerator != value.numerator or denominator * denominator != value.denominator:
+		raise ValueError("Square root is not a rational number; use decimal mode.")
+	return Fraction(numerator, denominator)
+
+
+def _fraction_power(a: Fraction, b: Fraction) -> Fraction:
+	_check_power(a, b)
+	if b.denominator != 1:
+		raise ValueError("Fractional exponents are not supported in fraction mode; use decimal mode.")
+	# The result needs about |b| times the operand's bits; refuse it before building it.
+	bits = max(a.numerator.bit_length(), a.denominator.bit_length())
+	if abs(a.numerator) > 1 or a.denominator > 1:
+		if abs(b.numerator) * bits > MAX_FRACTION_BITS:
+			raise ValueError("Result is too large for fraction mode.")
+	return a**b.numerator
+
+
+def _fraction_calculate(operation: str, a, b) -> Fraction:
+	a = to_fraction(a, "value" if operation == "sqrt" else "a")
+	if operation == "sqrt":
+		if a < 0:
+			raise ValueError("Cannot calculate square root of a negative number.")
+		return _fraction_sqrt(a)
+
+	b = to_fraction(b, "b")
+	if operation == "add":
+		return a + b
+	if operation == "sub":
+		return a - b
+	if operation == "mul":
+		return a * b
+	if operation == "pow":
+		return _fraction_power(a, b)
+	if b == 0:
+		raise ZeroDivisionError("Cannot divide by zero.")
+	return a / b
+
+
+def calculate(operation: str, a, b=None, mode: str = "float", context: decimal.Context | None = None):
+	"""Evaluate one operation with the selected numeric backend.
+
+	Args:
+		operation: One of add, sub, mul, div, pow or sqrt (which ignores b).
+		a: First operand (the radicand for sqrt).
+		b: Second operand.
+		mode: float, decimal or fraction.
+		context: Decimal context for decimal mode (DEFAULT_CONTEXT if None).
+
+	Returns:
+		A float, Decimal or Fraction depending on mode.
+
+	Raises:
+		TypeError: If an operand has an unsupported type.
+		ValueError: If the operation or mode is unknown, an operand is invalid,
+			a square root input is negative (or, in fraction mode, has no
+			rational root), a negative number is raised to a fractional power,
+			a fraction-mode exponent is not whole or a result is too large.
+		ZeroDivisionError: If dividing by zero or raising zero to a negative power.
+	"""
+	if operation not in OPERATIONS:
+		raise ValueError(f"operation must be one of: {', '.join(OPERATIONS)}.")
+	if mode == "float":
+		return FLOAT_FUNCTIONS[operation](a, b)
+	if mode == "decimal":
+		return _decimal_calculate(operation, a, b, DEFAULT_CONTEXT if context is None else context)
+	if mode == "fraction":
+		return _fraction_calculate(operation, a, b)
+	raise ValueError(f"mode must be one of: {', '.join(MODES)}.")
+
+
+def format_number(value) -> str:
+	"""Return the text form of a result: Decimal as a decimal string, Fraction as p/q."""
+	if isinstance(value, (Decimal, Fraction)):
+		return str(value)
+	return repr(float(value))
@@ -0,0 +1,199 @@
+"""Process-pool execution of large vectorized calculator jobs.
+
+Operands are copied once into shared memory as float64 and every worker
+validates and computes a contiguous shard in place, so no array data is
+pickled between processes. Results come back in input order and errors match
+the single-process calc_vector functions, including the failing indices.
+Jobs smaller than the threshold run in-process to avoid pool start-up and
+IPC costs.
+"""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from calc_vector import (
+	BatchError,
+	BatchValueError,
+	BatchZeroDivisionError,
+	validate_array,
+	vector_addition,
+	vector_division,
+	vector_multiplication,
+	vector_square_root,
+	vector_subtraction,
+)
+
+
+PARALLEL_THRESHOLD = 1_000_000
+SHARDS_PER_WORKER = 2
+
+SERIAL_OPERATIONS = {
+	"add": vector_addition,
+	"sub": vector_subtraction,
+	"mul": vector_multiplication,
+	"div": vector_division,
+	"sqrt": vector_square_root,
+}
+KERNELS = {
+	"add": np.add,
+	"sub": np.subtract,
+	"mul": np.multiply,
+	"div": np.divide,
+	"sqrt": np.sqrt,
+}
+
+_executor: ProcessPoolExecutor | None = None
+_executor_workers = 0
+_executor_lock = threading.Lock()
+
+
+def default_workers() -> int:
+	return os.cpu_count() or 1
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+	"""Return a long-lived pool with `workers` processes, replacing a different-sized one."""
+	global _executor, _executor_workers
+	with _executor_lock:
+		if _executor is None or _executor_workers != workers:
+			if _executor is not None:
+				_executor.shutdown()
+			# Spawned workers are safe to start from threaded servers, unlike fork.
+			context = multiprocessing.get_context("spawn")
+			_executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+			_executor_workers = workers
+		return _executor
+
+
+def shutdown_executor() -> None:
+	global _executor
+	with _executor_lock:
+		if _executor is not None:
+			_executor.shutdown()
+			_executor = None
+
+
+def _compute_shard(operation: str, blocks: list[SharedMemory], length: int, start: int, stop: int):
+	*operands, out = (np.ndarray((length,), dtype=np.float64, buffer=block.buf)[start:stop] for block in blocks)
+	argument_names = ("a", "b") if len(operands) == 2 else ("value",)
+
+	for priority, (values, name) in enumerate(zip(operands, argument_names)):
+		try:
+			validate_array(values, name)
+		except BatchError as error:
+			return priority, type(error), error.message, error.indices + start
+
+	if operation == "div":
+		zero = np.flatnonzero(operands[1] == 0)
+		if zero.size:
+			return 2, BatchZeroDivisionError, "Cannot divide by zero.", zero + start
+	elif operation == "sqrt":
+		negative = np.flatnonzero(operands[0] < 0)
+		if negative.size:
+			return 2, BatchValueError, "Cannot calculate square root of a negative number.", negative + start
+
+	with np.errstate(over="ignore", under="ignore"):
+		KERNELS[operation](*operands, out=out)
+	return None
+
+
+def _run_shard(operation: str, names: tuple[str, ...], length: int, start: int, stop: int):
+	"""Validate and compute operands[start:stop] into the shared output buffer.
+
+	Returns None on success or (priority, error class, message, indices) where
+	priority orders failures like calc_vector: a, then b, then the domain check.
+	"""
+	blocks = [SharedMemory(name=name) for name in names]
+	try:
+		# Views into the blocks must be released before they can be closed.
+		return _compute_shard(operation, blocks, length, start, stop)
+	finally:
+		for block in blocks:
+			block.close()
+
+
+def _dispatch(operation: str, blocks: list[SharedMemory], operands: list[np.ndarray], workers: int) -> np.ndarray:
+	length = operands[0].size
+	views = [np.ndarray((length,), dtype=np.float64, buffer=block.buf) for block in blocks]
+	for view, operand in zip(views, operands):
+		np.copyto(view, operand.reshape(-1))
+
+	bounds = np.linspace(0, length, workers * SHARDS_PER_WORKER + 1, dtype=np.int64)
+	names = tuple(block.name for block in blocks)
+	executor = get_executor(workers)
+	futures = [
+		executor.submit(_run_shard, operation, names, length, int(start), int(stop))
+		for start, stop in zip(bounds[:-1], bounds[1:])
+		if stop > start
+	]
+	failures = [failure for failure in (future.result() for future in futures) if failure is not None]
+
+	if failures:
+		# Report the same error the serial function would raise, with indices from every shard.
+		priority = min(failure[0] for failure in failures)
+		matching = [failure for failure in failures if failure[0] == priority]
+		_, error_class, message, _ = matching[0]
+		raise error_class(message, np.concatenate([failure[3] for failure in matching]))
+
+	return views[-1].reshape(operands[0].shape).copy()
+
+
+def _parallel_compute(operation: str, operands: list[np.ndarray], workers: int) -> np.ndarray:
+	size = max(1, operands[0].size * np.dtype(np.float64).itemsize)
+	blocks = [SharedMemory(create=True, size=size) for _ in range(len(operands) + 1)]
+	try:
+		return _dispatch(operation, blocks, operands, workers)
+	finally:
+		for block in blocks:
+			block.close()
+			block.unlink()
+
+
+def parallel_compute(
+	operation: str,
+	a,
+	b=None,
+	workers: int | None = None,
+	threshold: int = PARALLEL_THRESHOLD,
+) -> np.ndarray:
+	"""Evaluate a vectorized operation, sharding large inputs across processes.
+
+	Args:
+		operation: One of "add", "sub", "mul", "div" or "sqrt" (unary, b is unused).
+		a: First operand array (or the sqrt input).
+		b: Second operand array for binary operations.
+		workers: Process count; defaults to the number of CPUs.
+		threshold: Inputs with fewer elements run in-process.
+
+	Raises:
+		ValueError: If the operation is unknown or b is missing for a binary operation.
+		BatchTypeError, BatchValueError, BatchZeroDivisionError: As the matching
+			calc_vector function would.
+	"""
+	if operation not in SERIAL_OPERATIONS:
+		raise ValueError(f"operation must be one of: {', '.join(SERIAL_OPERATIONS)}.")
+
+	unary = operation == "sqrt"
+	if not unary and b is None:
+		raise ValueError(f"{operation} needs two operands.")
+
+	operands = [np.asarray(a)] if unary else [np.asarray(a), np.asarray(b)]
+	workers = workers or default_workers()
+
+	# Object/bool/complex dtypes and broadcasting take the serial path, which
+	# reports those errors and index positions exactly.
+	parallel = (
+		workers > 1
+		and operands[0].size >= threshold
+		and all(operand.dtype.kind in "iuf" for operand in operands)
+		and all(operand.shape == operands[0].shape for operand in operands)
+	)
+	if not parallel:
+		return SERIAL_OPERATIONS[operation](*operands)
+
+	return _parallel_compute(operation, operands, workers)
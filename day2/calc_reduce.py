@@ -0,0 +1,182 @@
+"""Chunked sum, product and mean reductions with selectable accuracy.
+
+Values may be a NumPy array, a buffer or any iterable of real numbers; they are
+processed in fixed-size chunks, so iterables never have to be materialized
+in full. Each chunk is validated in bulk with the same rules and error types
+as calc_vector, and failing indices are reported relative to the whole input.
+
+Modes trade speed for accuracy:
+	fast         NumPy pairwise sum inside each chunk, plain float addition
+	             across chunks.
+	pairwise     NumPy pairwise sum inside each chunk, Neumaier-compensated
+	             accumulation across chunks (default).
+	compensated  Correctly rounded math.fsum for each chunk, Neumaier-
+	             compensated accumulation across chunks.
+
+Products use np.prod per chunk in fast mode and a pairwise product tree
+otherwise, which bounds relative error growth by log2(n) instead of n.
+"""
+
+import math
+from array import array
+from itertools import islice
+
+import numpy as np
+
+from calc_vector import BatchError, validate_array
+
+
+DEFAULT_CHUNK_SIZE = 65_536
+MODES = ("fast", "pairwise", "compensated")
+OVERFLOW_ERROR = "Intermediate result overflowed; the reduction is undefined."
+
+
+def _check_options(mode: str, chunk_size: int) -> None:
+	if mode not in MODES:
+		raise ValueError(f"mode must be one of: {', '.join(MODES)}.")
+	if chunk_size <= 0:
+		raise ValueError("chunk_size must be positive.")
+
+
+def _iter_chunks(values, chunk_size: int):
+	"""Yield (start index, chunk) pairs without copying array input."""
+	if isinstance(values, (np.ndarray, memoryview, array)):
+		flat = np.asarray(values).reshape(-1)
+		for start in range(0, flat.size, chunk_size):
+			yield start, flat[start : start + chunk_size]
+		return
+
+	iterator = iter(values)
+	start = 0
+	while True:
+		chunk = list(islice(iterator, chunk_size))
+		if not chunk:
+			return
+		yield start, chunk
+		start += len(chunk)
+
+
+def _as_flat_array(chunk) -> np.ndarray:
+	if isinstance(chunk, np.ndarray):
+		return chunk
+
+	try:
+		converted = np.asarray(chunk)
+	except ValueError:
+		converted = None
+	if converted is not None and converted.ndim == 1 and converted.dtype.kind in "iuf":
+		return converted
+
+	# Mixed, nested or non-numeric items: keep one object per element so each is
+	# checked on its own and the failing indices are exact.
+	objects = np.empty(len(chunk), dtype=object)
+	for index, value in enumerate(chunk):
+		objects[index] = value
+	return objects
+
+
+def _validated_chunks(values, chunk_size: int):
+	for start, chunk in _iter_chunks(values, chunk_size):
+		try:
+			yield validate_array(_as_flat_array(chunk), "values")
+		except BatchError as error:
+			raise type(error)(error.message, error.indices + start) from None
+
+
+def _neumaier_add(total: float, compensation: float, value: float) -> tuple[float, float]:
+	result = total + value
+	if abs(total) >= abs(value):
+		compensation += (total - result) + value
+	else:
+		compensation += (value - result) + total
+	return result, compensation
+
+
+def _chunk_sum(chunk: np.ndarray, mode: str) -> float:
+	if mode == "compensated":
+		try:
+			return math.fsum(chunk.tolist())
+		except OverflowError:
+			pass
+
+	with np.errstate(over="ignore", invalid="ignore"):
+		return float(np.sum(chunk))
+
+
+def _pairwise_product(chunk: np.ndarray) -> float:
+	with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+		while chunk.size > 1:
+			half = chunk.size // 2
+			product = chunk[:half] * chunk[half : 2 * half]
+			if chunk.size % 2:
+				product = np.append(product, chunk[-1])
+			chunk = product
+	return float(chunk[0]) if chunk.size else 1.0
+
+
+def _sum_and_count(values, mode: str, chunk_size: int) -> tuple[float, int]:
+	_check_options(mode, chunk_size)
+	total = 0.0
+	compensation = 0.0
+	count = 0
+
+	for chunk in _validated_chunks(values, chunk_size):
+		partial = _chunk_sum(chunk, mode)
+		count += chunk.size
+		if mode == "fast":
+			total += partial
+		else:
+			total, compensation = _neumaier_add(total, compensation, partial)
+
+	# Once the running total overflows the compensation term is meaningless.
+	if math.isnan(total):
+		raise ValueError(OVERFLOW_ERROR)
+	if math.isinf(total):
+		return total, count
+	return total + compensation, count
+
+
+def reduce_sum(values, mode: str = "pairwise", chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+	"""Return the sum of values; an empty input sums to 0.0.
+
+	Raises:
+		TypeError: If any value is not an int or float.
+		ValueError: If any value is NaN or infinity, or mode/chunk_size is invalid.
+	"""
+	return _sum_and_count(values, mode, chunk_size)[0]
+
+
+def reduce_product(values, mode: str = "pairwise", chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+	"""Return the product of values; an empty input multiplies to 1.0.
+
+	Raises:
+		TypeError: If any value is not an int or float.
+		ValueError: If any value is NaN or infinity, or mode/chunk_size is invalid.
+	"""
+	_check_options(mode, chunk_size)
+	result = 1.0
+	for chunk in _validated_chunks(values, chunk_size):
+		if mode == "fast":
+			with np.errstate(over="ignore", under="ignore", invalid="ignore"):
+				partial = float(np.prod(chunk))
+		else:
+			partial = _pairwise_product(chunk)
+		result *= partial
+
+	if math.isnan(result):
+		raise ValueError(OVERFLOW_ERROR)
+	return result
+
+
+def reduce_mean(values, mode: str = "pairwise", chunk_size: int = DEFAULT_CHUNK_SIZE) -> float:
+	"""Return the arithmetic mean of values.
+
+	Raises:
+		TypeError: If any value is not an int or float.
+		ValueError: If values is empty or any value is NaN or infinity, or
+			mode/chunk_size is invalid.
+	"""
+	total, count = _sum_and_count(values, mode, chunk_size)
+	if count == 0:
+		raise ValueError("Cannot calculate the mean of an empty sequence.")
+	return total / count
@@ -0,0 +1,119 @@
+"""One registry of binary calculator operations for the library, API and UI.
+
+Each operation is registered once with everything the other layers need:
+
+	name      API route (POST /<name>) and the "op" of batch items.
+	symbol    Operator in UI expressions such as "8/2".
+	label     Keypad button label.
+	function  Validated calc.py function, for library and in-process callers.
+	scalar    Kernel for operands that are already checked floats.
+	vector    NumPy ufunc name, for micro-batched evaluation.
+	check     Domain rule run before either kernel: returns the API error
+	          message for operands the operation rejects, or None.
+	errors    Every message check can return.
+
+register() fills the lookup tables below once, at import time. Callers
+dispatch through them with one dict lookup per request, and routes, the
+unknown-operation message and the keypad are generated from them, so a new
+operation is one register() call here and costs existing ones nothing.
+"""
+
+import operator
+from collections.abc import Callable
+
+from calc import addition, division, float_power, multiplication, power, subtraction
+
+
+DIVISION_BY_ZERO_ERROR = "Division by zero is not allowed."
+# The same messages calc.power and calc_numeric raise, so every mode reports them alike.
+ZERO_TO_NEGATIVE_POWER_ERROR = "Cannot raise zero to a negative power."
+FRACTIONAL_POWER_ERROR = "Cannot raise a negative number to a fractional power."
+
+Kernel = Callable[[float, float], float]
+DomainCheck = Callable[[float, float], str | None]
+
+
+class Operation:
+	"""A registered binary operation; see the module docstring for the fields."""
+
+	__slots__ = ("name", "symbol", "label", "function", "scalar", "vector", "check", "errors")
+
+	def __init__(
+		self,
+		name: str,
+		symbol: str,
+		label: str,
+		function: Kernel,
+		scalar: Kernel,
+		vector: str,
+		check: DomainCheck | None = None,
+		errors: tuple[str, ...] = (),
+	) -> None:
+		self.name = name
+		self.symbol = symbol
+		self.label = label
+		self.function = function
+		self.scalar = scalar
+		self.vector = vector
+		self.check = check
+		self.errors = errors
+
+
+# Registration order is the order routes and keys are listed in.
+REGISTRY: dict[str, Operation] = {}
+SCALAR_KERNELS: dict[str, Kernel] = {}
+VECTOR_KERNELS: dict[str, str] = {}
+# Only operations with a domain rule appear here, so the others skip the check.
+DOMAIN_CHECKS: dict[str, DomainCheck] = {}
+DOMAIN_ERRORS: list[str] = []
+SYMBOLS: dict[str, str] = {}
+
+
+def register(operation: Operation) -> Operation:
+	"""Add an operation to the registry and its lookup tables."""
+	if operation.name in REGISTRY:
+		raise ValueError(f"Operation {operation.name!r} is already registered.")
+	if operation.symbol in SYMBOLS:
+		raise ValueError(f"Symbol {operation.symbol!r} is already registered.")
+
+	REGISTRY[operation.name] = operation
+	SCALAR_KERNELS[operation.name] = operation.scalar
+	VECTOR_KERNELS[operation.name] = operation.vector
+	SYMBOLS[operation.symbol] = operation.name
+	if operation.check is not None:
+		DOMAIN_CHECKS[operation.name] = operation.check
+	DOMAIN_ERRORS.extend(error for error in operation.errors if error not in DOMAIN_ERRORS)
+	return operation
+
+
+def check_divisor(a: float, b: float) -> str | None:
+	return DIVISION_BY_ZERO_ERROR if b == 0 else None
+
+
+def check_power(a: float, b: float) -> str | None:
+	if a == 0 and b < 0:
+		return ZERO_TO_NEGATIVE_POWER_ERROR
+	# NaN % 1 is NaN, so non-finite exponents fall through to float_power like the other kernels.
+	if a < 0 and b % 1 > 0:
+		return FRACTIONAL_POWER_ERROR
+	return None
+
+
+register(Operation("add", "+", "＋", addition, operator.add, "add"))
+register(Operation("sub", "-", "−", subtraction, operator.sub, "subtract"))
+register(Operation("mul", "*", "×", multiplication, operator.mul, "multiply"))
+register(Operation("div", "/", "÷", division, operator.truediv, "divide", check_divisor, (DIVISION_BY_ZERO_ERROR,)))
+# float ** raises OverflowError where NumPy returns inf, so the scalar kernel
+# is calc.float_power, which returns inf too; check_power has already run.
+register(
+	Operation(
+		"pow",
+		"^",
+		"xʸ",
+		power,
+		float_power,
+		"power",
+		check_power,
+		(ZERO_TO_NEGATIVE_POWER_ERROR, FRACTIONAL_POWER_ERROR),
+	)
+)
@@ -0,0 +1,152 @@
+"""Vectorized calculator operations over NumPy arrays with bulk input validation.
+
+Each function mirrors its scalar counterpart in calc.py, but validates and
+computes a whole array in a handful of NumPy passes instead of one Python call
+per element. Errors use the same exception types and messages as the scalar
+functions and additionally carry the indices of the offending elements.
+"""
+
+import numpy as np
+
+from calc import is_real_number
+
+
+# Upper bound on how many failing indices are spelled out in an error message.
+MAX_REPORTED_INDICES = 10
+
+# Integer, unsigned integer and floating point dtypes are accepted as-is.
+_NUMERIC_KINDS = frozenset("iuf")
+
+
+class BatchError(Exception):
+	"""Base class for batch errors that record which elements failed.
+
+	Attributes:
+		message: Error message without the index list.
+		indices: Flat indices of the failing elements within the offending argument.
+	"""
+
+	def __init__(self, message: str, indices: np.ndarray) -> None:
+		self.message = message
+		self.indices = indices
+		shown = ", ".join(str(index) for index in indices[:MAX_REPORTED_INDICES])
+		if len(indices) > MAX_REPORTED_INDICES:
+			shown += ", ..."
+		super().__init__(f"{message} Failed indices: [{shown}]")
+
+
+class BatchTypeError(BatchError, TypeError):
+	"""Raised when array elements are not real numbers."""
+
+
+class BatchValueError(BatchError, ValueError):
+	"""Raised when array elements are NaN, infinite or out of domain."""
+
+
+class BatchZeroDivisionError(BatchError, ZeroDivisionError):
+	"""Raised when a divisor array contains zeros."""
+
+
+def _overflows_float(value) -> bool:
+	try:
+		float(value)
+	except OverflowError:
+		return True
+	return False
+
+
+def validate_array(values, name: str) -> np.ndarray:
+	"""Validate an array-like of real numbers and return it as float64.
+
+	Args:
+		values: NumPy array, buffer, sequence or scalar to validate.
+		name: Parameter name for clear error messages.
+
+	Raises:
+		BatchTypeError: If the dtype (or, for object arrays, any element) is not
+			an int or float (booleans and complex numbers are rejected).
+		BatchValueError: If any element is NaN, infinity or an int too large
+			for a float.
+	"""
+	array = np.asarray(values)
+	kind = array.dtype.kind
+
+	if kind == "O":
+		# Object arrays hold arbitrary Python objects; check them like calc.py does.
+		invalid = np.fromiter((not is_real_number(value) for value in array.flat), dtype=bool, count=array.size)
+		if invalid.any():
+			raise BatchTypeError(f"{name} must be a real number (int or float).", np.flatnonzero(invalid))
+	elif kind not in _NUMERIC_KINDS:
+		raise BatchTypeError(f"{name} must be a real number (int or float).", np.arange(array.size))
+
+	is_float = kind == "f"
+	try:
+		array = array.astype(np.float64, copy=False)
+	except OverflowError:
+		# Only object arrays get here: they can hold Python ints past the float range.
+		overflow = np.fromiter((_overflows_float(value) for value in array.flat), dtype=bool, count=array.size)
+		raise BatchValueError(f"{name} must be a finite number.", np.flatnonzero(overflow)) from None
+
+	# Integer dtypes are always finite, so only float and object input needs the scan.
+	if is_float or kind == "O":
+		nonfinite = ~np.isfinite(array)
+		if nonfinite.any():
+			raise BatchValueError(f"{name} must be a finite number.", np.flatnonzero(nonfinite))
+
+	return array
+
+
+def vector_addition(a, b) -> np.ndarray:
+	"""Return the element-wise sum of two arrays."""
+	first = validate_array(a, "a")
+	second = validate_array(b, "b")
+	with np.errstate(over="ignore"):
+		return np.add(first, second)
+
+
+def vector_subtraction(a, b) -> np.ndarray:
+	"""Return the element-wise difference of two arrays."""
+	first = validate_array(a, "a")
+	second = validate_array(b, "b")
+	with np.errstate(over="ignore"):
+		return np.subtract(first, second)
+
+
+def vector_multiplication(a, b) -> np.ndarray:
+	"""Return the element-wise product of two arrays."""
+	first = validate_array(a, "a")
+	second = validate_array(b, "b")
+	with np.errstate(over="ignore"):
+		return np.multiply(first, second)
+
+
+def vector_division(a, b) -> np.ndarray:
+	"""Return the element-wise quotient of two arrays.
+
+	Raises:
+		BatchZeroDivisionError: If any element of b is zero.
+	"""
+	first = validate_array(a, "a")
+	second = validate_array(b, "b")
+
+	zero = second == 0
+	if zero.any():
+		raise BatchZeroDivisionError("Cannot divide by zero.", np.flatnonzero(zero))
+
+	with np.errstate(over="ignore", under="ignore"):
+		return np.divide(first, second)
+
+
+def vector_square_root(values) -> np.ndarray:
+	"""Return the element-wise square root of a non-negative array.
+
+	Raises:
+		BatchValueError: If any element is negative.
+	"""
+	array = validate_array(values, "value")
+
+	negative = array < 0
+	if negative.any():
+		raise BatchValueError("Cannot calculate square root of a negative number.", np.flatnonzero(negative))
+
+	return np.sqrt(array)
@@ -2,8 +2,29 @@
 
 import math
 import unittest
+from decimal import Decimal
+from fractions import Fraction
+from numbers import Real
 
-from calc import addition, subtraction, multiplication, division, square_root
+import numpy as np
+
+from calc import _validate_number, addition, subtraction, multiplication, division, is_real_number, float_power, power, square_root
+
+
+def _reference_validate(value, name):
+    """The original ABC-only validator the fast path must match."""
+    if isinstance(value, bool) or not isinstance(value, Real):
+        raise TypeError(f"{name} must be a real number (int or float).")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError(f"{name} must be a finite number.")
+
+
+class FloatSubclass(float):
+    pass
+
+
+class IntSubclass(int):
+    pass
 
 
 class TestCalculatorFunctions(unittest.TestCase):
@@ -35,6 +56,31 @@ class TestCalculatorFunctions(unittest.TestCase):
         self.assertAlmostEqual(square_root(2), math.sqrt(2), places=7)
         self.assertAlmostEqual(square_root(1e-12), 1e-6, places=12)
 
+    def test_power_valid(self):
+        self.assertEqual(power(2, 10), 1024.0)
+        self.assertEqual(power(-2, 3), -8.0)
+        self.assertEqual(power(9, 0.5), 3.0)
+        self.assertEqual(power(2, -2), 0.25)
+        self.assertEqual(power(0, 0), 1.0)
+
+    def test_power_overflow_is_infinite(self):
+        self.assertEqual(power(10.0, 400), math.inf)
+        self.assertEqual(power(-10.0, 401), -math.inf)
+        self.assertEqual(power(-10.0, 400), math.inf)
+
+    def test_float_power_skips_validation(self):
+        self.assertEqual(float_power(2.0, math.inf), math.inf)
+        self.assertTrue(math.isnan(float_power(2.0, math.nan)))
+        self.assertEqual(float_power(-10.0, 401.0), -math.inf)
+        with self.assertRaises(ValueError):
+            power(2, math.inf)
+
+    def test_power_domain_errors(self):
+        with self.assertRaises(ZeroDivisionError):
+            power(0, -1)
+        with self.assertRaises(ValueError):
+            power(-8, 1 / 3)
+
     def test_division_by_zero(self):
         with self.assertRaises(ZeroDivisionError):
             division(10, 0)
@@ -92,5 +138,35 @@ class TestCalculatorFunctions(unittest.TestCase):
             square_root(float("inf"))
 
 
+
+class TestValidationFastPath(unittest.TestCase):
+    """Test suite checking the fast-path validator against the ABC-only reference."""
+
+    VALUES = [
+        0, 7, -3, 10**100, 0.0, -0.0, 2.5, 1e308, float("nan"), float("inf"), float("-inf"),
+        True, False, None, "2", b"2", [1], (1,), {}, 1 + 2j, complex(1, 0),
+        Decimal("1.5"), Decimal("NaN"), Fraction(1, 3),
+        np.float64(2.5), np.float64("nan"), np.float64("inf"), np.int64(4), np.float32(1.5), np.bool_(True),
+        FloatSubclass(1.5), FloatSubclass("inf"), IntSubclass(3),
+    ]
+
+    def outcome(self, validate, value):
+        try:
+            validate(value, "a")
+        except (TypeError, ValueError) as error:
+            return type(error), str(error)
+        return None
+
+    def test_matches_reference_errors(self):
+        for value in self.VALUES:
+            with self.subTest(value=value):
+                self.assertEqual(self.outcome(_validate_number, value), self.outcome(_reference_validate, value))
+
+    def test_is_real_number_matches_reference_type_check(self):
+        for value in self.VALUES:
+            with self.subTest(value=value):
+                self.assertEqual(is_real_number(value), not isinstance(value, bool) and isinstance(value, Real))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,118 @@
+"""Unit tests for the bulk calculator CLI in calc_bulk.py."""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+
+import numpy as np
+
+from calc_bulk import error_messages, evaluate_chunk, main
+
+
+class TestBulkCalculator(unittest.TestCase):
+    """Test suite covering row validation, CSV and memory-mapped binary files."""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def run_cli(self, *argv):
+        with redirect_stderr(io.StringIO()) as stderr:
+            status = main(list(argv))
+        return status, stderr.getvalue()
+
+    def test_evaluate_chunk_follows_calc_check_order(self):
+        a = np.array([6.0, np.nan, 1.0, 5.0, 0.0])
+        b = np.array([3.0, 0.0, np.inf, 0.0, 0.0])
+        unparsed = [np.array([False, False, False, False, True]), np.zeros(5, dtype=bool)]
+        results, codes = evaluate_chunk("div", [a, b], unparsed)
+        messages = error_messages("div")
+        self.assertEqual(
+            [messages[code] for code in codes],
+            [
+                "",
+                "a must be a finite number.",
+                "b must be a finite number.",
+                "Cannot divide by zero.",
+                "a must be a real number (int or float).",
+            ],
+        )
+        self.assertEqual(results[0], 2.0)
+        self.assertTrue(np.isnan(results[1:]).all())
+
+    def test_csv_results_and_error_report(self):
+        with open(self.path("in.csv"), "w") as handle:
+            handle.write("x,a,b\nr1,10,4\nr2,1,0\nr3,oops,2\nr4,2.5,2\nr5,1\n")
+
+        status, summary = self.run_cli(
+            "div", self.path("in.csv"), "--skip-header", "--columns", "1,2", "--chunk-rows", "2",
+            "-o", self.path("out.csv"), "--errors", self.path("errors.csv"),
+        )
+
+        self.assertEqual(status, 1)
+        self.assertIn("Processed 5 rows (3 failed)", summary)
+        with open(self.path("out.csv")) as handle:
+            self.assertEqual(handle.read().split("\n"), ["2.5", "", "", "1.25", "", ""])
+        with open(self.path("errors.csv")) as handle:
+            self.assertEqual(
+                handle.read().splitlines(),
+                [
+                    "1,Cannot divide by zero.",
+                    "2,a must be a real number (int or float).",
+                    "4,b must be a real number (int or float).",
+                ],
+            )
+
+    def test_binary_input_is_processed_in_chunks(self):
+        operands = np.arange(20, dtype="<f8").reshape(10, 2)
+        operands.tofile(self.path("in.f64"))
+
+        status, summary = self.run_cli(
+            "sub", self.path("in.f64"), "--format", "binary", "--chunk-rows", "3",
+            "-o", self.path("out.f64"), "--errors", self.path("errors.csv"),
+        )
+
+        self.assertEqual(status, 0)
+        self.assertIn("rows/s", summary)
+        np.testing.assert_array_equal(np.fromfile(self.path("out.f64"), dtype="<f8"), np.full(10, -1.0))
+
+    def test_binary_sqrt_marks_failed_rows_as_nan(self):
+        np.array([4.0, -1.0, 9.0], dtype="<f8").tofile(self.path("in.f64"))
+
+        status, _ = self.run_cli(
+            "sqrt", self.path("in.f64"), "--format", "binary",
+            "-o", self.path("out.f64"), "--errors", self.path("errors.csv"),
+        )
+
+        self.assertEqual(status, 1)
+        results = np.fromfile(self.path("out.f64"), dtype="<f8")
+        self.assertEqual(results[[0, 2]].tolist(), [2.0, 3.0])
+        self.assertTrue(np.isnan(results[1]))
+        with open(self.path("errors.csv")) as handle:
+            self.assertEqual(handle.read(), "1,Cannot calculate square root of a negative number.\n")
+
+    def test_truncated_binary_input_is_rejected(self):
+        with open(self.path("in.f64"), "wb") as handle:
+            handle.write(b"\x00" * 12)
+
+        status, summary = self.run_cli("add", self.path("in.f64"), "--format", "binary", "-o", self.path("out.f64"))
+
+        self.assertEqual(status, 2)
+        self.assertIn("not a whole number", summary)
+        self.assertFalse(os.path.exists(self.path("out.f64")))
+
+    def test_missing_csv_input_is_rejected_before_creating_output(self):
+        status, summary = self.run_cli("add", self.path("missing.csv"), "-o", self.path("out.csv"))
+
+        self.assertEqual(status, 2)
+        self.assertIn("error:", summary)
+        self.assertFalse(os.path.exists(self.path("out.csv")))
+
+
+if __name__ == "__main__":
+    unittest.main()
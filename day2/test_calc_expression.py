@@ -0,0 +1,71 @@
+"""Unit tests for the expression engine in calc_expression.py."""
+
+import math
+import unittest
+
+from calc_expression import compile_expression, evaluate
+
+
+class TestExpressionEngine(unittest.TestCase):
+    """Test suite covering precedence, caching and error cases."""
+
+    def test_precedence_and_associativity(self):
+        self.assertEqual(evaluate("2+3*4"), 14.0)
+        self.assertEqual(evaluate("10-4-3"), 3.0)
+        self.assertEqual(evaluate("100/10/5"), 2.0)
+        self.assertEqual(evaluate("2*3+4*5"), 26.0)
+
+    def test_parentheses(self):
+        self.assertEqual(evaluate("(2+3)*4"), 20.0)
+        self.assertEqual(evaluate("((1+2)*(3+4))"), 21.0)
+
+    def test_unary_minus_and_plus(self):
+        self.assertEqual(evaluate("-2*3"), -6.0)
+        self.assertEqual(evaluate("2*-3"), -6.0)
+        self.assertEqual(evaluate("--2"), 2.0)
+        self.assertEqual(evaluate("-(2+3)"), -5.0)
+        self.assertEqual(evaluate("+5"), 5.0)
+
+    def test_square_root(self):
+        self.assertEqual(evaluate("sqrt(16)+1"), 5.0)
+        self.assertEqual(evaluate("-sqrt(4)*2"), -4.0)
+        self.assertEqual(evaluate("sqrt(sqrt(16))"), 2.0)
+        self.assertAlmostEqual(evaluate("sqrt(2)"), math.sqrt(2), places=12)
+
+    def test_number_formats_and_whitespace(self):
+        self.assertEqual(evaluate(" 1.5e2 / 3 "), 50.0)
+        self.assertEqual(evaluate(".5 + 1"), 1.5)
+
+    def test_compiled_program_is_cached(self):
+        compile_expression.cache_clear()
+        first = compile_expression("7*6")
+        second = compile_expression("7*6")
+        self.assertIs(first, second)
+        info = compile_expression.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_syntax_errors(self):
+        for text in ["", "2+", "()", "2 3", "sqrt 4", "(2", "2)", "abc", "2+*3", "sqrt()", "1e999"]:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    evaluate(text)
+
+        with self.assertRaises(ValueError):
+            evaluate("1+" * 600 + "1")
+
+    def test_calculator_errors_propagate(self):
+        with self.assertRaises(ZeroDivisionError):
+            evaluate("1/(2-2)")
+
+        with self.assertRaises(ValueError):
+            evaluate("sqrt(1-2)")
+
+    def test_non_finite_results_are_rejected(self):
+        for text in ["1e308*10", "-1e308-1e308", "1e308/1e-308", "1e308*10-1"]:
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    evaluate(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
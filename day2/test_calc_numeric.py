@@ -0,0 +1,139 @@
+"""Unit tests for the selectable numeric backends in calc_numeric.py."""
+
+import decimal
+import math
+import time
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
+from calc_numeric import (
+    MAX_OPERAND_LENGTH,
+    MODES,
+    calculate,
+    format_number,
+    make_context,
+    to_decimal,
+    to_fraction,
+)
+
+
+class TestNumericModes(unittest.TestCase):
+    """Test suite covering float, decimal and fraction results and their errors."""
+
+    def test_float_mode_is_calc_py(self):
+        self.assertEqual(calculate("add", 0.1, 0.2), 0.30000000000000004)
+        self.assertEqual(calculate("add", 1e308, 1e308), math.inf)
+        self.assertEqual(calculate("sqrt", 25), 5.0)
+        with self.assertRaisesRegex(TypeError, "a must be a real number"):
+            calculate("add", "1", 2)
+
+    def test_decimal_mode_is_exact_for_decimal_input(self):
+        self.assertEqual(calculate("add", 0.1, 0.2, mode="decimal"), Decimal("0.3"))
+        self.assertEqual(calculate("add", 1e308, 1e308, mode="decimal"), Decimal("2E+308"))
+        self.assertEqual(calculate("mul", "1.10", "3", mode="decimal"), Decimal("3.30"))
+        self.assertEqual(calculate("sub", "1e400", "1e400", mode="decimal"), 0)
+        self.assertEqual(calculate("sqrt", "2", mode="decimal"), Decimal("1.414213562373095048801688724"))
+
+    def test_decimal_context_controls_precision(self):
+        self.assertEqual(calculate("div", 1, 3, mode="decimal", context=make_context(5)), Decimal("0.33333"))
+        self.assertEqual(calculate("div", 2, 3, mode="decimal", context=make_context(3)), Decimal("0.667"))
+        with self.assertRaises(ValueError):
+            make_context(0)
+
+        # The thread's own context never leaks into results.
+        with decimal.localcontext() as context:
+            context.prec = 2
+            self.assertEqual(calculate("div", 1, 8, mode="decimal"), Decimal("0.125"))
+
+    def test_fraction_mode_is_exact(self):
+        self.assertEqual(calculate("add", 0.1, 0.2, mode="fraction"), Fraction(3, 10))
+        self.assertEqual(calculate("div", 1, 3, mode="fraction"), Fraction(1, 3))
+        self.assertEqual(calculate("mul", "1/3", 3, mode="fraction"), 1)
+        self.assertEqual(calculate("sqrt", "9/4", mode="fraction"), Fraction(3, 2))
+        with self.assertRaisesRegex(ValueError, "not a rational number"):
+            calculate("sqrt", 2, mode="fraction")
+
+    def test_operand_types(self):
+        for mode, convert in (("decimal", to_decimal), ("fraction", to_fraction)):
+            with self.subTest(mode=mode):
+                self.assertEqual(convert(Decimal("2.5")), convert(Fraction(5, 2)))
+                self.assertEqual(convert(np.float64(2.5)), convert(2.5))
+                self.assertEqual(convert(np.int64(7)), 7)
+                self.assertEqual(convert(" 1.5 "), convert(1.5))
+
+    def test_shared_errors(self):
+        for mode in ("decimal", "fraction"):
+            with self.subTest(mode=mode):
+                with self.assertRaisesRegex(ZeroDivisionError, "Cannot divide by zero."):
+                    calculate("div", 1, "0.0", mode=mode)
+                with self.assertRaisesRegex(ValueError, "Cannot calculate square root of a negative number."):
+                    calculate("sqrt", -4, mode=mode)
+                for value in (True, None, [1], 1 + 2j):
+                    with self.assertRaisesRegex(TypeError, "a must be a number"):
+                        calculate("add", value, 1, mode=mode)
+                for value in (math.nan, math.inf, "NaN", "-Infinity", Decimal("sNaN")):
+                    with self.assertRaisesRegex(ValueError, "b must be a finite number."):
+                        calculate("add", 1, value, mode=mode)
+                with self.assertRaisesRegex(ValueError, "a is not a valid number."):
+                    calculate("add", "ten", 1, mode=mode)
+                with self.assertRaisesRegex(ValueError, "longer than"):
+                    calculate("add", "1" * (MAX_OPERAND_LENGTH + 1), 1, mode=mode)
+
+    def test_range_limits(self):
+        with self.assertRaisesRegex(ValueError, "exponent range"):
+            calculate("mul", "9e999999", 10, mode="decimal")
+        with self.assertRaisesRegex(ValueError, "too large for fraction mode"):
+            calculate("add", "1e5000", 1, mode="fraction")
+        with self.assertRaisesRegex(ValueError, "too large for fraction mode"):
+            calculate("add", 10**2000, 1, mode="fraction")
+
+    def test_power_is_exact(self):
+        self.assertEqual(calculate("pow", "1.1", 2, mode="decimal"), Decimal("1.21"))
+        self.assertEqual(calculate("pow", "2", "0.5", mode="decimal"), Decimal("1.414213562373095048801688724"))
+        self.assertEqual(calculate("pow", "2/3", -2, mode="fraction"), Fraction(9, 4))
+        self.assertEqual(calculate("pow", 0, 0, mode="decimal"), Decimal(1))
+        self.assertEqual(calculate("pow", 1, 10**9, mode="fraction"), Fraction(1))
+        self.assertEqual(calculate("pow", 2, 10), 1024.0)
+
+    def test_power_errors(self):
+        for mode in ("decimal", "fraction"):
+            with self.subTest(mode=mode):
+                with self.assertRaisesRegex(ZeroDivisionError, "Cannot raise zero to a negative power."):
+                    calculate("pow", 0, -1, mode=mode)
+                with self.assertRaisesRegex(ValueError, "Cannot raise a negative number to a fractional power."):
+                    calculate("pow", -8, "0.5", mode=mode)
+        with self.assertRaisesRegex(ValueError, "use decimal mode"):
+            calculate("pow", 2, "1/2", mode="fraction")
+        with self.assertRaisesRegex(ValueError, "too large for fraction mode"):
+            calculate("pow", 3, 100_000, mode="fraction")
+        with self.assertRaisesRegex(ValueError, "exponent range"):
+            calculate("pow", 10, "1e999999", mode="decimal")
+
+    def test_huge_exponent_on_negative_base_is_checked_without_expanding_it(self):
+        started = time.perf_counter()
+        with self.assertRaisesRegex(ValueError, "exponent range"):
+            calculate("pow", -2, "1e999999999", mode="decimal")
+        with self.assertRaisesRegex(ValueError, "Cannot raise a negative number to a fractional power."):
+            calculate("pow", -2, "1e-999999999", mode="decimal")
+        with self.assertRaisesRegex(ValueError, "too large for fraction mode"):
+            calculate("pow", -2, "1e300", mode="fraction")
+        self.assertLess(time.perf_counter() - started, 1.0)
+
+    def test_unknown_operation_and_mode(self):
+        with self.assertRaisesRegex(ValueError, "operation must be one of"):
+            calculate("mod", 2, 3)
+        with self.assertRaisesRegex(ValueError, "mode must be one of"):
+            calculate("add", 2, 3, mode="complex")
+        self.assertEqual(MODES, ("float", "decimal", "fraction"))
+
+    def test_format_number(self):
+        self.assertEqual(format_number(Decimal("2E+308")), "2E+308")
+        self.assertEqual(format_number(Fraction(1, 3)), "1/3")
+        self.assertEqual(format_number(2.5), "2.5")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Unit tests for the process-pool execution in calc_parallel.py."""
+
+import unittest
+
+import numpy as np
+
+from calc_parallel import parallel_compute, shutdown_executor
+from calc_vector import BatchTypeError, BatchValueError, BatchZeroDivisionError, vector_division
+
+
+class TestParallelCompute(unittest.TestCase):
+    """Test suite forcing the parallel path with a zero threshold and two workers."""
+
+    @classmethod
+    def tearDownClass(cls):
+        shutdown_executor()
+
+    def run_parallel(self, operation, *operands):
+        return parallel_compute(operation, *operands, workers=2, threshold=0)
+
+    def test_matches_serial_results_in_order(self):
+        a = np.arange(1, 1001, dtype=np.int64)
+        b = np.linspace(0.5, 10.0, 1000)
+        np.testing.assert_array_equal(self.run_parallel("add", a, b), a + b)
+        np.testing.assert_array_equal(self.run_parallel("sub", a, b), a - b)
+        np.testing.assert_array_equal(self.run_parallel("mul", a, b), a * b)
+        np.testing.assert_array_equal(self.run_parallel("div", a, b), vector_division(a, b))
+        np.testing.assert_array_equal(self.run_parallel("sqrt", a), np.sqrt(a))
+
+    def test_preserves_shape(self):
+        a = np.arange(12.0).reshape(3, 4)
+        result = self.run_parallel("mul", a, a)
+        self.assertEqual(result.shape, (3, 4))
+        np.testing.assert_array_equal(result, a * a)
+
+    def test_errors_merge_indices_across_shards(self):
+        b = np.ones(100)
+        b[[3, 60, 97]] = 0
+        with self.assertRaises(BatchZeroDivisionError) as context:
+            self.run_parallel("div", np.ones(100), b)
+        np.testing.assert_array_equal(context.exception.indices, [3, 60, 97])
+        self.assertEqual(context.exception.message, "Cannot divide by zero.")
+
+    def test_error_priority_matches_serial(self):
+        a = np.ones(100)
+        a[80] = np.nan
+        b = np.ones(100)
+        b[[2, 40]] = np.inf
+        with self.assertRaises(BatchValueError) as context:
+            self.run_parallel("add", a, b)
+        self.assertEqual(str(context.exception), "a must be a finite number. Failed indices: [80]")
+
+        with self.assertRaises(BatchValueError) as context:
+            self.run_parallel("sqrt", np.array([1.0, -1.0] * 50))
+        np.testing.assert_array_equal(context.exception.indices, np.arange(1, 100, 2))
+
+    def test_non_numeric_input_uses_serial_errors(self):
+        with self.assertRaises(BatchTypeError):
+            self.run_parallel("add", np.array([True, False]), np.array([1.0, 2.0]))
+        with self.assertRaises(BatchTypeError) as context:
+            self.run_parallel("add", np.array([1, "x", 3], dtype=object), np.ones(3))
+        np.testing.assert_array_equal(context.exception.indices, [1])
+
+    def test_small_inputs_stay_in_process(self):
+        np.testing.assert_array_equal(parallel_compute("add", [1, 2], [3, 4]), [4.0, 6.0])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            parallel_compute("pow", [1], [2])
+        with self.assertRaises(ValueError):
+            parallel_compute("add", [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
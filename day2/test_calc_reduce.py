@@ -0,0 +1,88 @@
+"""Unit tests for the chunked reductions in calc_reduce.py."""
+
+import math
+import unittest
+from array import array
+
+import numpy as np
+
+from calc_reduce import MODES, reduce_mean, reduce_product, reduce_sum
+
+
+class TestReductions(unittest.TestCase):
+    """Test suite covering accuracy modes, chunking and validation errors."""
+
+    def test_sum_all_modes(self):
+        values = [1, 2.5, -3, 10**6]
+        for mode in MODES:
+            with self.subTest(mode=mode):
+                self.assertEqual(reduce_sum(values, mode=mode), 1000000.5)
+                self.assertEqual(reduce_sum(np.array(values), mode=mode, chunk_size=3), 1000000.5)
+
+    def test_sum_accepts_iterables_and_buffers(self):
+        self.assertEqual(reduce_sum(x * 0.5 for x in range(10)), 22.5)
+        self.assertEqual(reduce_sum(array("d", [1.5, 2.5])), 4.0)
+        self.assertEqual(reduce_sum(np.arange(12).reshape(3, 4), chunk_size=5), 66.0)
+        self.assertEqual(reduce_sum([]), 0.0)
+
+    def test_compensated_modes_are_more_accurate(self):
+        values = [0.1] * 100_000
+        exact = math.fsum(values)
+        self.assertEqual(reduce_sum(values, mode="compensated", chunk_size=1000), exact)
+        naive = 0.0
+        for value in values:
+            naive += value
+        self.assertLess(abs(reduce_sum(values, mode="pairwise", chunk_size=1000) - exact), abs(naive - exact))
+
+    def test_cancellation_across_chunks(self):
+        values = [1e100, 1.0, -1e100]
+        self.assertEqual(reduce_sum(values, mode="compensated", chunk_size=1), 1.0)
+        self.assertEqual(reduce_sum(values, mode="pairwise", chunk_size=1), 1.0)
+        self.assertEqual(reduce_sum(values, mode="fast", chunk_size=1), 0.0)
+
+    def test_product(self):
+        for mode in MODES:
+            with self.subTest(mode=mode):
+                self.assertEqual(reduce_product([2, 3, 4, 0.5, 5], mode=mode, chunk_size=2), 60.0)
+        self.assertEqual(reduce_product([]), 1.0)
+        self.assertEqual(reduce_product([1e308, 10]), math.inf)
+
+    def test_mean(self):
+        self.assertEqual(reduce_mean(range(1, 101), chunk_size=7), 50.5)
+        with self.assertRaises(ValueError):
+            reduce_mean([])
+
+    def test_validation_reports_global_indices(self):
+        with self.assertRaises(TypeError) as context:
+            reduce_sum([1, 2, 3, "x", 5, None], chunk_size=2)
+        self.assertEqual(context.exception.indices.tolist(), [3])
+
+        with self.assertRaises(ValueError) as context:
+            reduce_product(np.array([1.0, 2.0, 3.0, math.nan]), chunk_size=3)
+        self.assertEqual(context.exception.indices.tolist(), [3])
+
+        with self.assertRaises(TypeError) as context:
+            reduce_mean([1, [2, 3], 4])
+        self.assertEqual(context.exception.indices.tolist(), [1])
+
+        with self.assertRaises(TypeError):
+            reduce_sum(np.array([True, False]))
+
+        with self.assertRaises(ValueError) as context:
+            reduce_sum([1, 2, 3, 10**400], chunk_size=2)
+        self.assertEqual(context.exception.indices.tolist(), [3])
+
+    def test_overflow_to_undefined_result(self):
+        with self.assertRaises(ValueError):
+            reduce_sum([1e308, 1e308, -1e308, -1e308], chunk_size=2)
+        self.assertEqual(reduce_sum([1e308, 1e308]), math.inf)
+
+    def test_invalid_options(self):
+        with self.assertRaises(ValueError):
+            reduce_sum([1], mode="exact")
+        with self.assertRaises(ValueError):
+            reduce_product([1], chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
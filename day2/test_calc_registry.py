@@ -0,0 +1,88 @@
+"""Unit tests for the shared operation registry in calc_registry.py."""
+
+import operator
+import unittest
+
+import numpy as np
+
+from calc import power
+from calc_registry import (
+    DOMAIN_CHECKS,
+    DOMAIN_ERRORS,
+    REGISTRY,
+    SCALAR_KERNELS,
+    SYMBOLS,
+    VECTOR_KERNELS,
+    Operation,
+    register,
+)
+
+
+OPERANDS = [(2.0, 10.0), (-8.0, 3.0), (0.1, 0.2), (1e308, 10.0), (9.0, 0.5), (-2.0, -3.0), (10.0, 400.0)]
+
+
+class TestOperationRegistry(unittest.TestCase):
+    """Test suite covering the derived tables, kernel agreement and registration rules."""
+
+    def test_tables_cover_every_operation(self):
+        self.assertEqual(list(REGISTRY), ["add", "sub", "mul", "div", "pow"])
+        self.assertEqual(list(SCALAR_KERNELS), list(REGISTRY))
+        self.assertEqual(list(VECTOR_KERNELS), list(REGISTRY))
+        self.assertEqual(SYMBOLS, {"+": "add", "-": "sub", "*": "mul", "/": "div", "^": "pow"})
+        self.assertEqual(set(DOMAIN_CHECKS), {"div", "pow"})
+        for operation in REGISTRY.values():
+            self.assertTrue(set(operation.errors) <= set(DOMAIN_ERRORS))
+
+    def test_scalar_vector_and_library_kernels_agree(self):
+        for operation in REGISTRY.values():
+            valid = [(a, b) for a, b in OPERANDS if operation.check is None or operation.check(a, b) is None]
+            first, second = (np.array(column) for column in zip(*valid))
+            with np.errstate(over="ignore"):
+                vector = getattr(np, operation.vector)(first, second).tolist()
+            with self.subTest(operation=operation.name):
+                self.assertEqual([operation.scalar(a, b) for a, b in valid], vector)
+                self.assertEqual([operation.function(a, b) for a, b in valid], vector)
+
+    def test_pow_kernels_agree_on_non_finite_operands(self):
+        inf, nan = float("inf"), float("nan")
+        operands = [(2.0, inf), (2.0, -inf), (-8.0, inf), (inf, 2.0), (-inf, 3.0), (2.0, nan), (nan, 0.0), (-8.0, nan)]
+        pow_ = REGISTRY["pow"]
+        for a, b in operands:
+            with self.subTest(a=a, b=b):
+                self.assertIsNone(pow_.check(a, b))
+                self.assertEqual(repr(pow_.scalar(a, b)), repr(float(np.power(a, b))))
+
+    def test_domain_checks(self):
+        div, pow_ = DOMAIN_CHECKS["div"], DOMAIN_CHECKS["pow"]
+        self.assertEqual(div(1.0, 0.0), "Division by zero is not allowed.")
+        self.assertEqual(div(1.0, -0.0), "Division by zero is not allowed.")
+        self.assertIsNone(div(0.0, 1.0))
+        self.assertEqual(pow_(0.0, -1.0), "Cannot raise zero to a negative power.")
+        self.assertEqual(pow_(-8.0, 0.5), "Cannot raise a negative number to a fractional power.")
+        self.assertIsNone(pow_(-8.0, 3.0))
+        self.assertIsNone(pow_(0.0, 0.0))
+
+    def test_registering_adds_to_every_table(self):
+        modulo = register(Operation("mod", "%", "mod", operator.mod, operator.mod, "remainder"))
+
+        def unregister():
+            del REGISTRY["mod"], SCALAR_KERNELS["mod"], VECTOR_KERNELS["mod"], SYMBOLS["%"]
+
+        self.addCleanup(unregister)
+        self.assertIs(REGISTRY["mod"], modulo)
+        self.assertEqual(SCALAR_KERNELS["mod"](7.0, 3.0), 1.0)
+        self.assertEqual(VECTOR_KERNELS["mod"], "remainder")
+        self.assertEqual(SYMBOLS["%"], "mod")
+        self.assertNotIn("mod", DOMAIN_CHECKS)
+
+    def test_duplicate_names_and_symbols_are_rejected(self):
+        with self.assertRaises(ValueError):
+            register(Operation("pow", "**", "pow", power, power, "power"))
+        with self.assertRaises(ValueError):
+            register(Operation("xor", "^", "xor", operator.xor, operator.xor, "bitwise_xor"))
+        self.assertIs(REGISTRY["pow"].function, power)
+        self.assertEqual(SYMBOLS["^"], "pow")
+
+
+if __name__ == "__main__":
+    unittest.main()
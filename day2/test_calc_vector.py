@@ -0,0 +1,120 @@
+"""Unit tests for the vectorized calculator functions in calc_vector.py."""
+
+import math
+import unittest
+from array import array
+
+import numpy as np
+
+from calc import addition, division, multiplication, square_root, subtraction
+from calc_vector import (
+    BatchError,
+    validate_array,
+    vector_addition,
+    vector_division,
+    vector_multiplication,
+    vector_square_root,
+    vector_subtraction,
+)
+
+
+class TestVectorCalculatorFunctions(unittest.TestCase):
+    """Vectorized results must match the scalar functions element by element."""
+
+    def setUp(self):
+        self.a = np.array([2.0, -2.0, 0.1, 1e12, 0.0, 1e308])
+        self.b = np.array([3.0, 3.0, 0.2, 1e12, 5.0, 1e308])
+
+    def assert_matches_scalar(self, vector_function, scalar_function):
+        result = vector_function(self.a, self.b)
+        expected = [scalar_function(x, y) for x, y in zip(self.a.tolist(), self.b.tolist())]
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result.tolist(), expected)
+
+    def test_binary_operations_match_scalar(self):
+        self.assert_matches_scalar(vector_addition, addition)
+        self.assert_matches_scalar(vector_subtraction, subtraction)
+        self.assert_matches_scalar(vector_multiplication, multiplication)
+        self.assert_matches_scalar(vector_division, division)
+
+    def test_square_root_matches_scalar(self):
+        values = np.array([25, 0, 2, 1e-12])
+        self.assertEqual(vector_square_root(values).tolist(), [square_root(v) for v in values.tolist()])
+
+    def test_accepts_integer_arrays_lists_and_buffers(self):
+        self.assertEqual(vector_addition(np.arange(3), [1, 1, 1]).tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(vector_multiplication(array("d", [1.5, 2.0]), 2).tolist(), [3.0, 4.0])
+        self.assertEqual(vector_subtraction(np.array([10, 5], dtype=np.uint8), 4).tolist(), [6.0, 1.0])
+
+    def test_division_by_zero_reports_indices(self):
+        with self.assertRaises(ZeroDivisionError) as context:
+            vector_division([1, 2, 3, 4], [1, 0, 2, -0.0])
+
+        self.assertIsInstance(context.exception, BatchError)
+        self.assertEqual(context.exception.indices.tolist(), [1, 3])
+        self.assertIn("Cannot divide by zero.", str(context.exception))
+
+    def test_square_root_negative_reports_indices(self):
+        with self.assertRaises(ValueError) as context:
+            vector_square_root([4, -1, 9, -0.5])
+
+        self.assertEqual(context.exception.indices.tolist(), [1, 3])
+
+    def test_type_validation_errors(self):
+        # Booleans, complex numbers and strings are rejected by dtype.
+        with self.assertRaises(TypeError):
+            vector_addition(np.array([True, False]), [1, 2])
+
+        with self.assertRaises(TypeError):
+            vector_multiplication([1 + 2j], [3])
+
+        with self.assertRaises(TypeError):
+            vector_subtraction(["2"], [1])
+
+        with self.assertRaises(TypeError):
+            vector_square_root(np.array([True]))
+
+    def test_object_array_reports_invalid_elements(self):
+        values = np.array([1, None, 2.5, True, "x"], dtype=object)
+        with self.assertRaises(TypeError) as context:
+            vector_addition(values, 1)
+
+        self.assertEqual(context.exception.indices.tolist(), [1, 3, 4])
+        self.assertIn("a must be a real number", str(context.exception))
+
+    def test_finite_number_validation_errors(self):
+        with self.assertRaises(ValueError) as context:
+            vector_addition([1.0, math.nan, 2.0], [1, 1, 1])
+        self.assertEqual(context.exception.indices.tolist(), [1])
+        self.assertIn("a must be a finite number.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            vector_division([1, 1], [math.inf, -math.inf])
+        self.assertEqual(context.exception.indices.tolist(), [0, 1])
+        self.assertIn("b must be a finite number.", str(context.exception))
+
+    def test_validate_array_returns_float64_and_names_the_argument(self):
+        result = validate_array([1, 2, 3], "values")
+        self.assertEqual(result.dtype, np.float64)
+        self.assertEqual(result.tolist(), [1.0, 2.0, 3.0])
+
+        with self.assertRaises(ValueError) as context:
+            validate_array([1.0, math.inf], "values")
+        self.assertEqual(context.exception.indices.tolist(), [1])
+        self.assertIn("values must be a finite number.", str(context.exception))
+
+        with self.assertRaises(ValueError) as context:
+            vector_addition([1, 10**400, -(10**400)], [1, 1, 1])
+        self.assertEqual(context.exception.indices.tolist(), [1, 2])
+        self.assertIn("a must be a finite number.", str(context.exception))
+
+    def test_error_message_truncates_long_index_lists(self):
+        with self.assertRaises(ZeroDivisionError) as context:
+            vector_division(np.ones(50), np.zeros(50))
+
+        self.assertEqual(len(context.exception.indices), 50)
+        self.assertTrue(str(context.exception).endswith(", ...]"))
+
+
+if __name__ == "__main__":
+    unittest.main()
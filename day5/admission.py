@@ -0,0 +1,108 @@
+"""Admission control for the calculator API: concurrency limits and rate limits.
+
+ConcurrencyLimiter lets a fixed number of requests run at once and parks a
+bounded number of others for a short time. Anything beyond that is rejected
+immediately, so overload turns into fast 503 responses instead of growing
+queues and client timeouts. TokenBucketLimiter gives every client its own
+token bucket and reports how long a rejected client should wait.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ConcurrencyLimiter:
+	"""Bounded concurrency with a bounded, time-limited wait queue."""
+
+	def __init__(self, max_concurrent: int, max_queue: int = 0, queue_timeout: float = 0.5) -> None:
+		if max_concurrent < 1 or max_queue < 0 or queue_timeout < 0:
+			raise ValueError("max_concurrent must be at least 1; max_queue and queue_timeout must not be negative.")
+		self.max_concurrent = max_concurrent
+		self.max_queue = max_queue
+		self.queue_timeout = queue_timeout
+		self._condition = threading.Condition()
+		self.active = 0
+		self.waiting = 0
+		self.admitted = 0
+		self.rejected = 0
+
+	def acquire(self) -> bool:
+		"""Take a slot, waiting up to queue_timeout if the queue has room; False means rejected."""
+		with self._condition:
+			if self.active < self.max_concurrent:
+				self.active += 1
+				self.admitted += 1
+				return True
+			if self.waiting >= self.max_queue:
+				self.rejected += 1
+				return False
+
+			self.waiting += 1
+			try:
+				admitted = self._condition.wait_for(lambda: self.active < self.max_concurrent, self.queue_timeout)
+			finally:
+				self.waiting -= 1
+			if not admitted:
+				self.rejected += 1
+				return False
+			self.active += 1
+			self.admitted += 1
+			return True
+
+	def release(self) -> None:
+		with self._condition:
+			self.active -= 1
+			self._condition.notify()
+
+	def stats(self) -> dict:
+		with self._condition:
+			return {
+				"max_concurrent": self.max_concurrent,
+				"max_queue": self.max_queue,
+				"active": self.active,
+				"waiting": self.waiting,
+				"admitted": self.admitted,
+				"rejected": self.rejected,
+			}
+
+
+class TokenBucketLimiter:
+	"""Per-client token buckets refilled at `rate` tokens per second up to `burst`.
+
+	Buckets for at most max_clients clients are kept; the least recently seen
+	client is forgotten first, which only ever gives it a fresh full bucket.
+	"""
+
+	def __init__(self, rate: float, burst: int, max_clients: int = 10_000, clock=time.monotonic) -> None:
+		if rate <= 0 or burst < 1 or max_clients < 1:
+			raise ValueError("rate must be positive; burst and max_clients at least 1.")
+		self.rate = rate
+		self.burst = burst
+		self.max_clients = max_clients
+		self._clock = clock
+		self._lock = threading.Lock()
+		self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+		self.limited = 0
+
+	def acquire(self, client: str) -> float:
+		"""Spend one token for client; return 0.0 if allowed, else seconds until a token is available."""
+		now = self._clock()
+		with self._lock:
+			tokens, updated = self._buckets.pop(client, (float(self.burst), now))
+			tokens = min(float(self.burst), tokens + (now - updated) * self.rate)
+			if tokens >= 1.0:
+				tokens -= 1.0
+				wait = 0.0
+			else:
+				wait = (1.0 - tokens) / self.rate
+				self.limited += 1
+
+			self._buckets[client] = (tokens, now)
+			if len(self._buckets) > self.max_clients:
+				self._buckets.popitem(last=False)
+			return wait
+
+	def stats(self) -> dict:
+		with self._lock:
+			return {"rate": self.rate, "burst": self.burst, "clients": len(self._buckets), "limited": self.limited}
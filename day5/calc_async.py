@@ -0,0 +1,169 @@
+"""Non-blocking API calls for the Streamlit calculator.
+
+Streamlit runs button callbacks on the session's script thread, so a
+callback that calls the API blocks that session until the response arrives.
+AsyncCalculator runs calls on one background asyncio event loop instead:
+submit() returns a concurrent.futures.Future at once, the UI shows a pending
+state, and the session picks the result up when the future is done.
+
+- Calls from every session in the process are queued for up to
+  CALC_UI_BATCH_WINDOW_MS and sent together as one POST /batch. A call that
+  is alone in its window uses its own endpoint.
+- Cancelling a future withdraws the call if it has not been sent yet. A call
+  that is already in flight finishes, but its result is discarded.
+- HTTP goes through the shared pooled CalcClient on a small worker pool, so
+  retries, keep-alive and busy (429/503) handling match the blocking path.
+- A call submitted with a trace skips the queue and is sent on its own, so
+  its spans describe a single request.
+
+Environment:
+    CALC_UI_BATCH_WINDOW_MS  How long a call waits for others to share its
+                             request, in milliseconds (default 5).
+    CALC_UI_MAX_BATCH        Most calls sent in one request (default 64).
+    CALC_UI_MAX_IN_FLIGHT    Requests outstanding at once (default 8).
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+try:
+    from day5.calc_client import CalcAPIBusy, CalcAPIUnavailable, CalcClient, get_client
+    from day5.calc_modes import API_BUSY_MESSAGE, API_UNEXPECTED_MESSAGE, API_UNREACHABLE_MESSAGE, interpret_response
+except ModuleNotFoundError:
+    from calc_client import CalcAPIBusy, CalcAPIUnavailable, CalcClient, get_client
+    from calc_modes import API_BUSY_MESSAGE, API_UNEXPECTED_MESSAGE, API_UNREACHABLE_MESSAGE, interpret_response
+
+if TYPE_CHECKING:
+    from calc_trace import Trace
+
+
+BATCH_WINDOW = float(os.environ.get("CALC_UI_BATCH_WINDOW_MS", "5")) / 1000
+MAX_BATCH = int(os.environ.get("CALC_UI_MAX_BATCH", "64"))
+MAX_IN_FLIGHT = int(os.environ.get("CALC_UI_MAX_IN_FLIGHT", "8"))
+
+
+def _failure(error: Exception) -> tuple[str, str]:
+    if isinstance(error, CalcAPIBusy):
+        return "Error", API_BUSY_MESSAGE
+    if isinstance(error, CalcAPIUnavailable):
+        return "Error", API_UNREACHABLE_MESSAGE
+    return "Error", API_UNEXPECTED_MESSAGE
+
+
+class AsyncCalculator:
+    """Evaluate API calls on a background event loop, coalescing concurrent calls."""
+
+    def __init__(
+        self,
+        client: CalcClient | None = None,
+        batch_window: float = BATCH_WINDOW,
+        max_batch: int = MAX_BATCH,
+        max_in_flight: int = MAX_IN_FLIGHT,
+    ) -> None:
+        self._client = client
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self._executor = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="calc-async")
+        self._queue: list[tuple[dict, asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task] = set()
+        self.requests = 0
+        self.calls = 0
+        self.withdrawn = 0
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="calc-async-loop", daemon=True)
+        self._thread.start()
+
+    @property
+    def client(self) -> CalcClient:
+        return self._client if self._client is not None else get_client()
+
+    def submit(
+        self, operation: str, first_number: float, second_number: float, trace: "Trace | None" = None
+    ) -> Future:
+        """Start one calculation and return a future for its (display, message) pair.
+
+        Safe to call from any thread; it never waits for the API.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.calculate(operation, first_number, second_number, trace), self._loop
+        )
+
+    async def calculate(
+        self, operation: str, first_number: float, second_number: float, trace: "Trace | None" = None
+    ) -> tuple[str, str]:
+        """Queue one calculation on the loop and wait for its (display, message) pair."""
+        waiter = self._loop.create_future()
+        entry = ({"op": operation, "a": first_number, "b": second_number}, waiter)
+        self.calls += 1
+        if trace is not None:
+            self._start_send([entry], trace)
+            return await waiter
+
+        self._queue.append(entry)
+        if len(self._queue) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = self._loop.call_later(self.batch_window, self._flush)
+
+        try:
+            return await waiter
+        except asyncio.CancelledError:
+            # Still queued: take it out so it is never sent.
+            queued = len(self._queue)
+            self._queue = [entry for entry in self._queue if entry[1] is not waiter]
+            self.withdrawn += queued - len(self._queue)
+            raise
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._queue = self._queue, []
+        if batch:
+            self._start_send(batch)
+
+    def _start_send(self, batch: list[tuple[dict, asyncio.Future]], trace: "Trace | None" = None) -> None:
+        task = self._loop.create_task(self._send(batch, trace))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    def _post(self, items: list[dict], trace: "Trace | None" = None) -> list[tuple[str, str]]:
+        if len(items) == 1:
+            item = items[0]
+            status, payload = self.client.calculate(item["op"], item["a"], item["b"], trace)
+            return [interpret_response(status, payload)]
+
+        status, payload = self.client.batch(items)
+        if status >= 400:
+            return [interpret_response(status, payload)] * len(items)
+
+        results = payload["results"]
+        if len(results) != len(items):
+            raise ValueError("Batch response does not match the request.")
+        return [interpret_response(400 if "error" in result else 200, result) for result in results]
+
+    async def _send(self, batch: list[tuple[dict, asyncio.Future]], trace: "Trace | None" = None) -> None:
+        self.requests += 1
+        try:
+            results = await self._loop.run_in_executor(self._executor, self._post, [item for item, _ in batch], trace)
+        except Exception as error:
+            results = [_failure(error)] * len(batch)
+
+        for (_, waiter), result in zip(batch, results):
+            if not waiter.done():
+                waiter.set_result(result)
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "requests": self.requests, "withdrawn": self.withdrawn}
+
+    def shutdown(self) -> None:
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._executor.shutdown(wait=True)
+        self._loop.close()
@@ -0,0 +1,228 @@
+"""Pooled keep-alive HTTP client for the calculator API.
+
+One CalcClient keeps a bounded pool of persistent HTTP/1.1 connections, so
+repeated calls skip TCP connection setup. get_client() returns a process-wide
+client shared by every Streamlit session and batch script.
+
+Only attempts that cannot have reached the API are retried, and every retry
+counts against CALC_API_RETRIES. A connection that fails to open is retried
+with exponential backoff. A request on a pooled connection that the server
+closed while it was idle fails with a reset or disconnect before any
+response byte arrives; it is resent at once on a fresh connection. Timeouts
+are never retried, so a slow API costs one call at most one timeout.
+
+When the API sheds load (503) or rate-limits (429), the client waits for the
+Retry-After delay and retries if that fits in its retry budget. Otherwise it
+raises CalcAPIBusy at once, and keeps failing fast until the delay has passed
+instead of adding to the overload.
+
+Environment:
+    CALC_API_URL      Base URL of the API (default http://127.0.0.1:5000).
+    CALC_API_TIMEOUT  Per-request socket timeout in seconds (default 5).
+    CALC_API_RETRIES  Retries after a failed attempt (default 2).
+    CALC_API_MAX_RETRY_WAIT  Longest Retry-After delay worth waiting for, in
+                      seconds (default 1).
+"""
+
+import http.client
+import os
+import queue
+import threading
+import time
+from json import dumps, loads
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+# Tracing is opt-in; calc_trace (and the logging it pulls in) loads only for traced calls.
+if TYPE_CHECKING:
+    from calc_trace import Trace
+
+
+API_BASE_URL = os.environ.get("CALC_API_URL", "http://127.0.0.1:5000")
+DEFAULT_TIMEOUT = float(os.environ.get("CALC_API_TIMEOUT", "5"))
+DEFAULT_RETRIES = int(os.environ.get("CALC_API_RETRIES", "2"))
+DEFAULT_MAX_RETRY_WAIT = float(os.environ.get("CALC_API_MAX_RETRY_WAIT", "1"))
+BUSY_STATUSES = frozenset({429, 503})
+# How a keep-alive connection the server has closed fails on its next request.
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+JSON_HEADERS = {"Content-Type": "application/json", "Connection": "keep-alive"}
+
+
+class CalcAPIUnavailable(Exception):
+    """Raised when the API cannot be reached after all retries."""
+
+
+class CalcAPIBusy(CalcAPIUnavailable):
+    """Raised when the API is overloaded or rate-limiting this client.
+
+    Attributes:
+        retry_after: Seconds to wait before calling again.
+    """
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(f"The calculator API is busy; retry in {retry_after:.1f} s.")
+
+
+def is_retryable(error: Exception, connected: bool, reused: bool) -> bool:
+    """Return True if a failed attempt certainly did not reach the API and may be resent."""
+    if isinstance(error, TimeoutError):
+        return False
+    if not connected:
+        return True
+    return reused and isinstance(error, STALE_CONNECTION_ERRORS)
+
+
+def parse_retry_after(value: str | None, default: float) -> float:
+    """Return a Retry-After header in seconds; HTTP dates and junk fall back to default."""
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return default
+
+
+class CalcClient:
+    def __init__(
+        self,
+        base_url: str = API_BASE_URL,
+        pool_size: int = 8,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = 0.05,
+        max_retry_wait: float = DEFAULT_MAX_RETRY_WAIT,
+    ) -> None:
+        parts = urlsplit(base_url)
+        self.host = parts.hostname or "127.0.0.1"
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_retry_wait = max_retry_wait
+        self._busy_until = 0.0
+        self._pool: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue(maxsize=pool_size)
+        self.connections_opened = 0
+
+    def _acquire(self) -> tuple[http.client.HTTPConnection, bool]:
+        try:
+            return self._pool.get_nowait(), True
+        except queue.Empty:
+            self.connections_opened += 1
+            return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout), False
+
+    def _release(self, connection: http.client.HTTPConnection) -> None:
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def request(self, method: str, path: str, payload=None, trace: "Trace | None" = None) -> tuple[int, object]:
+        """Send a request and return (status, decoded JSON body or None).
+
+        With a trace, the request carries its ID in the X-Calc-Trace-Id header
+        and records client.connect (new connections only) and client.request spans.
+
+        Raises:
+            CalcAPIBusy: If the API keeps answering 429/503, or asked for a
+                pause that has not yet passed.
+            CalcAPIUnavailable: If every attempt fails to connect or read a response.
+        """
+        remaining = self._busy_until - time.monotonic()
+        if remaining > 0:
+            raise CalcAPIBusy(remaining)
+
+        body = None if payload is None else dumps(payload).encode("utf-8")
+        headers = JSON_HEADERS
+        if trace is not None:
+            try:
+                from day5.calc_trace import TRACE_HEADER
+            except ModuleNotFoundError:
+                from calc_trace import TRACE_HEADER
+            headers = {**JSON_HEADERS, TRACE_HEADER: trace.trace_id}
+        attempt = 0
+        while True:
+            connection, reused = self._acquire()
+            connected = connection.sock is not None
+            response = None
+            try:
+                if not connected:
+                    if trace is not None:
+                        with trace.span("client.connect"):
+                            connection.connect()
+                    else:
+                        connection.connect()
+                    connected = True
+                started = time.perf_counter()
+                connection.request(method, self.prefix + path, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+                if trace is not None:
+                    trace.record("client.request", started, time.perf_counter())
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                # Once a response has started, the API has seen the request.
+                if response is not None or not is_retryable(error, connected, reused):
+                    raise CalcAPIUnavailable(str(error)) from error
+                if connected and reused:
+                    # The API dropped its idle connections (a restart or idle timeout), so the
+                    # rest of the pool is stale too. Empty it and resend on a new connection;
+                    # this does not spend a retry, as a new connection never takes this path.
+                    self.close()
+                    continue
+                if attempt >= self.retries:
+                    raise CalcAPIUnavailable(str(error)) from error
+                if not connected:
+                    time.sleep(self.backoff * (2**attempt))
+                attempt += 1
+                continue
+
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+
+            if response.status in BUSY_STATUSES:
+                retry_after = parse_retry_after(response.getheader("Retry-After"), self.backoff * (2**attempt))
+                if attempt < self.retries and retry_after <= self.max_retry_wait:
+                    time.sleep(retry_after)
+                    attempt += 1
+                    continue
+                self._busy_until = time.monotonic() + retry_after
+                raise CalcAPIBusy(retry_after)
+
+            try:
+                return response.status, loads(data.decode("utf-8"))
+            except ValueError:
+                return response.status, None
+
+    def post_json(self, path: str, payload, trace: "Trace | None" = None) -> tuple[int, object]:
+        return self.request("POST", path, payload, trace)
+
+    def calculate(
+        self, operation: str, first_number: float, second_number: float, trace: "Trace | None" = None
+    ) -> tuple[int, object]:
+        return self.post_json(f"/{operation}", {"a": first_number, "b": second_number}, trace)
+
+    def batch(self, items: list[dict]) -> tuple[int, object]:
+        return self.post_json("/batch", items)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+_shared_client: CalcClient | None = None
+_shared_client_lock = threading.Lock()
+
+
+def get_client() -> CalcClient:
+    """Return the process-wide client, creating it on first use."""
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = CalcClient()
+    return _shared_client
@@ -0,0 +1,191 @@
+"""Calculation history and a shared result cache for the Streamlit calculator.
+
+Both store a calculation as the same packed record rather than as strings:
+the operator and message as small codes, the operands and result as
+doubles. Display text is rebuilt with format_result when it is read, so a
+record costs a fixed number of bytes however the expression was typed.
+
+SessionHistory keeps one session's last N calculations in a ring buffer of
+preallocated arrays: HISTORY_ENTRY_BYTES per entry, allocated once, so a
+session's history never grows past its capacity.
+
+ExpressionCache is a process-wide LRU (result_cache.ResultCache) of results
+keyed by (operator, a, b), bounded by a byte budget instead of an entry
+count. Only results that depend on the expression alone are cached:
+successful results and domain errors such as division by zero, never
+transport errors.
+
+Environment:
+    CALC_HISTORY_SIZE     Calculations kept per session (default 20).
+    CALC_UI_CACHE_BYTES   Memory ceiling of the shared cache in bytes
+                          (default 1048576; 0, or too little for one
+                          entry, disables the cache).
+"""
+
+import math
+import os
+import struct
+from array import array
+
+try:
+    from day5 import calc_path  # noqa: F401
+    from day5.calc_modes import (
+        API_BUSY_MESSAGE,
+        API_UNEXPECTED_MESSAGE,
+        API_UNREACHABLE_MESSAGE,
+        CALCULATION_FAILED_MESSAGE,
+        format_result,
+    )
+    from day5.result_cache import ResultCache
+except ModuleNotFoundError:
+    import calc_path  # noqa: F401
+    from calc_modes import (
+        API_BUSY_MESSAGE,
+        API_UNEXPECTED_MESSAGE,
+        API_UNREACHABLE_MESSAGE,
+        CALCULATION_FAILED_MESSAGE,
+        format_result,
+    )
+    from result_cache import ResultCache
+
+from calc_registry import DOMAIN_ERRORS, SYMBOLS  # noqa: E402
+
+
+HISTORY_SIZE = int(os.environ.get("CALC_HISTORY_SIZE", "20"))
+CACHE_BYTES = int(os.environ.get("CALC_UI_CACHE_BYTES", str(1024 * 1024)))
+
+# Codes are positions in these tables, so they only need to be stable within a process.
+OPERATORS = tuple(SYMBOLS)
+# Message code 0 is success and the registry's domain errors come next.
+# Messages outside this table are stored as CALCULATION_FAILED_MESSAGE.
+MESSAGES = (
+    "",
+    *DOMAIN_ERRORS,
+    CALCULATION_FAILED_MESSAGE,
+    API_UNREACHABLE_MESSAGE,
+    API_UNEXPECTED_MESSAGE,
+    API_BUSY_MESSAGE,
+)
+MESSAGE_CODES = {message: code for code, message in enumerate(MESSAGES)}
+CACHEABLE_CODES = frozenset(range(len(DOMAIN_ERRORS) + 1))
+
+# Two operands and a result as doubles, plus operator and message codes.
+HISTORY_ENTRY_BYTES = 3 * 8 + 2
+# Measured with tracemalloc for a full cache, including the LRU's dict slot,
+# timestamp and packed key and result, with headroom for dict resizing.
+CACHE_ENTRY_BYTES = 320
+
+CACHE_KEY = struct.Struct("<Bdd")
+CACHE_RESULT = struct.Struct("<d")
+
+
+def encode_result(display: str, message: str) -> tuple[float, int]:
+    """Return the (result, message code) record of a (display, message) pair."""
+    if message:
+        return math.nan, MESSAGE_CODES.get(message, MESSAGE_CODES[CALCULATION_FAILED_MESSAGE])
+    try:
+        return float(display), 0
+    except ValueError:
+        return math.nan, MESSAGE_CODES[CALCULATION_FAILED_MESSAGE]
+
+
+def decode_result(result: float, code: int) -> tuple[str, str]:
+    """Return the (display, message) pair of a stored record."""
+    if code:
+        return "Error", MESSAGES[code]
+    return format_result(result), ""
+
+
+def format_expression(operator: str, first_number: float, second_number: float) -> str:
+    return f"{format_result(first_number)}{operator}{format_result(second_number)}"
+
+
+class SessionHistory:
+    """Fixed-capacity ring buffer of one session's calculations."""
+
+    def __init__(self, capacity: int = HISTORY_SIZE) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+
+        self.capacity = capacity
+        self._operands = array("d", bytes(2 * 8 * capacity))
+        self._results = array("d", bytes(8 * capacity))
+        self._codes = array("B", bytes(2 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the entry arrays; fixed at capacity * HISTORY_ENTRY_BYTES."""
+        return sum(len(column) * column.itemsize for column in (self._operands, self._results, self._codes))
+
+    def append(self, operator: str, first_number: float, second_number: float, display: str, message: str) -> None:
+        """Record a calculation, overwriting the oldest one when full."""
+        slot = self._next
+        result, code = encode_result(display, message)
+        self._operands[2 * slot] = first_number
+        self._operands[2 * slot + 1] = second_number
+        self._results[slot] = result
+        self._codes[2 * slot] = OPERATORS.index(operator)
+        self._codes[2 * slot + 1] = code
+        self._next = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+
+    def entries(self) -> list[tuple[str, str]]:
+        """Return (expression, result) pairs, newest first; errors show their message."""
+        entries = []
+        for offset in range(1, self._size + 1):
+            slot = (self._next - offset) % self.capacity
+            expression = format_expression(
+                OPERATORS[self._codes[2 * slot]], self._operands[2 * slot], self._operands[2 * slot + 1]
+            )
+            display, message = decode_result(self._results[slot], self._codes[2 * slot + 1])
+            entries.append((expression, message or display))
+        return entries
+
+    def clear(self) -> None:
+        self._next = 0
+        self._size = 0
+
+
+class ExpressionCache:
+    """Process-wide LRU of calculation results with a memory ceiling in bytes."""
+
+    def __init__(self, max_bytes: int = CACHE_BYTES) -> None:
+        if max_bytes < CACHE_ENTRY_BYTES:
+            raise ValueError(f"max_bytes must be at least {CACHE_ENTRY_BYTES}.")
+
+        self.max_bytes = max_bytes
+        self._cache = ResultCache(maxsize=max_bytes // CACHE_ENTRY_BYTES)
+
+    def get(self, operator: str, first_number: float, second_number: float) -> tuple[str, str] | None:
+        """Return the cached (display, message) for the expression, or None on a miss."""
+        entry = self._cache.get(CACHE_KEY.pack(OPERATORS.index(operator), first_number, second_number))
+        if entry is None:
+            return None
+        body, code = entry
+        return decode_result(CACHE_RESULT.unpack(body)[0], code)
+
+    def put(self, operator: str, first_number: float, second_number: float, display: str, message: str) -> None:
+        """Cache a result unless it depends on more than the expression (transport errors)."""
+        result, code = encode_result(display, message)
+        if code in CACHEABLE_CODES:
+            key = CACHE_KEY.pack(OPERATORS.index(operator), first_number, second_number)
+            self._cache.put(key, CACHE_RESULT.pack(result), code)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict:
+        stats = self._cache.stats()
+        stats["max_bytes"] = self.max_bytes
+        stats["bytes"] = stats["size"] * CACHE_ENTRY_BYTES
+        return stats
+
+
+def create_expression_cache(max_bytes: int = CACHE_BYTES) -> ExpressionCache | None:
+    """Return an ExpressionCache, or None when max_bytes cannot hold a single entry."""
+    return ExpressionCache(max_bytes) if max_bytes >= CACHE_ENTRY_BYTES else None
@@ -0,0 +1,66 @@
+"""JSON encoding for the calculator API with an optional orjson backend.
+
+orjson is used when it is installed, unless CALC_JSON_BACKEND=stdlib; the
+stdlib json module is the fallback. Both backends write compact output with
+sorted keys, like Flask's jsonify. Both also keep the stdlib's handling of
+NaN and infinities (written as NaN/Infinity and accepted on input), so the
+API's responses mean the same thing whichever backend is active.
+"""
+
+import json
+import math
+import os
+
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
+
+BACKEND = "orjson" if orjson is not None and os.environ.get("CALC_JSON_BACKEND") != "stdlib" else "stdlib"
+MIMETYPE = "application/json"
+
+
+def _stdlib_dumps(obj) -> bytes:
+	return json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+if BACKEND == "orjson":
+
+	def dumps(obj) -> bytes:
+		try:
+			body = orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+		except TypeError:
+			return _stdlib_dumps(obj)
+		# orjson writes NaN and infinities as null; re-encode those payloads so
+		# they keep the stdlib spelling. None values take the same (correct) path.
+		return _stdlib_dumps(obj) if b"null" in body else body
+
+	def loads(data):
+		try:
+			return orjson.loads(data)
+		except orjson.JSONDecodeError:
+			# NaN/Infinity literals and non-UTF-8 bodies are stdlib extensions;
+			# the stdlib also raises the usual error for genuinely invalid JSON.
+			return json.loads(data)
+
+else:
+	dumps = _stdlib_dumps
+	loads = json.loads
+
+
+def encode_response(obj) -> bytes:
+	"""Return a response body, with the trailing newline jsonify adds."""
+	return dumps(obj) + b"\n"
+
+
+def encode_operation(operation: str, a: float, b: float, result: float) -> bytes:
+	"""Return the body of a single-operation response without building a dict.
+
+	The bytes are identical to encode_response({"operation": ..., "a": ...,
+	"b": ..., "result": ...}) on the stdlib backend, because JSON floats are
+	written with repr() there too.
+	"""
+	if math.isfinite(a) and math.isfinite(b) and math.isfinite(result):
+		return f'{{"a":{a!r},"b":{b!r},"operation":"{operation}","result":{result!r}}}\n'.encode()
+	return _stdlib_dumps({"operation": operation, "a": a, "b": b, "result": result}) + b"\n"
@@ -0,0 +1,109 @@
+"""Low-overhead request metrics rendered in the Prometheus text exposition format."""
+
+import threading
+from bisect import bisect_left
+
+
+# Latency bucket upper bounds in seconds; +Inf is implicit.
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+	return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_bound(bound: float) -> str:
+	return repr(bound) if bound != int(bound) else f"{bound:.1f}"
+
+
+class Histogram:
+	"""Fixed-bucket latency histogram; observe() is a bisect and two additions."""
+
+	__slots__ = ("bounds", "counts", "sum", "count")
+
+	def __init__(self, bounds: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+		self.bounds = bounds
+		self.counts = [0] * (len(bounds) + 1)
+		self.sum = 0.0
+		self.count = 0
+
+	def observe(self, value: float) -> None:
+		self.counts[bisect_left(self.bounds, value)] += 1
+		self.sum += value
+		self.count += 1
+
+	def cumulative(self) -> list[tuple[str, int]]:
+		total = 0
+		buckets = []
+		for bound, count in zip((*self.bounds, None), self.counts):
+			total += count
+			buckets.append(("+Inf" if bound is None else _format_bound(bound), total))
+		return buckets
+
+
+class MetricsRegistry:
+	"""Per-endpoint request counters, error counters by cause and latency histograms."""
+
+	def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+		self.buckets = buckets
+		self._lock = threading.Lock()
+		self._requests: dict[tuple[str, str, int], int] = {}
+		self._errors: dict[tuple[str, str], int] = {}
+		self._latency: dict[str, Histogram] = {}
+
+	def observe(self, endpoint: str, method: str, status: int, seconds: float, cause: str | None = None) -> None:
+		request_key = (endpoint, method, status)
+		with self._lock:
+			self._requests[request_key] = self._requests.get(request_key, 0) + 1
+			if cause is not None:
+				error_key = (endpoint, cause)
+				self._errors[error_key] = self._errors.get(error_key, 0) + 1
+
+			histogram = self._latency.get(endpoint)
+			if histogram is None:
+				histogram = self._latency[endpoint] = Histogram(self.buckets)
+			histogram.observe(seconds)
+
+	def reset(self) -> None:
+		with self._lock:
+			self._requests.clear()
+			self._errors.clear()
+			self._latency.clear()
+
+	def render(self) -> str:
+		"""Return all metrics in the Prometheus text exposition format."""
+		with self._lock:
+			requests = sorted(self._requests.items())
+			errors = sorted(self._errors.items())
+			latency = sorted(
+				(endpoint, histogram.cumulative(), histogram.sum, histogram.count)
+				for endpoint, histogram in self._latency.items()
+			)
+
+		lines = [
+			"# HELP calc_requests_total Total HTTP requests by endpoint, method and status.",
+			"# TYPE calc_requests_total counter",
+		]
+		for (endpoint, method, status), count in requests:
+			lines.append(f'calc_requests_total{{endpoint="{_escape(endpoint)}",method="{method}",status="{status}"}} {count}')
+
+		lines += [
+			"# HELP calc_request_errors_total Error responses by endpoint and cause.",
+			"# TYPE calc_request_errors_total counter",
+		]
+		for (endpoint, cause), count in errors:
+			lines.append(f'calc_request_errors_total{{endpoint="{_escape(endpoint)}",cause="{cause}"}} {count}')
+
+		lines += [
+			"# HELP calc_request_duration_seconds Request handling latency by endpoint.",
+			"# TYPE calc_request_duration_seconds histogram",
+		]
+		for endpoint, buckets, total, count in latency:
+			label = _escape(endpoint)
+			for bound, cumulative in buckets:
+				lines.append(f'calc_request_duration_seconds_bucket{{endpoint="{label}",le="{bound}"}} {cumulative}')
+			lines.append(f'calc_request_duration_seconds_sum{{endpoint="{label}"}} {total!r}')
+			lines.append(f'calc_request_duration_seconds_count{{endpoint="{label}"}} {count}')
+
+		return "\n".join(lines) + "\n"
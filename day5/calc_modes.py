@@ -0,0 +1,152 @@
+"""Evaluation policies for the Streamlit calculator.
+
+The UI can evaluate binary expressions through the API, in-process with the
+validated functions from day2/calc.py, or in-process with an asynchronous
+cross-check against the API. Every mode returns the same (display, message)
+pair and result formatting as call_math_api.
+
+Modes (CALC_MODE environment variable):
+    remote       Always call the API (default).
+    local        Evaluate in-process; fall back to the API only if local
+                 evaluation fails unexpectedly.
+    local-audit  Evaluate in-process and re-check each result against the
+                 API on a background thread, logging any mismatch.
+"""
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+
+# calc_path puts the day2 calculator library on sys.path.
+try:
+    from day5 import calc_path  # noqa: F401
+except ModuleNotFoundError:
+    import calc_path  # noqa: F401
+
+from calc_registry import DIVISION_BY_ZERO_ERROR, REGISTRY  # noqa: E402
+
+
+REMOTE_MODE = "remote"
+LOCAL_MODE = "local"
+AUDIT_MODE = "local-audit"
+MODES = (REMOTE_MODE, LOCAL_MODE, AUDIT_MODE)
+
+DIVISION_BY_ZERO_MESSAGE = DIVISION_BY_ZERO_ERROR
+API_UNREACHABLE_MESSAGE = "Flask API is not reachable. Please start day5_flask_cals.py."
+API_UNEXPECTED_MESSAGE = "Unexpected error while calling Flask API."
+API_BUSY_MESSAGE = "The calculator is busy. Please try again in a moment."
+CALCULATION_FAILED_MESSAGE = "Calculation failed."
+TRANSPORT_ERROR_MESSAGES = {API_UNREACHABLE_MESSAGE, API_UNEXPECTED_MESSAGE, API_BUSY_MESSAGE}
+
+# Validated calc.py functions and domain checks by UI operator, from calc_registry.
+LOCAL_OPERATIONS = {operation.symbol: operation.function for operation in REGISTRY.values()}
+LOCAL_CHECKS = {operation.symbol: operation.check for operation in REGISTRY.values() if operation.check is not None}
+
+logger = logging.getLogger(__name__)
+
+RemoteCall = Callable[[str, float, float], tuple[str, str]]
+
+
+def resolve_mode(value: str | None) -> str:
+    """Return a valid mode name, defaulting to remote for unset or unknown values."""
+    mode = (value or REMOTE_MODE).strip().lower()
+    if mode not in MODES:
+        logger.warning("Unknown CALC_MODE %r; using %r.", value, REMOTE_MODE)
+        return REMOTE_MODE
+    return mode
+
+
+def format_result(result) -> str:
+    """Format a numeric result the way the calculator display shows it."""
+    if isinstance(result, float) and result.is_integer():
+        return str(int(result))
+    return str(result)
+
+
+def interpret_response(status: int, payload) -> tuple[str, str]:
+    """Turn an API status and decoded body (or one batch item) into (display, message)."""
+    if status >= 400:
+        if isinstance(payload, dict):
+            return "Error", payload.get("error", CALCULATION_FAILED_MESSAGE)
+        return "Error", CALCULATION_FAILED_MESSAGE
+
+    try:
+        return format_result(payload.get("result")), ""
+    except Exception:
+        return "Error", API_UNEXPECTED_MESSAGE
+
+
+def calculate_locally(operator: str, first_number: float, second_number: float) -> tuple[str, str]:
+    """Evaluate one binary operation in-process with the API's error messages."""
+    check = LOCAL_CHECKS.get(operator)
+    if check is not None:
+        error = check(first_number, second_number)
+        if error is not None:
+            return "Error", error
+    return format_result(LOCAL_OPERATIONS[operator](first_number, second_number)), ""
+
+
+class ResultAuditor:
+    """Cross-check local results against the API on a background thread."""
+
+    def __init__(self, remote_call: RemoteCall, max_workers: int = 2) -> None:
+        self.remote_call = remote_call
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="calc-audit")
+        self._lock = threading.Lock()
+        self.checked = 0
+        self.mismatches = 0
+        self.unavailable = 0
+
+    def submit(self, operator: str, first_number: float, second_number: float, local: tuple[str, str]):
+        return self._executor.submit(self._check, operator, first_number, second_number, local)
+
+    def _check(self, operator: str, first_number: float, second_number: float, local: tuple[str, str]) -> None:
+        remote = self.remote_call(operator, first_number, second_number)
+        with self._lock:
+            # Transport failures say nothing about correctness; count them separately.
+            if remote[1] in TRANSPORT_ERROR_MESSAGES:
+                self.unavailable += 1
+                return
+
+            self.checked += 1
+            if remote != local:
+                self.mismatches += 1
+                logger.warning(
+                    "Local result %r differs from API result %r for %s %s %s.",
+                    local,
+                    remote,
+                    first_number,
+                    operator,
+                    second_number,
+                )
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"checked": self.checked, "mismatches": self.mismatches, "unavailable": self.unavailable}
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+
+def evaluate_with_policy(
+    mode: str,
+    operator: str,
+    first_number: float,
+    second_number: float,
+    remote_call: RemoteCall,
+    auditor: ResultAuditor | None = None,
+) -> tuple[str, str]:
+    """Evaluate one binary operation according to the configured mode."""
+    if mode == REMOTE_MODE:
+        return remote_call(operator, first_number, second_number)
+
+    try:
+        local = calculate_locally(operator, first_number, second_number)
+    except Exception:
+        logger.exception("Local evaluation failed; falling back to the API.")
+        return remote_call(operator, first_number, second_number)
+
+    if mode == AUDIT_MODE and auditor is not None:
+        auditor.submit(operator, first_number, second_number, local)
+    return local
@@ -0,0 +1,20 @@
+"""Make the day2 calculator library importable from day5.
+
+day2 holds plain modules (calc.py, calc_numeric.py, calc_registry.py, ...)
+that import each other by top-level name, so its folder is added to
+sys.path rather than imported as a package. Every day5 module that imports
+from day2 imports this module first, explicitly:
+
+	try:
+		from day5 import calc_path  # noqa: F401
+	except ModuleNotFoundError:
+		import calc_path  # noqa: F401
+"""
+
+import sys
+from pathlib import Path
+
+
+CALC_DIR = Path(__file__).resolve().parent.parent / "day2"
+if str(CALC_DIR) not in sys.path:
+	sys.path.append(str(CALC_DIR))
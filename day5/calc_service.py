@@ -0,0 +1,268 @@
+"""Framework-independent operation handling shared by the calculator API routes."""
+
+from collections.abc import Iterable, Iterator
+
+# calc_path puts the day2 calculator library on sys.path.
+try:
+	from day5 import calc_path  # noqa: F401
+	from day5.calc_json import encode_response, loads
+except ModuleNotFoundError:
+	import calc_path  # noqa: F401
+	from calc_json import encode_response, loads
+
+from calc_expression import evaluate as evaluate_expression  # noqa: E402
+from calc_numeric import OPERATIONS as EXACT_OPERATIONS  # noqa: E402
+from calc_numeric import calculate as calculate_numeric  # noqa: E402
+from calc_numeric import format_number  # noqa: E402
+from calc_registry import DIVISION_BY_ZERO_ERROR, DOMAIN_CHECKS, REGISTRY, SCALAR_KERNELS  # noqa: E402
+
+
+INVALID_INPUT_ERROR = "Please provide numeric 'a' and 'b'."
+UNKNOWN_OPERATION_ERROR = f"Unknown operation. Use one of: {', '.join(REGISTRY)}."
+INVALID_BATCH_ERROR = "Please provide a list of {op, a, b} items or {op, a: [...], b: [...]}."
+BATCH_LENGTH_ERROR = "Columns 'a' and 'b' must have the same length."
+INVALID_RECORD_ERROR = "Each line must be a JSON object with 'op', 'a' and 'b'."
+RECORD_TOO_LONG_ERROR = "Record exceeds the maximum line length."
+INVALID_EXPRESSION_ERROR = "Please provide an 'expression' string."
+INVALID_VALUES_ERROR = "Please provide a 'values' list of numbers."
+INVALID_MODE_ERROR = "mode must be one of: float, decimal, fraction."
+OVERLOADED_ERROR = "The calculator is busy. Please retry shortly."
+RATE_LIMITED_ERROR = "Too many requests. Please slow down."
+MAX_BATCH_ITEMS = 10_000
+MAX_RECORD_BYTES = 4096
+MAX_REDUCE_ITEMS = 1_000_000
+STREAM_CHUNK_BYTES = 64 * 1024
+
+API_DESCRIPTION = {
+	"message": "Calculator API",
+	"endpoints": [
+		*(f"POST /{operation}" for operation in REGISTRY),
+		*("POST /batch", "POST /stream", "POST /eval", "POST /sum", "POST /product", "POST /mean"),
+	],
+	"input": {"a": "number", "b": "number", "mode": "float (default), decimal or fraction"},
+}
+
+# Kernels of the registered operations (calc_registry), for checked float operands.
+OPERATIONS = SCALAR_KERNELS
+
+REDUCTIONS = {
+	"sum": "reduce_sum",
+	"product": "reduce_product",
+	"mean": "reduce_mean",
+}
+
+
+def parse_pair(first, second) -> tuple[float, float] | tuple[None, None]:
+	# JSON floats decode to exact float, which needs no conversion.
+	if type(first) is float and type(second) is float:
+		return first, second
+	try:
+		return float(first), float(second)
+	# JSON integers are unbounded, and float() of one past 1.8e308 overflows.
+	except (TypeError, ValueError, OverflowError):
+		return None, None
+
+
+def check_operation(operation: str, first, second) -> tuple[float, float, None] | tuple[None, None, str]:
+	"""Validate one operation's input and return (a, b, None) or (None, None, error message)."""
+	if not isinstance(operation, str) or operation not in OPERATIONS:
+		return None, None, UNKNOWN_OPERATION_ERROR
+
+	a, b = parse_pair(first, second)
+	if a is None:
+		return None, None, INVALID_INPUT_ERROR
+	check = DOMAIN_CHECKS.get(operation)
+	if check is not None:
+		error = check(a, b)
+		if error is not None:
+			return None, None, error
+
+	return a, b, None
+
+
+def compute(operation: str, first, second) -> dict:
+	"""Evaluate one operation and return its response payload.
+
+	Invalid input is reported as an {"error": ...} payload with the same
+	messages as the single-operation routes.
+	"""
+	a, b, error = check_operation(operation, first, second)
+	if error is not None:
+		return {"error": error}
+
+	return {"operation": operation, "a": a, "b": b, "result": OPERATIONS[operation](a, b)}
+
+
+def compute_exact(operation: str, payload: dict, context=None) -> tuple[dict, int]:
+	"""Evaluate an {"a", "b", "mode"} payload with the decimal or fraction backend.
+
+	Operands may be JSON numbers or numeric strings; strings are the only way
+	to pass digits a float cannot hold. The result is returned as a string
+	(a decimal, or p/q for fractions) so JSON decoding cannot round it.
+	"""
+	mode = payload.get("mode")
+	if mode not in ("decimal", "fraction"):
+		return {"error": INVALID_MODE_ERROR}, 400
+	if operation not in EXACT_OPERATIONS:
+		return {"error": f"{operation} does not support the decimal and fraction modes."}, 400
+
+	first, second = payload.get("a"), payload.get("b")
+	try:
+		result = calculate_numeric(operation, first, second, mode, context)
+	except ZeroDivisionError as error:
+		# Division keeps the float route's message; pow's already matches calc_registry.
+		return {"error": DIVISION_BY_ZERO_ERROR if operation == "div" else str(error)}, 400
+	except (TypeError, ValueError) as error:
+		return {"error": str(error)}, 400
+
+	return {"operation": operation, "mode": mode, "a": first, "b": second, "result": format_number(result)}, 200
+
+
+def compute_expression(payload) -> tuple[dict, int]:
+	"""Evaluate an {"expression": "..."} payload and return the body and status code."""
+	expression = payload.get("expression") if isinstance(payload, dict) else None
+	if not isinstance(expression, str):
+		return {"error": INVALID_EXPRESSION_ERROR}, 400
+
+	try:
+		result = evaluate_expression(expression)
+	except ZeroDivisionError:
+		return {"error": DIVISION_BY_ZERO_ERROR}, 400
+	except ValueError as error:
+		return {"error": str(error)}, 400
+
+	return {"expression": expression, "result": result}, 200
+
+
+def compute_reduction(operation: str, payload) -> tuple[dict, int]:
+	"""Reduce a {"values": [...], "mode": "pairwise"} payload and return the body and status code."""
+	values = payload.get("values") if isinstance(payload, dict) else None
+	if not isinstance(values, list):
+		return {"error": INVALID_VALUES_ERROR}, 400
+	if len(values) > MAX_REDUCE_ITEMS:
+		return {"error": f"Reductions are limited to {MAX_REDUCE_ITEMS} values."}, 413
+
+	# calc_reduce needs NumPy, so it is imported on the first reduction, not at startup.
+	import calc_reduce
+
+	mode = payload.get("mode", "pairwise")
+	try:
+		result = getattr(calc_reduce, REDUCTIONS[operation])(values, mode=mode)
+	except (TypeError, ValueError) as error:
+		return {"error": str(error)}, 400
+
+	return {"operation": operation, "mode": mode, "count": len(values), "result": result}, 200
+
+
+def evaluate_batch(payload) -> tuple[dict, int]:
+	"""Evaluate a batch payload and return the response body and status code.
+
+	Accepts either a list of {"op", "a", "b"} items or the columnar form
+	{"op": "add", "a": [...], "b": [...]}. Item-level failures are returned in
+	place and do not fail the whole batch.
+	"""
+	if isinstance(payload, list):
+		items = payload
+		if len(items) > MAX_BATCH_ITEMS:
+			return {"error": f"Batch size is limited to {MAX_BATCH_ITEMS} items."}, 413
+
+		results = [
+			compute(item.get("op"), item.get("a"), item.get("b"))
+			if isinstance(item, dict)
+			else {"error": INVALID_INPUT_ERROR}
+			for item in items
+		]
+	elif isinstance(payload, dict) and isinstance(payload.get("a"), list) and isinstance(payload.get("b"), list):
+		first_column = payload["a"]
+		second_column = payload["b"]
+		if len(first_column) != len(second_column):
+			return {"error": BATCH_LENGTH_ERROR}, 400
+		if len(first_column) > MAX_BATCH_ITEMS:
+			return {"error": f"Batch size is limited to {MAX_BATCH_ITEMS} items."}, 413
+
+		operation = payload.get("op")
+		results = [compute(operation, first, second) for first, second in zip(first_column, second_column)]
+	else:
+		return {"error": INVALID_BATCH_ERROR}, 400
+
+	errors = sum(1 for result in results if "error" in result)
+	return {"count": len(results), "errors": errors, "results": results}, 200
+
+
+class RecordSplitter:
+	"""Incrementally split byte chunks into newline-delimited records.
+
+	Memory is bounded by MAX_RECORD_BYTES: a line that grows past it is
+	discarded up to its newline and reported once as None so callers can emit
+	an error in its place.
+	"""
+
+	def __init__(self) -> None:
+		self._buffer = bytearray()
+		self._discarding = False
+
+	def feed(self, chunk: bytes) -> list[bytes | None]:
+		records = []
+		self._buffer += chunk
+
+		while True:
+			newline = self._buffer.find(b"\n")
+			if newline < 0:
+				break
+
+			line = bytes(self._buffer[:newline]).strip()
+			del self._buffer[: newline + 1]
+			if self._discarding:
+				self._discarding = False
+			elif len(line) > MAX_RECORD_BYTES:
+				records.append(None)
+			elif line:
+				records.append(line)
+
+		if len(self._buffer) > MAX_RECORD_BYTES:
+			if not self._discarding:
+				records.append(None)
+				self._discarding = True
+			self._buffer.clear()
+
+		return records
+
+	def close(self) -> list[bytes | None]:
+		"""Return the final record if the stream did not end with a newline."""
+		records = [] if self._discarding else self.feed(b"\n")
+		self._buffer.clear()
+		self._discarding = False
+		return records
+
+
+def evaluate_record(line: bytes | None) -> bytes:
+	"""Evaluate one NDJSON {"op", "a", "b"} record and return its result line."""
+	if line is None:
+		result = {"error": RECORD_TOO_LONG_ERROR}
+	else:
+		try:
+			record = loads(line)
+		except ValueError:
+			record = None
+
+		if isinstance(record, dict):
+			result = compute(record.get("op"), record.get("a"), record.get("b"))
+		else:
+			result = {"error": INVALID_RECORD_ERROR}
+
+	return encode_response(result)
+
+
+def evaluate_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+	"""Evaluate a stream of NDJSON records and yield NDJSON result lines.
+
+	Records are read and answered one at a time, so memory use does not grow
+	with the length of the stream.
+	"""
+	splitter = RecordSplitter()
+	for chunk in chunks:
+		for record in splitter.feed(chunk):
+			yield evaluate_record(record)
+
+	for record in splitter.close():
+		yield evaluate_record(record)
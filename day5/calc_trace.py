@@ -0,0 +1,219 @@
+"""Opt-in request tracing and sampling profiles for the calculator.
+
+A trace is one "=" press followed from the Streamlit callback through
+CalcClient to the Flask handler. The UI creates the trace ID and CalcClient
+sends it in the X-Calc-Trace-Id header. Each hop records timed spans under
+that ID:
+
+	ui.callback, ui.wait                      Streamlit (day5_streamlit_cals.py)
+	client.connect, client.request            CalcClient
+	request, parse_numbers, calc.<function>,  Flask handler and the calc.py
+	serialize                                 function it calls
+
+Finished traces are logged one span per line at INFO on this module's
+logger. The Flask app also keeps the most recent ones for GET /trace/<id>
+and returns its spans in a Server-Timing header.
+
+EndpointProfiler runs cProfile on one request in every N and merges the
+profiles per route, to be dumped on demand as text or .prof files.
+
+Both are off unless configured. Disabled, each hook is one config lookup
+and code paths call the shared NULL_SPAN.
+"""
+
+import io
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import nullcontext
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+# cProfile and pstats are imported on first use; they are not needed unless profiling is on.
+if TYPE_CHECKING:
+	import cProfile
+	import pstats
+
+
+TRACE_HEADER = "X-Calc-Trace-Id"
+TRACE_ID_PATTERN = re.compile(r"^[0-9A-Za-z-]{1,64}$")
+NULL_SPAN = nullcontext()
+
+logger = logging.getLogger(__name__)
+
+
+def new_trace_id() -> str:
+	return os.urandom(8).hex()
+
+
+def valid_trace_id(value: str | None) -> str | None:
+	"""Return value if it is a usable trace ID; header values are untrusted."""
+	if value is not None and TRACE_ID_PATTERN.match(value):
+		return value
+	return None
+
+
+class _Span:
+	__slots__ = ("trace", "name", "started")
+
+	def __init__(self, trace: "Trace", name: str) -> None:
+		self.trace = trace
+		self.name = name
+
+	def __enter__(self) -> None:
+		self.started = time.perf_counter()
+
+	def __exit__(self, *exc_info) -> None:
+		self.trace.record(self.name, self.started, time.perf_counter())
+
+
+class Trace:
+	"""Spans recorded under one trace ID, timed relative to the trace start."""
+
+	__slots__ = ("trace_id", "started", "spans")
+
+	def __init__(self, trace_id: str | None = None) -> None:
+		self.trace_id = trace_id or new_trace_id()
+		self.started = time.perf_counter()
+		self.spans: list[tuple[str, float, float]] = []
+
+	def span(self, name: str) -> _Span:
+		"""Return a context manager that records the time spent inside it as name."""
+		return _Span(self, name)
+
+	def record(self, name: str, started: float, ended: float) -> None:
+		self.spans.append((name, started - self.started, ended - started))
+
+	def server_timing(self) -> str:
+		"""Return the spans as a Server-Timing header value (durations in ms)."""
+		return ", ".join(f"{name};dur={duration * 1000:.3f}" for name, _, duration in self.spans)
+
+	def as_dict(self) -> dict:
+		return {
+			"trace_id": self.trace_id,
+			"spans": [
+				{"name": name, "start_ms": round(offset * 1000, 3), "duration_ms": round(duration * 1000, 3)}
+				for name, offset, duration in self.spans
+			],
+		}
+
+	def log(self) -> None:
+		for name, offset, duration in self.spans:
+			logger.info(
+				"trace=%s span=%s start_ms=%.3f duration_ms=%.3f", self.trace_id, name, offset * 1000, duration * 1000
+			)
+
+
+class Tracer:
+	"""Keeps the last `capacity` finished traces and logs each one."""
+
+	def __init__(self, capacity: int = 1000) -> None:
+		if capacity <= 0:
+			raise ValueError("capacity must be positive.")
+
+		self.capacity = capacity
+		self._traces: OrderedDict[str, Trace] = OrderedDict()
+		self._lock = threading.Lock()
+
+	def finish(self, trace: Trace) -> None:
+		trace.log()
+		with self._lock:
+			# A batch from the UI may reuse an ID; keep its latest trace.
+			self._traces.pop(trace.trace_id, None)
+			self._traces[trace.trace_id] = trace
+			if len(self._traces) > self.capacity:
+				self._traces.popitem(last=False)
+
+	def get(self, trace_id: str) -> dict | None:
+		with self._lock:
+			trace = self._traces.get(trace_id)
+			return trace.as_dict() if trace is not None else None
+
+
+class EndpointProfiler:
+	"""cProfile one request in every `every`, with profiles merged per endpoint.
+
+	Only one request is profiled at a time; a sampled request that arrives
+	while another is being profiled is skipped rather than queued.
+	"""
+
+	def __init__(self, every: int = 100) -> None:
+		if every <= 0:
+			raise ValueError("every must be positive.")
+
+		self.every = every
+		self._requests = 0
+		self._active = threading.Lock()
+		self._lock = threading.Lock()
+		self._stats: dict[str, "pstats.Stats"] = {}
+		self._samples: dict[str, int] = {}
+
+	def start(self) -> "cProfile.Profile | None":
+		"""Return a running profiler if this request is sampled, else None."""
+		with self._lock:
+			self._requests += 1
+			if self._requests % self.every:
+				return None
+		if not self._active.acquire(blocking=False):
+			return None
+
+		import cProfile
+
+		profile = cProfile.Profile()
+		try:
+			profile.enable()
+		except ValueError:
+			# Another profiling tool already owns the interpreter's hook.
+			self._active.release()
+			return None
+		return profile
+
+	def stop(self, profile: "cProfile.Profile", endpoint: str) -> None:
+		import pstats
+
+		profile.disable()
+		self._active.release()
+		with self._lock:
+			if endpoint in self._stats:
+				self._stats[endpoint].add(profile)
+			else:
+				self._stats[endpoint] = pstats.Stats(profile)
+			self._samples[endpoint] = self._samples.get(endpoint, 0) + 1
+
+	def samples(self) -> dict[str, int]:
+		with self._lock:
+			return dict(self._samples)
+
+	def report(self, endpoint: str, limit: int = 30) -> str | None:
+		"""Return the endpoint's merged profile as pstats text, by cumulative time."""
+		import pstats
+
+		with self._lock:
+			stats = self._stats.get(endpoint)
+			if stats is None:
+				return None
+			output = io.StringIO()
+			stats.stream = output
+			stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(limit)
+		return output.getvalue()
+
+	def dump(self, directory: str | Path) -> list[Path]:
+		"""Write one .prof file per endpoint (readable by pstats or snakeviz) and return the paths."""
+		directory = Path(directory)
+		directory.mkdir(parents=True, exist_ok=True)
+		paths = []
+		with self._lock:
+			for endpoint, stats in self._stats.items():
+				name = re.sub(r"[^0-9A-Za-z]+", "_", endpoint).strip("_") or "root"
+				path = directory / f"{name}.prof"
+				stats.dump_stats(path)
+				paths.append(path)
+		return paths
+
+	def reset(self) -> None:
+		with self._lock:
+			self._stats.clear()
+			self._samples.clear()
@@ -0,0 +1,161 @@
+"""Compact binary framing for high-frequency calculator calls.
+
+Every frame starts with an 8-byte little-endian header: a u32 request id
+chosen by the client, then a u32 record count.
+
+	request record   op code (u8), a (f64), b (f64)     17 bytes
+	response record  status (u8), result (f64)          9 bytes
+
+A frame may hold 1 to MAX_FRAME_RECORDS records. Responses reuse the request
+id and come back in request order, so clients can pipeline many frames on
+one connection. sqrt ignores b. A record that fails has a non-zero status and
+a NaN result. Statuses follow day2/calc.py's checks and messages: both
+operands must be finite, divisors non-zero and square roots non-negative.
+"""
+
+import struct
+
+import numpy as np
+
+# calc_path puts the day2 calculator library on sys.path.
+try:
+	from day5 import calc_path  # noqa: F401
+except ModuleNotFoundError:
+	import calc_path  # noqa: F401
+
+from calc import addition, division, multiplication, square_root, subtraction  # noqa: E402
+
+
+HEADER = struct.Struct("<II")
+REQUEST_RECORD = struct.Struct("<Bdd")
+RESPONSE_RECORD = struct.Struct("<Bd")
+REQUEST_DTYPE = np.dtype([("op", "u1"), ("a", "<f8"), ("b", "<f8")])
+RESPONSE_DTYPE = np.dtype([("status", "u1"), ("result", "<f8")])
+MAX_FRAME_RECORDS = 65_536
+
+OPCODES = {"add": 1, "sub": 2, "mul": 3, "div": 4, "sqrt": 5}
+OPERATION_NAMES = {code: name for name, code in OPCODES.items()}
+
+STATUS_OK = 0
+STATUS_INVALID_A = 1
+STATUS_INVALID_B = 2
+STATUS_DIVISION_BY_ZERO = 3
+STATUS_NEGATIVE_SQRT = 4
+STATUS_UNKNOWN_OPERATION = 5
+
+STATUS_MESSAGES = {
+	STATUS_INVALID_A: "{name} must be a finite number.",
+	STATUS_INVALID_B: "b must be a finite number.",
+	STATUS_DIVISION_BY_ZERO: "Cannot divide by zero.",
+	STATUS_NEGATIVE_SQRT: "Cannot calculate square root of a negative number.",
+	STATUS_UNKNOWN_OPERATION: "Unknown operation code.",
+}
+_STATUS_BY_MESSAGE = {
+	"a must be a finite number.": STATUS_INVALID_A,
+	"value must be a finite number.": STATUS_INVALID_A,
+	"b must be a finite number.": STATUS_INVALID_B,
+	"Cannot divide by zero.": STATUS_DIVISION_BY_ZERO,
+	"Cannot calculate square root of a negative number.": STATUS_NEGATIVE_SQRT,
+}
+
+SCALAR_FUNCTIONS = {
+	OPCODES["add"]: addition,
+	OPCODES["sub"]: subtraction,
+	OPCODES["mul"]: multiplication,
+	OPCODES["div"]: division,
+	OPCODES["sqrt"]: lambda a, b: square_root(a),
+}
+VECTOR_KERNELS = {
+	OPCODES["add"]: np.add,
+	OPCODES["sub"]: np.subtract,
+	OPCODES["mul"]: np.multiply,
+	OPCODES["div"]: np.divide,
+}
+
+# Below this many records a Python loop over calc.py beats NumPy's per-call overhead.
+VECTORIZE_MIN_RECORDS = 32
+
+
+class ProtocolError(Exception):
+	"""Raised when a peer sends a frame that violates the framing rules."""
+
+
+def status_message(status: int, operation: str = "add") -> str:
+	"""Return the calc.py error message for a non-zero status."""
+	return STATUS_MESSAGES[status].format(name="value" if operation == "sqrt" else "a")
+
+
+def check_count(count: int) -> None:
+	if not 1 <= count <= MAX_FRAME_RECORDS:
+		raise ProtocolError(f"Frame record count must be between 1 and {MAX_FRAME_RECORDS}, got {count}.")
+
+
+def encode_request(request_id: int, ops, a, b) -> bytes:
+	"""Encode one request frame from op code and operand sequences (or arrays)."""
+	records = np.empty(len(ops), dtype=REQUEST_DTYPE)
+	records["op"] = ops
+	records["a"] = a
+	records["b"] = b
+	check_count(len(records))
+	return HEADER.pack(request_id, len(records)) + records.tobytes()
+
+
+def decode_response(body: bytes) -> tuple[np.ndarray, np.ndarray]:
+	"""Return the (statuses, results) arrays of a response frame body."""
+	records = np.frombuffer(body, dtype=RESPONSE_DTYPE)
+	return records["status"], records["result"]
+
+
+def _evaluate_scalar(op: int, a: float, b: float) -> tuple[int, float]:
+	function = SCALAR_FUNCTIONS.get(op)
+	if function is None:
+		return STATUS_UNKNOWN_OPERATION, float("nan")
+	try:
+		return STATUS_OK, function(a, b)
+	except ZeroDivisionError:
+		return STATUS_DIVISION_BY_ZERO, float("nan")
+	except ValueError as error:
+		return _STATUS_BY_MESSAGE[str(error)], float("nan")
+
+
+def _evaluate_vectorized(body: bytes) -> bytes:
+	records = np.frombuffer(body, dtype=REQUEST_DTYPE)
+	ops, a, b = records["op"], records["a"], records["b"]
+	sqrt = ops == OPCODES["sqrt"]
+
+	response = np.empty(len(records), dtype=RESPONSE_DTYPE)
+	status = np.zeros(len(records), dtype=np.uint8)
+
+	def flag(mask: np.ndarray, code: int) -> None:
+		status[mask & (status == 0)] = code
+
+	# Same check order as calc.py: operation, a, b, then the domain check.
+	flag((ops < OPCODES["add"]) | (ops > OPCODES["sqrt"]), STATUS_UNKNOWN_OPERATION)
+	flag(~np.isfinite(a), STATUS_INVALID_A)
+	flag(~sqrt & ~np.isfinite(b), STATUS_INVALID_B)
+	flag((ops == OPCODES["div"]) & (b == 0), STATUS_DIVISION_BY_ZERO)
+	flag(sqrt & (a < 0), STATUS_NEGATIVE_SQRT)
+
+	results = np.full(len(records), np.nan)
+	valid = status == 0
+	with np.errstate(all="ignore"):
+		for op, kernel in VECTOR_KERNELS.items():
+			selected = valid & (ops == op)
+			if selected.any():
+				results[selected] = kernel(a[selected], b[selected])
+		selected = valid & sqrt
+		if selected.any():
+			results[selected] = np.sqrt(a[selected])
+
+	response["status"] = status
+	response["result"] = results
+	return response.tobytes()
+
+
+def evaluate_frame(request_id: int, count: int, body: bytes) -> bytes:
+	"""Evaluate a request frame body and return the complete response frame."""
+	header = HEADER.pack(request_id, count)
+	if count < VECTORIZE_MIN_RECORDS:
+		pack = RESPONSE_RECORD.pack
+		return header + b"".join(pack(*_evaluate_scalar(*record)) for record in REQUEST_RECORD.iter_unpack(body))
+	return header + _evaluate_vectorized(body)
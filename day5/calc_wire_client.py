@@ -0,0 +1,197 @@
+"""Blocking client for the binary wire-protocol calculator server.
+
+calculate() sends one record and waits for its result. send() and receive()
+pipeline frames on one connection, and evaluate_many() splits whole arrays
+into frames while keeping several of them in flight.
+
+Environment:
+    CALC_WIRE_ADDRESS  unix:/path/to.sock or host:port (default 127.0.0.1:5010).
+"""
+
+import os
+import socket
+from collections import deque
+
+import numpy as np
+
+try:
+    from day5 import calc_path  # noqa: F401
+    from day5.calc_wire import (
+        HEADER,
+        OPCODES,
+        REQUEST_RECORD,
+        RESPONSE_RECORD,
+        STATUS_DIVISION_BY_ZERO,
+        STATUS_OK,
+        ProtocolError,
+        decode_response,
+        encode_request,
+        status_message,
+    )
+except ModuleNotFoundError:
+    import calc_path  # noqa: F401
+    from calc_wire import (
+        HEADER,
+        OPCODES,
+        REQUEST_RECORD,
+        RESPONSE_RECORD,
+        STATUS_DIVISION_BY_ZERO,
+        STATUS_OK,
+        ProtocolError,
+        decode_response,
+        encode_request,
+        status_message,
+    )
+
+from calc import _validate_number  # noqa: E402
+
+
+WIRE_ADDRESS = os.environ.get("CALC_WIRE_ADDRESS", "127.0.0.1:5010")
+
+# Cap on response bytes in flight; the server stops reading well above this, so
+# a pipelining client can never block on send while its responses go unread.
+MAX_IN_FLIGHT_BYTES = 1024 * 1024
+
+
+def parse_address(address: str) -> tuple[int, object]:
+    """Return (socket family, connect target) for unix:/path or host:port."""
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def _opcodes(operations, size: int) -> np.ndarray:
+    try:
+        if isinstance(operations, str):
+            return np.full(size, OPCODES[operations], dtype=np.uint8)
+        return np.array([OPCODES[operation] for operation in operations], dtype=np.uint8)
+    except KeyError as error:
+        raise ValueError(f"Unknown operation {error.args[0]!r}. Use one of: {', '.join(OPCODES)}.") from None
+
+
+class WireClient:
+    def __init__(self, address: str = WIRE_ADDRESS, timeout: float = 5.0) -> None:
+        family, target = parse_address(address)
+        self._socket = socket.socket(family, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(target)
+        except OSError:
+            self._socket.close()
+            raise
+        if family == socket.AF_INET:
+            self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._socket.makefile("rb")
+        self._next_id = 0
+        self._pending: deque[int] = deque()
+
+    def __enter__(self) -> "WireClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request_id(self) -> int:
+        self._next_id = (self._next_id + 1) & 0xFFFFFFFF
+        return self._next_id
+
+    def _read(self, size: int) -> bytes:
+        data = self._reader.read(size)
+        if len(data) < size:
+            raise ConnectionError("The calculator server closed the connection.")
+        return data
+
+    def _read_header(self, expected_id: int) -> int:
+        request_id, count = HEADER.unpack(self._read(HEADER.size))
+        if request_id != expected_id:
+            raise ProtocolError(f"Expected a response to request {expected_id}, got {request_id}.")
+        return count
+
+    def calculate(self, operation: str, a: float, b: float = 0.0) -> float:
+        """Evaluate one operation remotely with calc.py's errors.
+
+        Raises:
+            TypeError: If a or b is not an int or float.
+            ValueError: If an operand is not finite, the operation is unknown or
+                a square root input is negative.
+            ZeroDivisionError: If dividing by zero.
+        """
+        if self._pending:
+            raise RuntimeError("Receive all pipelined responses before calling calculate().")
+        opcode = OPCODES.get(operation)
+        if opcode is None:
+            raise ValueError(f"Unknown operation {operation!r}. Use one of: {', '.join(OPCODES)}.")
+        _validate_number(a, "value" if operation == "sqrt" else "a")
+        _validate_number(b, "b")
+
+        request_id = self._request_id()
+        self._socket.sendall(HEADER.pack(request_id, 1) + REQUEST_RECORD.pack(opcode, a, b))
+        self._read_header(request_id)
+        status, result = RESPONSE_RECORD.unpack(self._read(RESPONSE_RECORD.size))
+        if status == STATUS_OK:
+            return result
+        if status == STATUS_DIVISION_BY_ZERO:
+            raise ZeroDivisionError(status_message(status))
+        raise ValueError(status_message(status, operation))
+
+    def send(self, operations, a, b=None) -> int:
+        """Send one frame without waiting and return its request id.
+
+        operations is a single name applied to every record or one name per record.
+        """
+        a = np.asarray(a, dtype=np.float64).reshape(-1)
+        b = np.zeros_like(a) if b is None else np.asarray(b, dtype=np.float64).reshape(-1)
+        if a.shape != b.shape:
+            raise ValueError("a and b must have the same length.")
+        return self._send_codes(_opcodes(operations, a.size), a, b)
+
+    def _send_codes(self, opcodes: np.ndarray, a: np.ndarray, b: np.ndarray) -> int:
+        request_id = self._request_id()
+        self._socket.sendall(encode_request(request_id, opcodes, a, b))
+        self._pending.append(request_id)
+        return request_id
+
+    def receive(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return (statuses, results) for the oldest frame still in flight."""
+        if not self._pending:
+            raise RuntimeError("No requests are in flight.")
+        count = self._read_header(self._pending.popleft())
+        return decode_response(self._read(count * RESPONSE_RECORD.size))
+
+    def evaluate_many(self, operations, a, b=None, frame_records: int = 4096, depth: int = 8):
+        """Evaluate whole arrays as pipelined frames and return (statuses, results).
+
+        Failed records have a non-zero status (see calc_wire.status_message)
+        and a NaN result.
+        """
+        a = np.asarray(a, dtype=np.float64).reshape(-1)
+        b = np.zeros_like(a) if b is None else np.asarray(b, dtype=np.float64).reshape(-1)
+        if a.shape != b.shape:
+            raise ValueError("a and b must have the same length.")
+        opcodes = _opcodes(operations, a.size)
+        if not isinstance(operations, str) and opcodes.size != a.size:
+            raise ValueError("operations must name one operation per record.")
+
+        depth = max(1, min(depth, MAX_IN_FLIGHT_BYTES // (frame_records * RESPONSE_RECORD.size)))
+        statuses = np.empty(a.size, dtype=np.uint8)
+        results = np.empty(a.size, dtype=np.float64)
+        in_flight: deque[tuple[int, int]] = deque()
+
+        def collect() -> None:
+            start, stop = in_flight.popleft()
+            statuses[start:stop], results[start:stop] = self.receive()
+
+        for start in range(0, a.size, frame_records):
+            if len(in_flight) >= depth:
+                collect()
+            stop = min(start + frame_records, a.size)
+            self._send_codes(opcodes[start:stop], a[start:stop], b[start:stop])
+            in_flight.append((start, stop))
+        while in_flight:
+            collect()
+        return statuses, results
+
+    def close(self) -> None:
+        self._reader.close()
+        self._socket.close()
@@ -0,0 +1,273 @@
+"""ASGI version of the calculator API for production serving.
+
+Exposes the same routes and JSON contract as day5_flask_cals.py as a plain
+ASGI application, plus a launcher that runs several uvicorn worker processes
+accepting connections from one shared listening socket.
+
+Run:
+	python day5/day5_asgi_cals.py --workers 4 --port 5000
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+
+try:
+	from day5 import calc_path  # noqa: F401
+	from day5.calc_service import (
+		API_DESCRIPTION,
+		OPERATIONS,
+		RecordSplitter,
+		check_operation,
+		compute_exact,
+		compute_expression,
+		compute_reduction,
+		evaluate_batch,
+		evaluate_record,
+	)
+	from day5.calc_json import encode_operation, encode_response, loads
+	from day5.micro_batch import AsyncMicroBatcher
+except ModuleNotFoundError:
+	import calc_path  # noqa: F401
+	from calc_service import (
+		API_DESCRIPTION,
+		OPERATIONS,
+		RecordSplitter,
+		check_operation,
+		compute_exact,
+		compute_expression,
+		compute_reduction,
+		evaluate_batch,
+		evaluate_record,
+	)
+	from calc_json import encode_operation, encode_response, loads
+	from micro_batch import AsyncMicroBatcher
+
+from calc_numeric import make_context  # noqa: E402
+
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+OPERATION_PATHS = {f"/{operation}": operation for operation in OPERATIONS}
+REDUCTION_PATHS = {"/sum": "sum", "/product": "product", "/mean": "mean"}
+ROUTE_METHODS = {
+	"/": "GET",
+	"/health": "GET",
+	"/batch": "POST",
+	"/eval": "POST",
+	"/stream": "POST",
+	**{path: "POST" for path in OPERATION_PATHS},
+	**{path: "POST" for path in REDUCTION_PATHS},
+}
+
+JSON_HEADERS = [(b"content-type", b"application/json")]
+NDJSON_HEADERS = [(b"content-type", b"application/x-ndjson")]
+HOME_BODY = encode_response(API_DESCRIPTION)
+HEALTH_BODY = encode_response({"status": "ok"})
+
+# Decimal context for requests with "mode": "decimal"; CALC_DECIMAL_PRECISION sets its digits.
+DECIMAL_CONTEXT = make_context(int(os.environ.get("CALC_DECIMAL_PRECISION", "28")))
+
+# Optional micro-batching of concurrent single-operation requests in each worker,
+# enabled with CALC_MICRO_BATCH_WINDOW_MS > 0 (see micro_batch.py).
+MICRO_BATCH_WINDOW_MS = float(os.environ.get("CALC_MICRO_BATCH_WINDOW_MS", "0"))
+MICRO_BATCH_MAX_ITEMS = int(os.environ.get("CALC_MICRO_BATCH_MAX_ITEMS", "256"))
+MICRO_BATCHER = (
+	AsyncMicroBatcher(MICRO_BATCH_WINDOW_MS / 1000, MICRO_BATCH_MAX_ITEMS) if MICRO_BATCH_WINDOW_MS > 0 else None
+)
+
+
+async def send_body(send, body: bytes, status: int = 200) -> None:
+	await send({"type": "http.response.start", "status": status, "headers": JSON_HEADERS})
+	await send({"type": "http.response.body", "body": body})
+
+
+async def send_json(send, payload, status: int = 200) -> None:
+	await send_body(send, encode_response(payload), status)
+
+
+async def read_body(receive) -> bytes | None:
+	"""Read the full request body, or return None if it exceeds MAX_BODY_BYTES."""
+	chunks = []
+	size = 0
+	more_body = True
+	while more_body:
+		message = await receive()
+		if message["type"] == "http.disconnect":
+			return b""
+
+		chunk = message.get("body", b"")
+		size += len(chunk)
+		if size > MAX_BODY_BYTES:
+			return None
+		chunks.append(chunk)
+		more_body = message.get("more_body", False)
+
+	return b"".join(chunks)
+
+
+def is_json_request(scope) -> bool:
+	"""Mirror Flask's request.is_json check on the Content-Type header."""
+	for name, value in scope["headers"]:
+		if name == b"content-type":
+			mimetype = value.split(b";", 1)[0].strip().lower()
+			return mimetype == b"application/json" or (
+				mimetype.startswith(b"application/") and mimetype.endswith(b"+json")
+			)
+	return False
+
+
+def parse_json(scope, body: bytes):
+	"""Return the parsed JSON body, or None like Flask's get_json(silent=True)."""
+	if not is_json_request(scope):
+		return None
+
+	try:
+		return loads(body)
+	except ValueError:
+		return None
+
+
+async def stream(receive, send) -> None:
+	await send({"type": "http.response.start", "status": 200, "headers": NDJSON_HEADERS})
+
+	splitter = RecordSplitter()
+	more_body = True
+	while more_body:
+		message = await receive()
+		if message["type"] == "http.disconnect":
+			return
+
+		lines = [evaluate_record(record) for record in splitter.feed(message.get("body", b""))]
+		more_body = message.get("more_body", False)
+		if not more_body:
+			lines.extend(evaluate_record(record) for record in splitter.close())
+		if lines:
+			await send({"type": "http.response.body", "body": b"".join(lines), "more_body": True})
+
+	await send({"type": "http.response.body", "body": b""})
+
+
+async def lifespan(receive, send) -> None:
+	while True:
+		message = await receive()
+		if message["type"] == "lifespan.startup":
+			await send({"type": "lifespan.startup.complete"})
+		elif message["type"] == "lifespan.shutdown":
+			await send({"type": "lifespan.shutdown.complete"})
+			return
+
+
+async def app(scope, receive, send) -> None:
+	if scope["type"] == "lifespan":
+		await lifespan(receive, send)
+		return
+
+	path = scope["path"]
+	method = ROUTE_METHODS.get(path)
+	if method is None:
+		await send_json(send, {"error": "Not found."}, 404)
+		return
+	if scope["method"] != method:
+		await send_json(send, {"error": "Method not allowed."}, 405)
+		return
+
+	if path == "/":
+		await send_body(send, HOME_BODY)
+		return
+	if path == "/health":
+		await send_body(send, HEALTH_BODY)
+		return
+	if path == "/stream":
+		await stream(receive, send)
+		return
+
+	body = await read_body(receive)
+	if body is None:
+		await send_json(send, {"error": "Request body is too large."}, 413)
+		return
+
+	payload = parse_json(scope, body)
+
+	if path == "/batch":
+		response, status = evaluate_batch(payload)
+		await send_json(send, response, status)
+		return
+	if path == "/eval":
+		response, status = compute_expression(payload)
+		await send_json(send, response, status)
+		return
+	if path in REDUCTION_PATHS:
+		response, status = compute_reduction(REDUCTION_PATHS[path], payload)
+		await send_json(send, response, status)
+		return
+
+	payload = payload if isinstance(payload, dict) else {}
+	operation = OPERATION_PATHS[path]
+	mode = payload.get("mode")
+	if mode is not None and mode != "float":
+		response, status = compute_exact(operation, payload, DECIMAL_CONTEXT)
+		await send_json(send, response, status)
+		return
+
+	a, b, error = check_operation(operation, payload.get("a"), payload.get("b"))
+	if error is not None:
+		await send_json(send, {"error": error}, 400)
+		return
+
+	if MICRO_BATCHER is None:
+		result = OPERATIONS[operation](a, b)
+	else:
+		result = await MICRO_BATCHER.submit(operation, a, b)
+	await send_body(send, encode_operation(operation, a, b, result))
+
+
+def run_worker(config, sock: socket.socket) -> None:
+	import uvicorn
+
+	uvicorn.Server(config).run(sockets=[sock])
+
+
+def serve(host: str, port: int, workers: int) -> None:
+	"""Serve the ASGI app from `workers` uvicorn processes sharing one socket."""
+	import uvicorn
+
+	config = uvicorn.Config(app, log_level="warning", access_log=False, lifespan="on")
+	sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+	sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+	sock.bind((host, port))
+	sock.listen(config.backlog)
+	sock.set_inheritable(True)
+
+	if workers == 1:
+		run_worker(config, sock)
+		return
+
+	context = multiprocessing.get_context("fork")
+	processes = [context.Process(target=run_worker, args=(config, sock)) for _ in range(workers)]
+	for process in processes:
+		process.start()
+
+	try:
+		for process in processes:
+			process.join()
+	except KeyboardInterrupt:
+		for process in processes:
+			process.terminate()
+		for process in processes:
+			process.join()
+	finally:
+		sock.close()
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Serve the calculator API with uvicorn worker processes.")
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=5000)
+	parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+	args = parser.parse_args()
+	serve(args.host, args.port, max(1, args.workers))
+
+
+if __name__ == "__main__":
+	main()
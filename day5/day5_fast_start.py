@@ -0,0 +1,91 @@
+"""Fast cold-start entry point for the Flask calculator API.
+
+Importing day5_flask_cals.py pulls in all of Flask and the calculator
+modules before the first request can be answered. This entry point binds the
+port with only Werkzeug's server loaded, answers health checks at once, and
+imports the full app on a background thread.
+
+	GET /health  200 {"status":"ok"} as soon as the port is open.
+	GET /ready   200 once the full app is loaded, 503 until then.
+
+Every other request waits for the app to finish loading and is then served
+by day5_flask_cals.app exactly as if it had been started directly.
+
+Run:
+	python day5/day5_fast_start.py --host 127.0.0.1 --port 5000
+"""
+
+import argparse
+import threading
+
+from werkzeug.serving import make_server
+
+
+HEALTH_BODY = b'{"status":"ok"}\n'
+READY_BODY = b'{"ready":true}\n'
+WARMING_BODY = b'{"ready":false}\n'
+
+
+def _json(start_response, status: str, body: bytes) -> list[bytes]:
+	start_response(status, [("Content-Type", "application/json"), ("Content-Length", str(len(body)))])
+	return [body]
+
+
+class LazyApp:
+	"""WSGI app that answers health checks itself and loads the calculator app on demand."""
+
+	def __init__(self) -> None:
+		self._app = None
+		self._lock = threading.Lock()
+
+	@property
+	def ready(self) -> bool:
+		return self._app is not None
+
+	def load(self):
+		"""Import the full Flask app once and return it; concurrent callers wait for the import."""
+		if self._app is None:
+			with self._lock:
+				if self._app is None:
+					try:
+						from day5.day5_flask_cals import app
+					except ModuleNotFoundError:
+						from day5_flask_cals import app
+					self._app = app
+		return self._app
+
+	def warm_in_background(self) -> threading.Thread:
+		thread = threading.Thread(target=self.load, name="calc-warmup", daemon=True)
+		thread.start()
+		return thread
+
+	def __call__(self, environ, start_response):
+		path = environ.get("PATH_INFO")
+		if path == "/health":
+			return _json(start_response, "200 OK", HEALTH_BODY)
+		if path == "/ready":
+			if self.ready:
+				return _json(start_response, "200 OK", READY_BODY)
+			return _json(start_response, "503 Service Unavailable", WARMING_BODY)
+		return self.load()(environ, start_response)
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Serve the calculator API with a fast cold start.")
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=5000)
+	args = parser.parse_args()
+
+	app = LazyApp()
+	server = make_server(args.host, args.port, app, threaded=True)
+	app.warm_in_background()
+	try:
+		server.serve_forever()
+	except KeyboardInterrupt:
+		pass
+	finally:
+		server.server_close()
+
+
+if __name__ == "__main__":
+	main()
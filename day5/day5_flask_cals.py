@@ -1,67 +1,535 @@
-from flask import Flask, jsonify, request
+import math
+import os
+import time
+from functools import partial, wraps
+
+from flask import Flask, Response, jsonify, request, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+
+try:
+	from day5 import calc_path  # noqa: F401
+	from day5.calc_service import (
+		API_DESCRIPTION,
+		INVALID_INPUT_ERROR,
+		OPERATIONS,
+		OVERLOADED_ERROR,
+		RATE_LIMITED_ERROR,
+		STREAM_CHUNK_BYTES,
+		compute_exact,
+		compute_expression,
+		compute_reduction,
+		evaluate_batch,
+		evaluate_stream,
+		parse_pair,
+	)
+	from day5.admission import ConcurrencyLimiter, TokenBucketLimiter
+	from day5.calc_json import BACKEND as JSON_BACKEND
+	from day5.calc_json import MIMETYPE as JSON_MIMETYPE
+	from day5.calc_json import dumps as json_dumps
+	from day5.calc_json import encode_operation, encode_response
+	from day5.calc_json import loads as json_loads
+	from day5.calc_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+	from day5.calc_metrics import MetricsRegistry
+	from day5.calc_trace import NULL_SPAN, TRACE_HEADER, EndpointProfiler, Trace, Tracer, valid_trace_id
+	from day5.result_cache import ResultCache
+except ModuleNotFoundError:
+	import calc_path  # noqa: F401
+	from calc_service import (
+		API_DESCRIPTION,
+		INVALID_INPUT_ERROR,
+		OPERATIONS,
+		OVERLOADED_ERROR,
+		RATE_LIMITED_ERROR,
+		STREAM_CHUNK_BYTES,
+		compute_exact,
+		compute_expression,
+		compute_reduction,
+		evaluate_batch,
+		evaluate_stream,
+		parse_pair,
+	)
+	from admission import ConcurrencyLimiter, TokenBucketLimiter
+	from calc_json import BACKEND as JSON_BACKEND
+	from calc_json import MIMETYPE as JSON_MIMETYPE
+	from calc_json import dumps as json_dumps
+	from calc_json import encode_operation, encode_response
+	from calc_json import loads as json_loads
+	from calc_metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+	from calc_metrics import MetricsRegistry
+	from calc_trace import NULL_SPAN, TRACE_HEADER, EndpointProfiler, Trace, Tracer, valid_trace_id
+	from result_cache import ResultCache
+
+from calc_numeric import make_context  # noqa: E402
+from calc_registry import DIVISION_BY_ZERO_ERROR, DOMAIN_CHECKS, DOMAIN_ERRORS  # noqa: E402
+
+
+class CalcJSONProvider(DefaultJSONProvider):
+	"""Parse request bodies and encode jsonify() responses with the calc_json backend."""
+
+	def dumps(self, obj, **kwargs) -> str:
+		if kwargs:
+			return super().dumps(obj, **kwargs)
+		return json_dumps(obj).decode("utf-8")
+
+	def loads(self, s, **kwargs):
+		return json_loads(s)
+
+	def response(self, *args, **kwargs):
+		obj = self._prepare_response_obj(args, kwargs)
+		return self._app.response_class(encode_response(obj), mimetype=self.mimetype)
 
 
 app = Flask(__name__)
 
+# Flask's default provider already is the stdlib path; swap it only for a faster backend.
+if JSON_BACKEND != "stdlib":
+	app.json = CalcJSONProvider(app)
 
-def parse_numbers() -> tuple[float, float] | tuple[None, None]:
-	payload = request.get_json(silent=True) or {}
-	first = payload.get("a")
-	second = payload.get("b")
+# Response bodies that never change are encoded once at startup.
+HOME_BODY = encode_response(API_DESCRIPTION)
+CALC_SPANS = {operation: f"calc.{operation}" for operation in OPERATIONS}
+HEALTH_BODY = encode_response({"status": "ok"})
+INVALID_INPUT_BODY = encode_response({"error": INVALID_INPUT_ERROR})
+DOMAIN_ERROR_BODIES = {error: encode_response({"error": error}) for error in DOMAIN_ERRORS}
+OVERLOADED_BODY = encode_response({"error": OVERLOADED_ERROR})
+RATE_LIMITED_BODY = encode_response({"error": RATE_LIMITED_ERROR})
+
+# Optional response cache for the arithmetic routes, enabled with CALC_RESULT_CACHE_SIZE > 0.
+RESULT_CACHE_SIZE = int(os.environ.get("CALC_RESULT_CACHE_SIZE", "0"))
+RESULT_CACHE_TTL = float(os.environ.get("CALC_RESULT_CACHE_TTL", "0")) or None
+app.config["RESULT_CACHE"] = ResultCache(RESULT_CACHE_SIZE, RESULT_CACHE_TTL) if RESULT_CACHE_SIZE > 0 else None
+
+# Request metrics served on /metrics; on by default, disabled with CALC_METRICS=0.
+app.config["METRICS"] = MetricsRegistry() if os.environ.get("CALC_METRICS", "1") != "0" else None
+
+# Opt-in tracing and profiling (calc_trace.py). CALC_TRACE=1 records timed spans
+# for each request, keeps the last CALC_TRACE_BUFFER traces for /trace/<id> and
+# returns them in a Server-Timing header. CALC_PROFILE_EVERY=N > 0 runs cProfile
+# on one request in N; per-route profiles are served on /profile and written to
+# CALC_PROFILE_DIR by POST /profile/dump.
+TRACE_BUFFER = int(os.environ.get("CALC_TRACE_BUFFER", "1000"))
+PROFILE_EVERY = int(os.environ.get("CALC_PROFILE_EVERY", "0"))
+app.config["TRACER"] = Tracer(TRACE_BUFFER) if os.environ.get("CALC_TRACE") == "1" else None
+app.config["PROFILER"] = EndpointProfiler(PROFILE_EVERY) if PROFILE_EVERY > 0 else None
+app.config["PROFILE_DIR"] = os.environ.get("CALC_PROFILE_DIR", "profiles")
 
+# Admission control, off by default. CALC_MAX_CONCURRENCY > 0 caps requests in
+# flight; up to CALC_MAX_QUEUE more wait at most CALC_QUEUE_TIMEOUT seconds and
+# the rest get 503. CALC_RATE_LIMIT > 0 gives each client IP a token bucket of
+# CALC_RATE_LIMIT requests/second with bursts of CALC_RATE_BURST; excess gets 429.
+MAX_CONCURRENCY = int(os.environ.get("CALC_MAX_CONCURRENCY", "0"))
+MAX_QUEUE = int(os.environ.get("CALC_MAX_QUEUE", "0"))
+QUEUE_TIMEOUT = float(os.environ.get("CALC_QUEUE_TIMEOUT", "0.5"))
+RATE_LIMIT = float(os.environ.get("CALC_RATE_LIMIT", "0"))
+RATE_BURST = int(os.environ.get("CALC_RATE_BURST", "20"))
+OVERLOAD_RETRY_AFTER = int(os.environ.get("CALC_RETRY_AFTER", "1"))
+app.config["CONCURRENCY_LIMITER"] = (
+	ConcurrencyLimiter(MAX_CONCURRENCY, MAX_QUEUE, QUEUE_TIMEOUT) if MAX_CONCURRENCY > 0 else None
+)
+app.config["RATE_LIMITER"] = TokenBucketLimiter(RATE_LIMIT, RATE_BURST) if RATE_LIMIT > 0 else None
+
+# Monitoring routes stay reachable while the service sheds load, and are never profiled.
+ADMISSION_EXEMPT_ENDPOINTS = frozenset(
+	{
+		"health",
+		"metrics",
+		"cache_stats",
+		"batching_stats",
+		"admission_stats",
+		"trace_detail",
+		"profile_report",
+		"profile_dump",
+	}
+)
+
+# Decimal context for requests with "mode": "decimal"; CALC_DECIMAL_PRECISION sets its digits.
+DECIMAL_PRECISION = int(os.environ.get("CALC_DECIMAL_PRECISION", "28"))
+app.config["DECIMAL_CONTEXT"] = make_context(DECIMAL_PRECISION)
+
+# Optional micro-batching of concurrent single-operation requests (/add, /div, ...),
+# enabled with CALC_MICRO_BATCH_WINDOW_MS > 0.
+MICRO_BATCH_WINDOW_MS = float(os.environ.get("CALC_MICRO_BATCH_WINDOW_MS", "0"))
+MICRO_BATCH_MAX_ITEMS = int(os.environ.get("CALC_MICRO_BATCH_MAX_ITEMS", "256"))
+app.config["MICRO_BATCHER"] = None
+if MICRO_BATCH_WINDOW_MS > 0:
+	# Imported only when enabled: micro_batch brings in asyncio, a large part of startup.
 	try:
-		return float(first), float(second)
-	except (TypeError, ValueError):
-		return None, None
+		from day5.micro_batch import MicroBatcher
+	except ModuleNotFoundError:
+		from micro_batch import MicroBatcher
+
+	app.config["MICRO_BATCHER"] = MicroBatcher(MICRO_BATCH_WINDOW_MS / 1000, MICRO_BATCH_MAX_ITEMS)
+
+
+def classify_error(response) -> str:
+	"""Return the metrics cause label for an error response."""
+	if response.status_code == 400:
+		payload = response.get_json(silent=True)
+		if isinstance(payload, dict) and payload.get("error") == DIVISION_BY_ZERO_ERROR:
+			return "divide_by_zero"
+		return "bad_input"
+	if response.status_code == 503:
+		return "overloaded"
+	if response.status_code >= 500:
+		return "server_error"
+	return {404: "not_found", 405: "method_not_allowed", 413: "too_large", 429: "rate_limited"}.get(
+		response.status_code, "other"
+	)
+
+
+@app.before_request
+def start_request_timer():
+	if app.config.get("METRICS") is not None:
+		request.environ["calc.request_started"] = time.perf_counter()
+
+
+@app.before_request
+def start_tracing():
+	tracer = app.config.get("TRACER")
+	profiler = app.config.get("PROFILER")
+	if tracer is None and profiler is None:
+		return None
+
+	current = request._get_current_object()
+	if tracer is not None:
+		current.environ["calc.trace"] = Trace(valid_trace_id(current.headers.get(TRACE_HEADER)))
+	if profiler is not None and current.endpoint not in ADMISSION_EXEMPT_ENDPOINTS:
+		profile = profiler.start()
+		if profile is not None:
+			current.environ["calc.profile"] = (profiler, profile)
+	return None
+
+
+def reject(body: bytes, status: int, retry_after: float):
+	response = json_response(body, status)
+	response.headers["Retry-After"] = str(max(1, math.ceil(retry_after)))
+	return response
+
+
+@app.before_request
+def admit_request():
+	limiter = app.config.get("CONCURRENCY_LIMITER")
+	rate_limiter = app.config.get("RATE_LIMITER")
+	if limiter is None and rate_limiter is None:
+		return None
+
+	current = request._get_current_object()
+	if current.endpoint in ADMISSION_EXEMPT_ENDPOINTS:
+		return None
+
+	if rate_limiter is not None:
+		wait = rate_limiter.acquire(current.remote_addr or "unknown")
+		if wait > 0:
+			return reject(RATE_LIMITED_BODY, 429, wait)
+
+	if limiter is not None:
+		if not limiter.acquire():
+			return reject(OVERLOADED_BODY, 503, OVERLOAD_RETRY_AFTER)
+		current.environ["calc.admitted_by"] = limiter
+	return None
+
+
+@app.teardown_request
+def release_admission(error=None):
+	limiter = request.environ.pop("calc.admitted_by", None)
+	if limiter is not None:
+		limiter.release()
+
+
+@app.teardown_request
+def stop_profile(error=None):
+	if app.config.get("PROFILER") is None:
+		return
+	sampled = request.environ.pop("calc.profile", None)
+	if sampled is not None:
+		profiler, profile = sampled
+		profiler.stop(profile, request.url_rule.rule if request.url_rule is not None else "unmatched")
+
+
+@app.after_request
+def finish_trace(response):
+	# Check the config first: touching the request proxy costs more than the whole disabled path.
+	tracer = app.config.get("TRACER")
+	if tracer is None:
+		return response
+	trace = request.environ.pop("calc.trace", None)
+	if trace is None:
+		return response
+
+	trace.record("request", trace.started, time.perf_counter())
+	response.headers[TRACE_HEADER] = trace.trace_id
+	response.headers["Server-Timing"] = trace.server_timing()
+	tracer.finish(trace)
+	return response
+
+
+@app.after_request
+def record_request_metrics(response):
+	metrics = app.config.get("METRICS")
+	if metrics is None:
+		return response
+
+	# Resolve the request proxy once; every proxy access costs about as much as observe().
+	current = request._get_current_object()
+	started = current.environ.get("calc.request_started")
+	if started is None:
+		return response
+
+	# Label by route pattern, not raw path, so unknown URLs cannot grow the label set.
+	endpoint = current.url_rule.rule if current.url_rule is not None else "unmatched"
+	cause = classify_error(response) if response.status_code >= 400 else None
+	metrics.observe(endpoint, current.method, response.status_code, time.perf_counter() - started, cause)
+	return response
+
+
+def json_response(body: bytes, status: int = 200):
+	return app.response_class(body, status=status, mimetype=JSON_MIMETYPE)
+
+
+def trace_span(name: str):
+	"""Return a span on the current request's trace, or NULL_SPAN when tracing is off."""
+	if app.config.get("TRACER") is None:
+		return NULL_SPAN
+	trace = request.environ.get("calc.trace")
+	return trace.span(name) if trace is not None else NULL_SPAN
+
+
+def parse_numbers() -> tuple[float, float] | tuple[None, None]:
+	with trace_span("parse_numbers"):
+		payload = request.get_json(silent=True) or {}
+		return parse_pair(payload.get("a"), payload.get("b"))
+
+
+def calculate(operation: str, a: float, b: float) -> float:
+	"""Compute one validated operation, through the micro-batcher when it is enabled."""
+	with trace_span(CALC_SPANS[operation]):
+		batcher = app.config.get("MICRO_BATCHER")
+		if batcher is None:
+			return OPERATIONS[operation](a, b)
+		return batcher.submit(operation, a, b)
+
+
+def operation_response(operation: str, a: float, b: float):
+	result = calculate(operation, a, b)
+	with trace_span("serialize"):
+		body = encode_operation(operation, a, b, result)
+	return json_response(body)
+
+
+def computed_response(name: str, compute, *args):
+	"""Apply a calc_service compute function to the JSON body and return its (response, status)."""
+	with trace_span("parse_json"):
+		payload = request.get_json(silent=True)
+	with trace_span(f"calc.{name}"):
+		body, status = compute(*args, payload)
+	with trace_span("serialize"):
+		return jsonify(body), status
+
+
+def numeric_mode(operation: str):
+	"""Send requests with an exact "mode" to the decimal or fraction backend.
+
+	Requests without a mode, or with "mode": "float", reach the view unchanged.
+	"""
+
+	def decorator(view):
+		@wraps(view)
+		def wrapper():
+			payload = request.get_json(silent=True)
+			mode = payload.get("mode") if isinstance(payload, dict) else None
+			if mode is None or mode == "float":
+				return view()
+
+			body, status = compute_exact(operation, payload, app.config["DECIMAL_CONTEXT"])
+			return jsonify(body), status
+
+		return wrapper
+
+	return decorator
+
+
+def cached_operation(operation: str):
+	"""Serve repeated (operation, a, b) requests from the configured ResultCache.
+
+	Operands are keyed by their exact float bits, so 0.0 and -0.0 stay distinct.
+	Cache hits return the stored response bytes without calling the view.
+	"""
+
+	def decorator(view):
+		@wraps(view)
+		def wrapper():
+			cache = app.config.get("RESULT_CACHE")
+			if cache is None:
+				return view()
+
+			a, b = parse_numbers()
+			if a is None:
+				return view()
+
+			key = (operation, a.hex(), b.hex())
+			cached = cache.get(key)
+			if cached is not None:
+				return json_response(*cached)
+
+			response = app.make_response(view())
+			cache.put(key, response.get_data(), response.status_code)
+			return response
+
+		return wrapper
+
+	return decorator
 
 
 @app.get("/")
 def home():
+	return json_response(HOME_BODY)
+
+
+@app.get("/health")
+def health():
+	return json_response(HEALTH_BODY)
+
+
+def operation_view(operation: str):
+	"""Return the float-mode view of a registered operation.
+
+	The operation's domain check, if it has one, is looked up here once
+	rather than on every request.
+	"""
+	check = DOMAIN_CHECKS.get(operation)
+
+	def view():
+		a, b = parse_numbers()
+		if a is None:
+			return json_response(INVALID_INPUT_BODY, 400)
+		if check is not None:
+			error = check(a, b)
+			if error is not None:
+				return json_response(DOMAIN_ERROR_BODIES[error], 400)
+
+		return operation_response(operation, a, b)
+
+	view.__name__ = operation
+	return view
+
+
+# POST /add, /sub, ... for every operation in calc_registry; the endpoint is the operation name.
+for operation in OPERATIONS:
+	app.add_url_rule(
+		f"/{operation}",
+		view_func=numeric_mode(operation)(cached_operation(operation)(operation_view(operation))),
+		methods=["POST"],
+	)
+
+
+@app.post("/batch")
+def batch():
+	return computed_response("batch", evaluate_batch)
+
+
+@app.post("/stream")
+def stream():
+	chunks = iter(partial(request.stream.read, STREAM_CHUNK_BYTES), b"")
+	results = stream_with_context(evaluate_stream(chunks))
+	return Response(results, mimetype="application/x-ndjson")
+
+
+@app.post("/eval")
+def eval_expression():
+	return computed_response("eval", compute_expression)
+
+
+@app.post("/sum")
+def sum_values():
+	return computed_response("sum", compute_reduction, "sum")
+
+
+@app.post("/product")
+def product_values():
+	return computed_response("product", compute_reduction, "product")
+
+
+@app.post("/mean")
+def mean_values():
+	return computed_response("mean", compute_reduction, "mean")
+
+
+@app.get("/cache/stats")
+def cache_stats():
+	cache = app.config.get("RESULT_CACHE")
+	if cache is None:
+		return jsonify({"enabled": False})
+
+	return jsonify({"enabled": True, **cache.stats()})
+
+
+@app.get("/batching/stats")
+def batching_stats():
+	batcher = app.config.get("MICRO_BATCHER")
+	if batcher is None:
+		return jsonify({"enabled": False})
+
+	return jsonify({"enabled": True, **batcher.stats()})
+
+
+@app.get("/admission/stats")
+def admission_stats():
+	limiter = app.config.get("CONCURRENCY_LIMITER")
+	rate_limiter = app.config.get("RATE_LIMITER")
 	return jsonify(
 		{
-			"message": "Calculator API",
-			"endpoints": ["POST /add", "POST /sub", "POST /mul", "POST /div"],
-			"input": {"a": "number", "b": "number"},
+			"concurrency": limiter.stats() if limiter is not None else None,
+			"rate_limit": rate_limiter.stats() if rate_limiter is not None else None,
 		}
 	)
 
 
-@app.post("/add")
-def add():
-	a, b = parse_numbers()
-	if a is None:
-		return jsonify({"error": "Please provide numeric 'a' and 'b'."}), 400
+@app.get("/trace/<trace_id>")
+def trace_detail(trace_id: str):
+	tracer = app.config.get("TRACER")
+	if tracer is None:
+		return jsonify({"error": "Tracing is disabled."}), 404
+
+	trace = tracer.get(trace_id)
+	if trace is None:
+		return jsonify({"error": "Unknown trace ID."}), 404
+	return jsonify(trace)
 
-	return jsonify({"operation": "add", "a": a, "b": b, "result": a + b})
 
+@app.get("/profile")
+def profile_report():
+	"""List sampled routes, or with ?endpoint=/add return that route's profile as text."""
+	profiler = app.config.get("PROFILER")
+	if profiler is None:
+		return jsonify({"error": "Profiling is disabled."}), 404
 
-@app.post("/sub")
-def sub():
-	a, b = parse_numbers()
-	if a is None:
-		return jsonify({"error": "Please provide numeric 'a' and 'b'."}), 400
+	endpoint = request.args.get("endpoint")
+	if endpoint is None:
+		return jsonify({"every": profiler.every, "samples": profiler.samples()})
 
-	return jsonify({"operation": "sub", "a": a, "b": b, "result": a - b})
+	report = profiler.report(endpoint, request.args.get("limit", 30, type=int))
+	if report is None:
+		return jsonify({"error": "No profile samples for this endpoint."}), 404
+	return Response(report, content_type="text/plain; charset=utf-8")
 
 
-@app.post("/mul")
-def mul():
-	a, b = parse_numbers()
-	if a is None:
-		return jsonify({"error": "Please provide numeric 'a' and 'b'."}), 400
+@app.post("/profile/dump")
+def profile_dump():
+	profiler = app.config.get("PROFILER")
+	if profiler is None:
+		return jsonify({"error": "Profiling is disabled."}), 404
 
-	return jsonify({"operation": "mul", "a": a, "b": b, "result": a * b})
+	paths = profiler.dump(app.config["PROFILE_DIR"])
+	return jsonify({"files": [str(path) for path in paths]})
 
 
-@app.post("/div")
-def div():
-	a, b = parse_numbers()
-	if a is None:
-		return jsonify({"error": "Please provide numeric 'a' and 'b'."}), 400
-	if b == 0:
-		return jsonify({"error": "Division by zero is not allowed."}), 400
+@app.get("/metrics")
+def metrics():
+	registry = app.config.get("METRICS")
+	if registry is None:
+		return jsonify({"error": "Metrics are disabled."}), 404
 
-	return jsonify({"operation": "div", "a": a, "b": b, "result": a / b})
+	return Response(registry.render(), content_type=METRICS_CONTENT_TYPE)
 
 
 if __name__ == "__main__":
@@ -1,46 +1,165 @@
+import os
 import re
-from json import dumps, loads
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+import time
 
 import streamlit as st
 
+try:
+    from day5 import calc_path  # noqa: F401
+    from day5.calc_async import AsyncCalculator
+    from day5.calc_client import CalcAPIBusy, CalcAPIUnavailable, get_client
+    from day5.calc_history import ExpressionCache, SessionHistory, create_expression_cache
+    from day5.calc_modes import (
+        API_BUSY_MESSAGE,
+        API_UNEXPECTED_MESSAGE,
+        API_UNREACHABLE_MESSAGE,
+        AUDIT_MODE,
+        REMOTE_MODE,
+        ResultAuditor,
+        evaluate_with_policy,
+        interpret_response,
+        resolve_mode,
+    )
+    from day5.calc_trace import Trace
+except ModuleNotFoundError:
+    import calc_path  # noqa: F401
+    from calc_async import AsyncCalculator
+    from calc_client import CalcAPIBusy, CalcAPIUnavailable, get_client
+    from calc_history import ExpressionCache, SessionHistory, create_expression_cache
+    from calc_modes import (
+        API_BUSY_MESSAGE,
+        API_UNEXPECTED_MESSAGE,
+        API_UNREACHABLE_MESSAGE,
+        AUDIT_MODE,
+        REMOTE_MODE,
+        ResultAuditor,
+        evaluate_with_policy,
+        interpret_response,
+        resolve_mode,
+    )
+    from calc_trace import Trace
+
+from calc_registry import REGISTRY, SYMBOLS, Operation  # noqa: E402
 
-OPERATORS = {"+", "-", "*", "/"}
-BINARY_EXPRESSION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([+\-*/])\s*(\d+(?:\.\d+)?)\s*$")
-API_BASE_URL = "http://127.0.0.1:5000"
-OPERATOR_TO_ENDPOINT = {
-    "+": "add",
-    "-": "sub",
-    "*": "mul",
-    "/": "div",
-}
+
+# Operators, their endpoints and the keypad's operator keys all come from calc_registry.
+OPERATORS = set(SYMBOLS)
+OPERATOR_TO_ENDPOINT = SYMBOLS
+OPERATOR_CLASS = "".join(re.escape(symbol) for symbol in SYMBOLS)
+BINARY_EXPRESSION = re.compile(rf"^\s*(\d+(?:\.\d+)?)\s*([{OPERATOR_CLASS}])\s*(\d+(?:\.\d+)?)\s*$")
+DIGIT_ROWS = (("7", "8", "9"), ("4", "5", "6"), ("1", "2", "3"), ("AC", "0", "="))
+CALC_MODE = resolve_mode(os.environ.get("CALC_MODE"))
+PENDING_MESSAGE = "Calculating…"
+RESULT_POLL_INTERVAL = 0.1
+# CALC_TRACE=1 traces each "=" press; the Flask API needs CALC_TRACE=1 too to add its spans.
+TRACING = os.environ.get("CALC_TRACE") == "1"
 
 
 def call_math_api(operator: str, first_number: float, second_number: float) -> tuple[str, str]:
     endpoint = OPERATOR_TO_ENDPOINT[operator]
-    url = f"{API_BASE_URL}/{endpoint}"
-    body = dumps({"a": first_number, "b": second_number}).encode("utf-8")
-    request = Request(url, data=body, method="POST", headers={"Content-Type": "application/json"})
 
     try:
-        with urlopen(request, timeout=5) as response:
-            payload = loads(response.read().decode("utf-8"))
-
-        result = payload.get("result")
-        if isinstance(result, float) and result.is_integer():
-            return str(int(result)), ""
-        return str(result), ""
-    except HTTPError as error:
-        try:
-            payload = loads(error.read().decode("utf-8"))
-            return "Error", payload.get("error", "Calculation failed.")
-        except Exception:
-            return "Error", "Calculation failed."
-    except URLError:
-        return "Error", "Flask API is not reachable. Please start day5_flask_cals.py."
+        status, payload = get_client().calculate(endpoint, first_number, second_number)
+    except CalcAPIBusy:
+        return "Error", API_BUSY_MESSAGE
+    except CalcAPIUnavailable:
+        return "Error", API_UNREACHABLE_MESSAGE
     except Exception:
-        return "Error", "Unexpected error while calling Flask API."
+        return "Error", API_UNEXPECTED_MESSAGE
+
+    return interpret_response(status, payload)
+
+
+@st.cache_resource
+def get_auditor() -> ResultAuditor:
+    return ResultAuditor(call_math_api)
+
+
+@st.cache_resource
+def get_async_calculator() -> AsyncCalculator:
+    return AsyncCalculator()
+
+
+def cancel_pending() -> None:
+    """Drop the session's in-flight calculation; a newer key press supersedes it."""
+    pending = st.session_state.get("pending")
+    if pending is not None:
+        pending.cancel()
+        st.session_state.pending = None
+
+
+@st.cache_resource
+def get_expression_cache() -> ExpressionCache | None:
+    return create_expression_cache()
+
+
+def parse_expression(expression: str) -> tuple[str, float, float] | None:
+    match = BINARY_EXPRESSION.match(expression)
+    if not match:
+        return None
+    left_operand, operator, right_operand = match.groups()
+    return operator, float(left_operand), float(right_operand)
+
+
+def show_result(operation: tuple[str, float, float] | None, result: tuple[str, str]) -> None:
+    """Display a finished calculation and add it to the session history."""
+    st.session_state.display, st.session_state.error_message = result
+    if operation is not None:
+        st.session_state.history.append(*operation, *result)
+
+
+def submit_operation(operation: tuple[str, float, float]) -> None:
+    """Send an operation to the API without waiting for the response."""
+    operator, first_number, second_number = operation
+    trace = Trace() if TRACING else None
+    st.session_state.pending = get_async_calculator().submit(
+        OPERATOR_TO_ENDPOINT[operator], first_number, second_number, trace
+    )
+    st.session_state.pending_operation = operation
+    st.session_state.pending_trace = trace
+    st.session_state.error_message = ""
+    if trace is not None:
+        trace.record("ui.callback", trace.started, time.perf_counter())
+
+
+def finish_trace(trace: Trace) -> None:
+    # ui.wait runs from the press until a rerun picks the result up.
+    trace.record("ui.wait", trace.started, time.perf_counter())
+    trace.log()
+    st.session_state.last_trace = trace
+
+
+def format_trace(trace: Trace) -> str:
+    spans = " · ".join(f"{name} {duration * 1000:.2f} ms" for name, _, duration in trace.spans)
+    return f"Trace {trace.trace_id}: {spans}"
+
+
+def collect_result() -> None:
+    """Move a finished background calculation into the display."""
+    pending = st.session_state.pending
+    if pending is None or not pending.done():
+        return
+
+    st.session_state.pending = None
+    if pending.cancelled():
+        return
+
+    operation, result = st.session_state.pending_operation, pending.result()
+    if st.session_state.pending_trace is not None:
+        finish_trace(st.session_state.pending_trace)
+    cache = get_expression_cache()
+    if cache is not None:
+        cache.put(*operation, *result)
+    show_result(operation, result)
+
+
+@st.fragment(run_every=RESULT_POLL_INTERVAL)
+def wait_for_result() -> None:
+    # Only this fragment reruns while waiting; the whole app reruns once to show the result.
+    pending = st.session_state.pending
+    if pending is None or pending.done():
+        st.rerun()
+    st.caption(PENDING_MESSAGE)
 
 
 def evaluate_expression(expression: str) -> tuple[str, str]:
@@ -56,12 +175,14 @@ def evaluate_expression(expression: str) -> tuple[str, str]:
         left_operand, operator, right_operand = match.groups()
         left_number = float(left_operand)
         right_number = float(right_operand)
-        return call_math_api(operator, left_number, right_number)
+        auditor = get_auditor() if CALC_MODE == AUDIT_MODE else None
+        return evaluate_with_policy(CALC_MODE, operator, left_number, right_number, call_math_api, auditor)
     except Exception:
         return "Error", "Unexpected calculation error."
 
 
 def press(value: str) -> None:
+    cancel_pending()
     current = st.session_state.display
 
     if value == "AC":
@@ -70,9 +191,17 @@ def press(value: str) -> None:
         return
 
     if value == "=":
-        result, message = evaluate_expression(current)
-        st.session_state.display = result
-        st.session_state.error_message = message
+        operation = parse_expression(current)
+        if operation is not None and CALC_MODE == REMOTE_MODE:
+            # Expressions any session has already evaluated skip the API call.
+            cache = get_expression_cache()
+            result = cache.get(*operation) if cache is not None else None
+            if result is None:
+                submit_operation(operation)
+                return
+        else:
+            result = evaluate_expression(current)
+        show_result(operation, result)
         return
 
     if current == "Error":
@@ -97,6 +226,20 @@ def press(value: str) -> None:
     st.session_state.error_message = ""
 
 
+def keypad_rows() -> list[tuple[tuple[str, ...], Operation | None]]:
+    """Return (digit keys, operator key) for each keypad row, top to bottom.
+
+    Operator keys run down the right-hand column with the first registered
+    operation (＋) at the bottom. Operations beyond the four digit rows get
+    rows of their own above the digits.
+    """
+    operations: list[Operation | None] = list(reversed(REGISTRY.values()))
+    height = max(len(operations), len(DIGIT_ROWS))
+    digit_rows = [()] * (height - len(DIGIT_ROWS)) + list(DIGIT_ROWS)
+    operations = [None] * (height - len(operations)) + operations
+    return list(zip(digit_rows, operations))
+
+
 def main() -> None:
     st.set_page_config(page_title="Calculator")
 
@@ -104,6 +247,11 @@ def main() -> None:
         st.session_state.display = ""
     if "error_message" not in st.session_state:
         st.session_state.error_message = ""
+    if "pending" not in st.session_state:
+        st.session_state.pending = None
+    if "history" not in st.session_state:
+        st.session_state.history = SessionHistory()
+    collect_result()
 
     st.markdown(
         """
@@ -127,31 +275,27 @@ def main() -> None:
     if st.session_state.error_message:
         st.error(st.session_state.error_message)
     st.text_input("Display", key="display", disabled=True)
-
-    row1 = st.columns(4)
-    row2 = st.columns(4)
-    row3 = st.columns(4)
-    row4 = st.columns(4)
-
-    row1[0].button("7", use_container_width=True, on_click=press, args=("7",))
-    row1[1].button("8", use_container_width=True, on_click=press, args=("8",))
-    row1[2].button("9", use_container_width=True, on_click=press, args=("9",))
-    row1[3].button("÷", use_container_width=True, type="primary", on_click=press, args=("/",))
-
-    row2[0].button("4", use_container_width=True, on_click=press, args=("4",))
-    row2[1].button("5", use_container_width=True, on_click=press, args=("5",))
-    row2[2].button("6", use_container_width=True, on_click=press, args=("6",))
-    row2[3].button("×", use_container_width=True, type="primary", on_click=press, args=("*",))
-
-    row3[0].button("1", use_container_width=True, on_click=press, args=("1",))
-    row3[1].button("2", use_container_width=True, on_click=press, args=("2",))
-    row3[2].button("3", use_container_width=True, on_click=press, args=("3",))
-    row3[3].button("−", use_container_width=True, type="primary", on_click=press, args=("-",))
-
-    row4[0].button("AC", use_container_width=True, on_click=press, args=("AC",))
-    row4[1].button("0", use_container_width=True, on_click=press, args=("0",))
-    row4[2].button("=", use_container_width=True, type="primary", on_click=press, args=("=",))
-    row4[3].button("＋", use_container_width=True, type="primary", on_click=press, args=("+",))
+    if st.session_state.pending is not None:
+        wait_for_result()
+
+    for keys, operation in keypad_rows():
+        columns = st.columns(4)
+        for column, key in zip(columns, keys):
+            column.button(
+                key, use_container_width=True, type="primary" if key == "=" else "secondary", on_click=press, args=(key,)
+            )
+        if operation is not None:
+            columns[3].button(
+                operation.label, use_container_width=True, type="primary", on_click=press, args=(operation.symbol,)
+            )
+
+    if TRACING and st.session_state.get("last_trace") is not None:
+        st.caption(format_trace(st.session_state.last_trace))
+
+    if st.session_state.history:
+        with st.expander("History"):
+            for expression, result in st.session_state.history.entries():
+                st.text(f"{expression} = {result}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,73 @@
+"""Binary wire-protocol calculator server for same-host, high-frequency callers.
+
+Speaks the framing defined in calc_wire.py over a Unix domain socket or TCP.
+Each connection is served in order: clients may pipeline any number of frames,
+and responses are written back as soon as each frame is evaluated.
+
+Run:
+	python day5/day5_wire_cals.py --unix /tmp/calc.sock
+	python day5/day5_wire_cals.py --host 127.0.0.1 --port 5010
+"""
+
+import argparse
+import asyncio
+import contextlib
+import os
+
+try:
+	from day5.calc_wire import HEADER, REQUEST_RECORD, ProtocolError, check_count, evaluate_frame
+except ModuleNotFoundError:
+	from calc_wire import HEADER, REQUEST_RECORD, ProtocolError, check_count, evaluate_frame
+
+
+# Stop reading from a client whose unread responses exceed this many bytes.
+MAX_PENDING_RESPONSE_BYTES = 4 * 1024 * 1024
+
+
+async def handle_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+	try:
+		while True:
+			request_id, count = HEADER.unpack(await reader.readexactly(HEADER.size))
+			check_count(count)
+			body = await reader.readexactly(count * REQUEST_RECORD.size)
+			writer.write(evaluate_frame(request_id, count, body))
+			if writer.transport.get_write_buffer_size() > MAX_PENDING_RESPONSE_BYTES:
+				await writer.drain()
+	except (asyncio.IncompleteReadError, ConnectionError, ProtocolError):
+		# End of stream, a dropped peer or a malformed frame: close the connection.
+		pass
+	finally:
+		writer.close()
+		with contextlib.suppress(ConnectionError):
+			await writer.wait_closed()
+
+
+async def start_server(host: str = "127.0.0.1", port: int = 5010, unix_path: str | None = None) -> asyncio.Server:
+	if unix_path is not None:
+		with contextlib.suppress(FileNotFoundError):
+			os.unlink(unix_path)
+		return await asyncio.start_unix_server(handle_connection, path=unix_path)
+
+	# asyncio sets TCP_NODELAY on accepted sockets, so small frames are not delayed.
+	return await asyncio.start_server(handle_connection, host, port)
+
+
+async def serve(host: str, port: int, unix_path: str | None) -> None:
+	server = await start_server(host, port, unix_path)
+	async with server:
+		await server.serve_forever()
+
+
+def main() -> None:
+	parser = argparse.ArgumentParser(description="Run the binary wire-protocol calculator server.")
+	parser.add_argument("--host", default="127.0.0.1")
+	parser.add_argument("--port", type=int, default=5010)
+	parser.add_argument("--unix", default=None, help="Listen on this Unix socket path instead of TCP.")
+	args = parser.parse_args()
+
+	with contextlib.suppress(KeyboardInterrupt):
+		asyncio.run(serve(args.host, args.port, args.unix))
+
+
+if __name__ == "__main__":
+	main()
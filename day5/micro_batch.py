@@ -0,0 +1,184 @@
+"""Opt-in micro-batching of concurrent single-operation requests.
+
+The first request to arrive opens a batch. Requests that arrive while it is
+open join it. The batch closes after `window` seconds or once it holds
+`max_items` requests, and is then evaluated with one NumPy call per
+operation (or a plain loop for batches too small to gain from NumPy). Every
+waiting request receives its own result. Both kernels come from
+calc_registry, and callers pass operands that have already passed the
+operation's domain check, exactly as the routes check them. NumPy float64
+arithmetic rounds like Python floats, so results are unchanged.
+
+MicroBatcher serves threaded WSGI servers and needs no background thread:
+the request that opened a batch waits out the window and evaluates it.
+AsyncMicroBatcher does the same on an asyncio event loop.
+"""
+
+import asyncio
+import threading
+
+# calc_path puts the day2 calculator library, with the operation registry, on sys.path.
+try:
+	from day5 import calc_path  # noqa: F401
+except ModuleNotFoundError:
+	import calc_path  # noqa: F401
+
+# VECTOR_KERNELS holds NumPy ufunc names; NumPy itself is imported by the
+# first batch large enough to need it.
+from calc_registry import SCALAR_KERNELS, VECTOR_KERNELS  # noqa: E402
+
+# Below this many items a Python loop beats NumPy's per-call overhead.
+VECTORIZE_MIN_ITEMS = 32
+
+
+def evaluate_coalesced(operations: list[str], a: list[float], b: list[float]) -> list[float]:
+	"""Evaluate validated (operation, a, b) requests with one vectorized call per operation."""
+	if len(operations) < VECTORIZE_MIN_ITEMS:
+		return [SCALAR_KERNELS[operation](x, y) for operation, x, y in zip(operations, a, b)]
+
+	import numpy as np
+
+	first = np.array(a, dtype=np.float64)
+	second = np.array(b, dtype=np.float64)
+	kinds = set(operations)
+
+	with np.errstate(over="ignore", under="ignore"):
+		if len(kinds) == 1:
+			return getattr(np, VECTOR_KERNELS[operations[0]])(first, second).tolist()
+
+		names = np.array(operations)
+		results = np.empty(len(first), dtype=np.float64)
+		for operation in kinds:
+			selected = names == operation
+			results[selected] = getattr(np, VECTOR_KERNELS[operation])(first[selected], second[selected])
+	return results.tolist()
+
+
+class _Batch:
+	__slots__ = ("operations", "a", "b", "results", "error", "full", "done")
+
+	def __init__(self) -> None:
+		self.operations: list[str] = []
+		self.a: list[float] = []
+		self.b: list[float] = []
+		self.results: list[float] = []
+		self.error: BaseException | None = None
+		self.full = threading.Event()
+		self.done = threading.Event()
+
+
+class _BatchStats:
+	def __init__(self, window: float, max_items: int) -> None:
+		if window <= 0 or max_items < 1:
+			raise ValueError("window must be positive and max_items at least 1.")
+		self.window = window
+		self.max_items = max_items
+		self.batches = 0
+		self.items = 0
+		self.largest = 0
+
+	def _record(self, size: int) -> None:
+		self.batches += 1
+		self.items += size
+		self.largest = max(self.largest, size)
+
+	def stats(self) -> dict:
+		return {
+			"window_ms": self.window * 1000,
+			"max_items": self.max_items,
+			"batches": self.batches,
+			"items": self.items,
+			"mean_batch_size": self.items / self.batches if self.batches else 0.0,
+			"largest_batch": self.largest,
+		}
+
+
+class MicroBatcher(_BatchStats):
+	"""Thread-safe micro-batcher for WSGI request threads."""
+
+	def __init__(self, window: float = 0.001, max_items: int = 256) -> None:
+		super().__init__(window, max_items)
+		self._lock = threading.Lock()
+		self._open: _Batch | None = None
+
+	def submit(self, operation: str, a: float, b: float) -> float:
+		"""Evaluate one validated operation as part of the current batch and return its result."""
+		with self._lock:
+			batch = self._open
+			leader = batch is None
+			if leader:
+				batch = self._open = _Batch()
+			index = len(batch.a)
+			batch.operations.append(operation)
+			batch.a.append(a)
+			batch.b.append(b)
+			if index + 1 >= self.max_items:
+				self._open = None
+				batch.full.set()
+
+		if not leader:
+			batch.done.wait()
+		else:
+			batch.full.wait(self.window)
+			with self._lock:
+				if self._open is batch:
+					self._open = None
+				self._record(len(batch.a))
+			try:
+				batch.results = evaluate_coalesced(batch.operations, batch.a, batch.b)
+			except BaseException as error:
+				batch.error = error
+			finally:
+				batch.done.set()
+
+		if batch.error is not None:
+			raise batch.error
+		return batch.results[index]
+
+
+class AsyncMicroBatcher(_BatchStats):
+	"""Micro-batcher for coroutines running on one asyncio event loop."""
+
+	def __init__(self, window: float = 0.001, max_items: int = 256) -> None:
+		super().__init__(window, max_items)
+		self._operations: list[str] = []
+		self._a: list[float] = []
+		self._b: list[float] = []
+		self._futures: list[asyncio.Future] = []
+		self._timer: asyncio.TimerHandle | None = None
+
+	async def submit(self, operation: str, a: float, b: float) -> float:
+		"""Evaluate one validated operation as part of the current batch and return its result."""
+		loop = asyncio.get_running_loop()
+		future = loop.create_future()
+		self._operations.append(operation)
+		self._a.append(a)
+		self._b.append(b)
+		self._futures.append(future)
+
+		if len(self._futures) >= self.max_items:
+			self._flush()
+		elif self._timer is None:
+			self._timer = loop.call_later(self.window, self._flush)
+		return await future
+
+	def _flush(self) -> None:
+		if self._timer is not None:
+			self._timer.cancel()
+			self._timer = None
+
+		operations, a, b, futures = self._operations, self._a, self._b, self._futures
+		self._operations, self._a, self._b, self._futures = [], [], [], []
+		self._record(len(futures))
+		try:
+			results = evaluate_coalesced(operations, a, b)
+		except Exception as error:
+			for future in futures:
+				if not future.done():
+					future.set_exception(error)
+			return
+
+		for future, result in zip(futures, results):
+			# A caller that disconnected may have cancelled its future.
+			if not future.done():
+				future.set_result(result)
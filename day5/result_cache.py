@@ -0,0 +1,75 @@
+"""Bounded LRU cache of pre-serialized API responses with optional TTL."""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+
+class ResultCache:
+	"""Thread-safe LRU cache mapping normalized operations to response bytes.
+
+	Entries are stored already encoded, so a cache hit can be returned without
+	building or serializing a JSON payload again. When `ttl` is set, entries
+	older than `ttl` seconds are treated as misses and dropped.
+	"""
+
+	def __init__(self, maxsize: int = 1024, ttl: float | None = None, clock: Callable[[], float] = time.monotonic) -> None:
+		if maxsize <= 0:
+			raise ValueError("maxsize must be positive.")
+
+		self.maxsize = maxsize
+		self.ttl = ttl
+		self._clock = clock
+		self._entries: OrderedDict[Hashable, tuple[bytes, int, float]] = OrderedDict()
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+		self.evictions = 0
+		self.expirations = 0
+
+	def get(self, key: Hashable) -> tuple[bytes, int] | None:
+		"""Return the cached (body, status) for key, or None on a miss."""
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				self.misses += 1
+				return None
+
+			body, status, stored_at = entry
+			if self.ttl is not None and self._clock() - stored_at >= self.ttl:
+				del self._entries[key]
+				self.expirations += 1
+				self.misses += 1
+				return None
+
+			self._entries.move_to_end(key)
+			self.hits += 1
+			return body, status
+
+	def put(self, key: Hashable, body: bytes, status: int) -> None:
+		with self._lock:
+			self._entries[key] = (body, status, self._clock())
+			self._entries.move_to_end(key)
+			if len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+				self.evictions += 1
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+			self.hits = self.misses = self.evictions = self.expirations = 0
+
+	def stats(self) -> dict:
+		with self._lock:
+			lookups = self.hits + self.misses
+			return {
+				"size": len(self._entries),
+				"maxsize": self.maxsize,
+				"ttl": self.ttl,
+				"hits": self.hits,
+				"misses": self.misses,
+				"hit_ratio": self.hits / lookups if lookups else 0.0,
+				"evictions": self.evictions,
+				"expirations": self.expirations,
+			}
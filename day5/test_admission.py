@@ -0,0 +1,78 @@
+import threading
+import unittest
+
+try:
+    from day5.admission import ConcurrencyLimiter, TokenBucketLimiter
+except ModuleNotFoundError:
+    from admission import ConcurrencyLimiter, TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestConcurrencyLimiter(unittest.TestCase):
+    def test_rejects_immediately_without_queue(self):
+        limiter = ConcurrencyLimiter(max_concurrent=2)
+        self.assertTrue(limiter.acquire())
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire())
+        limiter.release()
+        self.assertTrue(limiter.acquire())
+        self.assertEqual(limiter.stats()["rejected"], 1)
+        self.assertEqual(limiter.stats()["admitted"], 3)
+
+    def test_queued_request_takes_released_slot(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, queue_timeout=5)
+        self.assertTrue(limiter.acquire())
+        results = []
+        waiter = threading.Thread(target=lambda: results.append(limiter.acquire()))
+        waiter.start()
+        while limiter.stats()["waiting"] == 0:
+            pass
+        # The queue is full, so a third caller is turned away at once.
+        self.assertFalse(limiter.acquire())
+        limiter.release()
+        waiter.join(timeout=5)
+        self.assertEqual(results, [True])
+        self.assertEqual(limiter.stats()["active"], 1)
+
+    def test_queue_wait_times_out(self):
+        limiter = ConcurrencyLimiter(max_concurrent=1, max_queue=1, queue_timeout=0.01)
+        limiter.acquire()
+        self.assertFalse(limiter.acquire())
+        self.assertEqual(limiter.stats()["waiting"], 0)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            ConcurrencyLimiter(0)
+
+
+class TestTokenBucketLimiter(unittest.TestCase):
+    def test_burst_then_refill(self):
+        clock = FakeClock()
+        limiter = TokenBucketLimiter(rate=2, burst=2, clock=clock)
+        self.assertEqual(limiter.acquire("a"), 0.0)
+        self.assertEqual(limiter.acquire("a"), 0.0)
+        self.assertAlmostEqual(limiter.acquire("a"), 0.5)
+        # Buckets are per client.
+        self.assertEqual(limiter.acquire("b"), 0.0)
+        clock.now += 0.5
+        self.assertEqual(limiter.acquire("a"), 0.0)
+        self.assertEqual(limiter.stats()["limited"], 1)
+
+    def test_client_table_is_bounded(self):
+        limiter = TokenBucketLimiter(rate=1, burst=1, max_clients=2, clock=FakeClock())
+        for client in ("a", "b", "c"):
+            limiter.acquire(client)
+        self.assertEqual(limiter.stats()["clients"], 2)
+        # "a" was forgotten, so it starts again with a full bucket.
+        self.assertEqual(limiter.acquire("a"), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import threading
+import unittest
+from concurrent.futures import CancelledError
+
+try:
+    from day5.calc_async import AsyncCalculator
+    from day5.calc_client import CalcAPIBusy, CalcAPIUnavailable
+    from day5.calc_modes import API_BUSY_MESSAGE, API_UNREACHABLE_MESSAGE, DIVISION_BY_ZERO_MESSAGE
+except ModuleNotFoundError:
+    from calc_async import AsyncCalculator
+    from calc_client import CalcAPIBusy, CalcAPIUnavailable
+    from calc_modes import API_BUSY_MESSAGE, API_UNREACHABLE_MESSAGE, DIVISION_BY_ZERO_MESSAGE
+
+
+OPERATIONS = {"add": lambda a, b: a + b, "div": lambda a, b: a / b}
+
+
+def evaluate(operation, first_number, second_number):
+    if operation == "div" and second_number == 0:
+        return 400, {"error": DIVISION_BY_ZERO_MESSAGE}
+    result = OPERATIONS[operation](first_number, second_number)
+    return 200, {"operation": operation, "a": first_number, "b": second_number, "result": result}
+
+
+class RecordingClient:
+    def __init__(self, error=None):
+        self.error = error
+        self.requests = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def calculate(self, operation, first_number, second_number, trace=None):
+        self.requests.append(("calculate", [(operation, first_number, second_number)]))
+        self.release.wait(timeout=5)
+        if self.error is not None:
+            raise self.error
+        return evaluate(operation, first_number, second_number)
+
+    def batch(self, items):
+        self.requests.append(("batch", [(item["op"], item["a"], item["b"]) for item in items]))
+        self.release.wait(timeout=5)
+        results = [evaluate(item["op"], item["a"], item["b"])[1] for item in items]
+        return 200, {"count": len(results), "errors": 0, "results": results}
+
+
+class TestAsyncCalculator(unittest.TestCase):
+    def make_calculator(self, client, **options):
+        calculator = AsyncCalculator(client, **options)
+        self.addCleanup(calculator.shutdown)
+        return calculator
+
+    def test_single_call_uses_its_endpoint(self):
+        client = RecordingClient()
+        calculator = self.make_calculator(client, batch_window=0)
+
+        self.assertEqual(calculator.submit("add", 2.0, 3.0).result(timeout=5), ("5", ""))
+        self.assertEqual(client.requests, [("calculate", [("add", 2.0, 3.0)])])
+
+    def test_concurrent_calls_share_one_batch_request(self):
+        client = RecordingClient()
+        calculator = self.make_calculator(client, batch_window=0.2)
+
+        futures = [
+            calculator.submit("add", 2.0, 3.0),
+            calculator.submit("div", 9.0, 0.0),
+            calculator.submit("div", 8.0, 2.0),
+        ]
+
+        self.assertEqual(
+            [future.result(timeout=5) for future in futures],
+            [("5", ""), ("Error", DIVISION_BY_ZERO_MESSAGE), ("4", "")],
+        )
+        self.assertEqual(client.requests, [("batch", [("add", 2.0, 3.0), ("div", 9.0, 0.0), ("div", 8.0, 2.0)])])
+        self.assertEqual(calculator.stats(), {"calls": 3, "requests": 1, "withdrawn": 0})
+
+    def test_full_batch_is_sent_without_waiting_for_the_window(self):
+        client = RecordingClient()
+        calculator = self.make_calculator(client, batch_window=60, max_batch=2)
+
+        futures = [calculator.submit("add", 1.0, 1.0), calculator.submit("add", 2.0, 2.0)]
+
+        self.assertEqual([future.result(timeout=5) for future in futures], [("2", ""), ("4", "")])
+
+    def test_cancelled_queued_call_is_never_sent(self):
+        client = RecordingClient()
+        calculator = self.make_calculator(client, batch_window=0.2)
+
+        superseded = calculator.submit("add", 1.0, 1.0)
+        latest = calculator.submit("add", 2.0, 2.0)
+        superseded.cancel()
+
+        self.assertEqual(latest.result(timeout=5), ("4", ""))
+        self.assertEqual(client.requests, [("calculate", [("add", 2.0, 2.0)])])
+        self.assertEqual(calculator.stats()["withdrawn"], 1)
+
+    def test_cancelled_call_in_flight_discards_its_result(self):
+        client = RecordingClient()
+        client.release.clear()
+        calculator = self.make_calculator(client, batch_window=0)
+
+        superseded = calculator.submit("add", 1.0, 1.0)
+        while not client.requests:
+            threading.Event().wait(0.001)
+        superseded.cancel()
+        client.release.set()
+
+        with self.assertRaises(CancelledError):
+            superseded.result(timeout=5)
+        self.assertEqual(calculator.submit("add", 2.0, 2.0).result(timeout=5), ("4", ""))
+
+    def test_transport_errors_become_messages(self):
+        for error, message in ((CalcAPIBusy(1.0), API_BUSY_MESSAGE), (CalcAPIUnavailable(), API_UNREACHABLE_MESSAGE)):
+            with self.subTest(error=type(error).__name__):
+                calculator = self.make_calculator(RecordingClient(error), batch_window=0)
+                self.assertEqual(calculator.submit("add", 1.0, 1.0).result(timeout=5), ("Error", message))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import json
+import socket
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    from day5.calc_client import CalcAPIBusy, CalcAPIUnavailable, CalcClient
+    from day5.calc_service import compute, evaluate_batch
+    from day5.calc_trace import Trace
+except ModuleNotFoundError:
+    from calc_client import CalcAPIBusy, CalcAPIUnavailable, CalcClient
+    from calc_service import compute, evaluate_batch
+    from calc_trace import Trace
+
+
+class KeepAliveCalculatorHandler(BaseHTTPRequestHandler):
+    """Minimal HTTP/1.1 stand-in for the API that keeps connections open."""
+
+    protocol_version = "HTTP/1.1"
+    # Number of upcoming requests to answer with 503 and a short Retry-After.
+    overloaded_responses = 0
+    # Number of upcoming responses after which the server silently drops the
+    # connection, leaving the client a stale keep-alive connection.
+    closing_responses = 0
+    response_delay = 0.0
+    requests = 0
+    last_trace_id = None
+
+    def do_POST(self):
+        KeepAliveCalculatorHandler.requests += 1
+        KeepAliveCalculatorHandler.last_trace_id = self.headers.get("X-Calc-Trace-Id")
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        time.sleep(KeepAliveCalculatorHandler.response_delay)
+        if KeepAliveCalculatorHandler.closing_responses > 0:
+            KeepAliveCalculatorHandler.closing_responses -= 1
+            self.close_connection = True
+        if KeepAliveCalculatorHandler.overloaded_responses > 0:
+            KeepAliveCalculatorHandler.overloaded_responses -= 1
+            self.send_json({"error": "The calculator is busy. Please retry shortly."}, 503, {"Retry-After": "0.01"})
+            return
+
+        if self.path == "/batch":
+            body, status = evaluate_batch(payload)
+        else:
+            body = compute(self.path.lstrip("/"), payload.get("a"), payload.get("b"))
+            status = 400 if "error" in body else 200
+
+        self.send_json(body, status)
+
+    def send_json(self, body, status, headers=None):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class TestCalcClient(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveCalculatorHandler)
+        cls.server.daemon_threads = True
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        cls.thread.join(timeout=5)
+
+    def setUp(self):
+        self.client = CalcClient(self.base_url, pool_size=2, timeout=2, retries=1, backoff=0.01)
+
+    def tearDown(self):
+        self.client.close()
+        KeepAliveCalculatorHandler.overloaded_responses = 0
+        KeepAliveCalculatorHandler.closing_responses = 0
+        KeepAliveCalculatorHandler.response_delay = 0.0
+        KeepAliveCalculatorHandler.requests = 0
+
+    def pool_stale_connections(self, client, count):
+        """Leave `count` pooled connections that the server has already closed."""
+        KeepAliveCalculatorHandler.closing_responses = count
+        connections = [client._acquire()[0] for _ in range(count)]
+        for connection in connections:
+            connection.request("POST", "/add", body=b'{"a": 1, "b": 1}', headers={"Content-Type": "application/json"})
+            connection.getresponse().read()
+        for connection in connections:
+            client._release(connection)
+        # Let the server finish closing its ends.
+        time.sleep(0.05)
+
+    def test_busy_response_is_retried_after_retry_after(self):
+        KeepAliveCalculatorHandler.overloaded_responses = 1
+        status, payload = self.client.calculate("add", 1, 2)
+        self.assertEqual((status, payload["result"]), (200, 3.0))
+
+    def test_persistent_overload_raises_busy_and_fails_fast(self):
+        KeepAliveCalculatorHandler.overloaded_responses = 5
+        with self.assertRaises(CalcAPIBusy) as context:
+            self.client.calculate("add", 1, 2)
+        self.assertAlmostEqual(context.exception.retry_after, 0.01)
+        self.assertIsInstance(context.exception, CalcAPIUnavailable)
+        # One attempt plus one retry reached the server.
+        self.assertEqual(KeepAliveCalculatorHandler.overloaded_responses, 3)
+
+        # Until Retry-After passes, calls fail without reaching the server.
+        self.client._busy_until = float("inf")
+        with self.assertRaises(CalcAPIBusy):
+            self.client.calculate("add", 1, 2)
+        self.assertEqual(KeepAliveCalculatorHandler.overloaded_responses, 3)
+
+    def test_retry_after_longer_than_budget_is_not_waited_for(self):
+        client = CalcClient(self.base_url, retries=3, max_retry_wait=0.001)
+        self.addCleanup(client.close)
+        KeepAliveCalculatorHandler.overloaded_responses = 1
+        with self.assertRaises(CalcAPIBusy):
+            client.calculate("add", 1, 2)
+        self.assertEqual(KeepAliveCalculatorHandler.overloaded_responses, 0)
+        with self.assertRaises(CalcAPIBusy):
+            client.calculate("add", 1, 2)
+
+    def test_calculate_reuses_one_connection(self):
+        for _ in range(5):
+            status, payload = self.client.calculate("add", 10, 5)
+            self.assertEqual(status, 200)
+            self.assertEqual(payload["result"], 15.0)
+        self.assertEqual(self.client.connections_opened, 1)
+
+    def test_error_status_and_payload(self):
+        status, payload = self.client.calculate("div", 1, 0)
+        self.assertEqual(status, 400)
+        self.assertEqual(payload["error"], "Division by zero is not allowed.")
+
+    def test_batch(self):
+        status, payload = self.client.batch([{"op": "mul", "a": 6, "b": 7}])
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["results"][0]["result"], 42.0)
+
+    def test_trace_id_header_and_client_spans(self):
+        trace = Trace("ui-trace")
+        self.client.calculate("add", 1, 2, trace)
+        self.client.calculate("add", 3, 4, trace)
+
+        self.assertEqual(KeepAliveCalculatorHandler.last_trace_id, "ui-trace")
+        self.assertEqual([name for name, _, _ in trace.spans], ["client.connect", "client.request", "client.request"])
+
+        self.client.calculate("add", 5, 6)
+        self.assertIsNone(KeepAliveCalculatorHandler.last_trace_id)
+
+    def test_stale_pooled_connection_is_replaced(self):
+        self.pool_stale_connections(self.client, 1)
+        opened = self.client.connections_opened
+        status, payload = self.client.calculate("sub", 5, 2)
+        self.assertEqual((status, payload["result"]), (200, 3.0))
+        self.assertEqual(self.client.connections_opened, opened + 1)
+
+    def test_more_stale_connections_than_retries_do_not_fail_the_call(self):
+        client = CalcClient(self.base_url, pool_size=8, timeout=2, retries=1, backoff=0.01)
+        self.addCleanup(client.close)
+        self.pool_stale_connections(client, 4)
+        requests = KeepAliveCalculatorHandler.requests
+        opened = client.connections_opened
+
+        self.assertEqual(client.calculate("add", 1, 2), (200, {"a": 1.0, "b": 2.0, "operation": "add", "result": 3.0}))
+        # One stale failure empties the pool, so the call succeeds on the first new connection.
+        self.assertEqual(KeepAliveCalculatorHandler.requests, requests + 1)
+        self.assertEqual(client.connections_opened, opened + 1)
+        self.assertEqual(client._pool.qsize(), 1)
+
+    def test_slow_server_times_out_once_without_retrying(self):
+        client = CalcClient(self.base_url, timeout=0.2, retries=2, backoff=0.01)
+        self.addCleanup(client.close)
+        KeepAliveCalculatorHandler.response_delay = 0.5
+        started = time.monotonic()
+        with self.assertRaises(CalcAPIUnavailable):
+            client.calculate("add", 1, 2)
+        self.assertLess(time.monotonic() - started, 0.4)
+        self.assertEqual(KeepAliveCalculatorHandler.requests, 1)
+
+    def test_unreachable_server_raises_after_retries(self):
+        client = CalcClient(f"http://127.0.0.1:{unused_port()}", timeout=1, retries=2, backoff=0.001)
+        with self.assertRaises(CalcAPIUnavailable):
+            client.calculate("add", 1, 2)
+        self.assertEqual(client.connections_opened, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
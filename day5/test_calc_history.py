@@ -0,0 +1,131 @@
+import tracemalloc
+import unittest
+
+try:
+    from day5.calc_history import (
+        CACHE_ENTRY_BYTES,
+        HISTORY_ENTRY_BYTES,
+        ExpressionCache,
+        SessionHistory,
+        create_expression_cache,
+    )
+    from day5.calc_modes import API_BUSY_MESSAGE, DIVISION_BY_ZERO_MESSAGE
+except ModuleNotFoundError:
+    from calc_history import (
+        CACHE_ENTRY_BYTES,
+        HISTORY_ENTRY_BYTES,
+        ExpressionCache,
+        SessionHistory,
+        create_expression_cache,
+    )
+    from calc_modes import API_BUSY_MESSAGE, DIVISION_BY_ZERO_MESSAGE
+
+
+class TestSessionHistory(unittest.TestCase):
+    def test_entries_are_newest_first(self):
+        history = SessionHistory(capacity=4)
+        history.append("/", 8.0, 2.0, "4", "")
+        history.append("/", 9.0, 0.0, "Error", DIVISION_BY_ZERO_MESSAGE)
+        history.append("+", 0.1, 0.2, "0.30000000000000004", "")
+
+        self.assertEqual(
+            history.entries(),
+            [("0.1+0.2", "0.30000000000000004"), ("9/0", DIVISION_BY_ZERO_MESSAGE), ("8/2", "4")],
+        )
+
+    def test_ring_buffer_overwrites_the_oldest_entry(self):
+        history = SessionHistory(capacity=3)
+        for number in range(5):
+            history.append("*", float(number), 2.0, str(number * 2), "")
+
+        self.assertEqual(len(history), 3)
+        self.assertEqual([expression for expression, _ in history.entries()], ["4*2", "3*2", "2*2"])
+
+    def test_memory_is_fixed_at_capacity(self):
+        history = SessionHistory(capacity=50)
+        before = history.nbytes
+        for number in range(500):
+            history.append("-", float(number), 1.0, str(number - 1), "")
+
+        self.assertEqual(history.nbytes, before)
+        self.assertEqual(before, 50 * HISTORY_ENTRY_BYTES)
+
+    def test_unknown_messages_are_stored_as_calculation_failed(self):
+        history = SessionHistory(capacity=2)
+        history.append("+", 1.0, 2.0, "Error", "Something new.")
+        self.assertEqual(history.entries(), [("1+2", "Calculation failed.")])
+
+    def test_clear_and_invalid_capacity(self):
+        history = SessionHistory(capacity=2)
+        history.append("+", 1.0, 2.0, "3", "")
+        history.clear()
+        self.assertEqual(history.entries(), [])
+        with self.assertRaises(ValueError):
+            SessionHistory(capacity=0)
+
+
+class TestExpressionCache(unittest.TestCase):
+    def test_results_are_shared_by_expression(self):
+        cache = ExpressionCache(max_bytes=10 * CACHE_ENTRY_BYTES)
+        cache.put("/", 8.0, 2.0, "4", "")
+        cache.put("/", 9.0, 0.0, "Error", DIVISION_BY_ZERO_MESSAGE)
+
+        self.assertEqual(cache.get("/", 8.0, 2.0), ("4", ""))
+        self.assertEqual(cache.get("/", 9.0, 0.0), ("Error", DIVISION_BY_ZERO_MESSAGE))
+        self.assertIsNone(cache.get("*", 8.0, 2.0))
+
+    def test_domain_errors_of_every_operation_are_cached(self):
+        cache = ExpressionCache(max_bytes=10 * CACHE_ENTRY_BYTES)
+        cache.put("^", 0.0, -1.0, "Error", "Cannot raise zero to a negative power.")
+        cache.put("^", 2.0, 10.0, "1024", "")
+
+        self.assertEqual(cache.get("^", 0.0, -1.0), ("Error", "Cannot raise zero to a negative power."))
+        self.assertEqual(cache.get("^", 2.0, 10.0), ("1024", ""))
+
+    def test_transport_errors_are_not_cached(self):
+        cache = ExpressionCache(max_bytes=10 * CACHE_ENTRY_BYTES)
+        cache.put("+", 1.0, 2.0, "Error", API_BUSY_MESSAGE)
+        self.assertIsNone(cache.get("+", 1.0, 2.0))
+
+    def test_byte_ceiling_evicts_least_recently_used(self):
+        cache = ExpressionCache(max_bytes=2 * CACHE_ENTRY_BYTES + CACHE_ENTRY_BYTES // 2)
+        cache.put("+", 1.0, 1.0, "2", "")
+        cache.put("+", 2.0, 2.0, "4", "")
+        cache.get("+", 1.0, 1.0)
+        cache.put("+", 3.0, 3.0, "6", "")
+
+        self.assertEqual(cache.get("+", 1.0, 1.0), ("2", ""))
+        self.assertIsNone(cache.get("+", 2.0, 2.0))
+        stats = cache.stats()
+        self.assertEqual((stats["size"], stats["maxsize"], stats["evictions"]), (2, 2, 1))
+        self.assertLessEqual(stats["bytes"], stats["max_bytes"])
+
+    def test_measured_memory_stays_under_the_ceiling(self):
+        max_bytes = 2000 * CACHE_ENTRY_BYTES
+        cache = ExpressionCache(max_bytes=max_bytes)
+        tracemalloc.start()
+        try:
+            for number in range(5000):
+                cache.put("*", float(number), 3.0, str(number * 3), "")
+            used, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        self.assertLessEqual(used, max_bytes)
+
+    def test_ceiling_must_hold_one_entry(self):
+        with self.assertRaises(ValueError):
+            ExpressionCache(max_bytes=CACHE_ENTRY_BYTES - 1)
+
+    def test_ceiling_below_one_entry_disables_the_cache(self):
+        for max_bytes in (0, 1, CACHE_ENTRY_BYTES - 1):
+            with self.subTest(max_bytes=max_bytes):
+                self.assertIsNone(create_expression_cache(max_bytes))
+
+        cache = create_expression_cache(CACHE_ENTRY_BYTES)
+        self.assertIsInstance(cache, ExpressionCache)
+        self.assertEqual(cache.stats()["maxsize"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import json
+import math
+import unittest
+
+try:
+    from day5 import calc_json
+except ModuleNotFoundError:
+    import calc_json
+
+
+class TestCalcJSON(unittest.TestCase):
+    def test_dumps_is_compact_with_sorted_keys(self):
+        self.assertEqual(calc_json.dumps({"b": 1, "a": [1.5, None]}), b'{"a":[1.5,null],"b":1}')
+        self.assertEqual(calc_json.encode_response({"ok": True}), b'{"ok":true}\n')
+
+    def test_non_finite_values_keep_stdlib_spelling(self):
+        body = calc_json.dumps({"result": math.inf, "other": -math.inf})
+        self.assertEqual(body, b'{"other":-Infinity,"result":Infinity}')
+        self.assertTrue(math.isnan(calc_json.loads(b'{"a": NaN}')["a"]))
+        self.assertEqual(calc_json.loads('{"a": Infinity}')["a"], math.inf)
+
+    def test_loads_rejects_invalid_json_with_value_error(self):
+        with self.assertRaises(ValueError):
+            calc_json.loads(b'{"a": ')
+
+    def test_encode_operation_matches_dict_encoding(self):
+        cases = [(10.0, 4.0, 2.5), (1e16, -0.0, 1e16), (0.1, 0.2, 0.30000000000000004), (1e308, 1e308, math.inf)]
+        for a, b, result in cases:
+            with self.subTest(a=a, b=b):
+                payload = {"operation": "add", "a": a, "b": b, "result": result}
+                expected = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode() + b"\n"
+                self.assertEqual(calc_json.encode_operation("add", a, b, result), expected)
+                self.assertEqual(calc_json.loads(calc_json.encode_operation("add", a, b, result)), payload)
+
+
+if __name__ == "__main__":
+    unittest.main()
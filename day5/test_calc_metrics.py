@@ -0,0 +1,43 @@
+import unittest
+
+try:
+    from day5.calc_metrics import Histogram, MetricsRegistry
+except ModuleNotFoundError:
+    from calc_metrics import Histogram, MetricsRegistry
+
+
+class TestCalcMetrics(unittest.TestCase):
+    def test_histogram_buckets_are_cumulative(self):
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+        self.assertEqual(histogram.cumulative(), [("0.1", 2), ("1.0", 3), ("+Inf", 4)])
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.sum, 3.65)
+
+    def test_render_exposition_format(self):
+        registry = MetricsRegistry(buckets=(0.01,))
+        registry.observe("/div", "POST", 200, 0.002)
+        registry.observe("/div", "POST", 400, 0.02, cause="divide_by_zero")
+        text = registry.render()
+        self.assertIn("# TYPE calc_requests_total counter", text)
+        self.assertIn('calc_requests_total{endpoint="/div",method="POST",status="400"} 1', text)
+        self.assertIn('calc_request_errors_total{endpoint="/div",cause="divide_by_zero"} 1', text)
+        self.assertIn('calc_request_duration_seconds_bucket{endpoint="/div",le="0.01"} 1', text)
+        self.assertIn('calc_request_duration_seconds_bucket{endpoint="/div",le="+Inf"} 2', text)
+        self.assertTrue(text.endswith("\n"))
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.observe('/a"b', "GET", 200, 0.001)
+        self.assertIn('endpoint="/a\\"b"', registry.render())
+
+    def test_reset(self):
+        registry = MetricsRegistry()
+        registry.observe("/add", "POST", 200, 0.001)
+        registry.reset()
+        self.assertNotIn("/add", registry.render())
+
+
+if __name__ == "__main__":
+    unittest.main()
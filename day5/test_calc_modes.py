@@ -0,0 +1,113 @@
+import unittest
+
+try:
+    from day5.calc_modes import (
+        API_BUSY_MESSAGE,
+        API_UNEXPECTED_MESSAGE,
+        API_UNREACHABLE_MESSAGE,
+        AUDIT_MODE,
+        LOCAL_MODE,
+        REMOTE_MODE,
+        ResultAuditor,
+        calculate_locally,
+        evaluate_with_policy,
+        format_result,
+        interpret_response,
+        resolve_mode,
+    )
+except ModuleNotFoundError:
+    from calc_modes import (
+        API_BUSY_MESSAGE,
+        API_UNEXPECTED_MESSAGE,
+        API_UNREACHABLE_MESSAGE,
+        AUDIT_MODE,
+        LOCAL_MODE,
+        REMOTE_MODE,
+        ResultAuditor,
+        calculate_locally,
+        evaluate_with_policy,
+        format_result,
+        interpret_response,
+        resolve_mode,
+    )
+
+
+class RecordingRemote:
+    def __init__(self, result=("5", "")):
+        self.result = result
+        self.calls = []
+
+    def __call__(self, operator, first_number, second_number):
+        self.calls.append((operator, first_number, second_number))
+        return self.result
+
+
+class TestCalculatorModes(unittest.TestCase):
+    def test_format_result_collapses_integers(self):
+        self.assertEqual(format_result(5.0), "5")
+        self.assertEqual(format_result(2.5), "2.5")
+        self.assertEqual(format_result(float("inf")), "inf")
+
+    def test_local_results_match_api_formatting(self):
+        self.assertEqual(calculate_locally("+", 2, 3), ("5", ""))
+        self.assertEqual(calculate_locally("-", 9, 4), ("5", ""))
+        self.assertEqual(calculate_locally("*", 2.5, 4), ("10", ""))
+        self.assertEqual(calculate_locally("/", 10, 4), ("2.5", ""))
+        self.assertEqual(calculate_locally("/", 9, 0), ("Error", "Division by zero is not allowed."))
+        self.assertEqual(calculate_locally("^", 2, 10), ("1024", ""))
+        self.assertEqual(calculate_locally("^", 0, -1), ("Error", "Cannot raise zero to a negative power."))
+        self.assertEqual(
+            calculate_locally("^", -8, 0.5), ("Error", "Cannot raise a negative number to a fractional power.")
+        )
+
+    def test_interpret_response(self):
+        self.assertEqual(interpret_response(200, {"result": 4.0}), ("4", ""))
+        self.assertEqual(interpret_response(400, {"error": "Bad input."}), ("Error", "Bad input."))
+        self.assertEqual(interpret_response(500, None), ("Error", "Calculation failed."))
+        self.assertEqual(interpret_response(200, None), ("Error", API_UNEXPECTED_MESSAGE))
+
+    def test_resolve_mode(self):
+        self.assertEqual(resolve_mode(None), REMOTE_MODE)
+        self.assertEqual(resolve_mode(" Local "), LOCAL_MODE)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(resolve_mode("fastest"), REMOTE_MODE)
+
+    def test_remote_mode_always_calls_api(self):
+        remote = RecordingRemote()
+        self.assertEqual(evaluate_with_policy(REMOTE_MODE, "+", 2, 3, remote), ("5", ""))
+        self.assertEqual(remote.calls, [("+", 2, 3)])
+
+    def test_local_mode_skips_api(self):
+        remote = RecordingRemote()
+        self.assertEqual(evaluate_with_policy(LOCAL_MODE, "*", 6, 7, remote), ("42", ""))
+        self.assertEqual(remote.calls, [])
+
+    def test_local_mode_falls_back_to_api_on_unexpected_error(self):
+        remote = RecordingRemote(("inf", ""))
+        with self.assertLogs(level="ERROR"):
+            result = evaluate_with_policy(LOCAL_MODE, "+", float("inf"), 1, remote)
+        self.assertEqual(result, ("inf", ""))
+        self.assertEqual(len(remote.calls), 1)
+
+    def test_audit_mode_counts_matches_and_mismatches(self):
+        remote = RecordingRemote(("5", ""))
+        auditor = ResultAuditor(remote)
+        self.assertEqual(evaluate_with_policy(AUDIT_MODE, "+", 2, 3, remote, auditor), ("5", ""))
+        remote.result = ("6", "")
+        with self.assertLogs(level="WARNING"):
+            evaluate_with_policy(AUDIT_MODE, "+", 2, 3, remote, auditor)
+            auditor.shutdown()
+        self.assertEqual(auditor.stats(), {"checked": 2, "mismatches": 1, "unavailable": 0})
+
+    def test_audit_ignores_unreachable_api(self):
+        for message in (API_UNREACHABLE_MESSAGE, API_BUSY_MESSAGE):
+            with self.subTest(message=message):
+                remote = RecordingRemote(("Error", message))
+                auditor = ResultAuditor(remote)
+                evaluate_with_policy(AUDIT_MODE, "-", 9, 4, remote, auditor)
+                auditor.shutdown()
+                self.assertEqual(auditor.stats(), {"checked": 0, "mismatches": 0, "unavailable": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import threading
+import unittest
+
+try:
+    from day5.calc_trace import EndpointProfiler, Trace, Tracer, valid_trace_id
+except ModuleNotFoundError:
+    from calc_trace import EndpointProfiler, Trace, Tracer, valid_trace_id
+
+
+class TestTrace(unittest.TestCase):
+    def test_spans_are_recorded_relative_to_the_trace_start(self):
+        trace = Trace("abc")
+        with trace.span("parse_numbers"):
+            pass
+        trace.record("request", trace.started, trace.started + 0.002)
+
+        spans = trace.as_dict()["spans"]
+        self.assertEqual([span["name"] for span in spans], ["parse_numbers", "request"])
+        self.assertEqual(spans[1], {"name": "request", "start_ms": 0.0, "duration_ms": 2.0})
+        self.assertTrue(trace.server_timing().endswith("request;dur=2.000"))
+
+    def test_trace_ids(self):
+        self.assertRegex(Trace().trace_id, r"^[0-9a-f]{16}$")
+        self.assertEqual(valid_trace_id("ui-1f2e"), "ui-1f2e")
+        for value in (None, "", "a b", "a;dur=1", "x" * 65):
+            self.assertIsNone(valid_trace_id(value))
+
+    def test_tracer_keeps_the_most_recent_traces(self):
+        tracer = Tracer(capacity=2)
+        for trace_id in ("one", "two", "three"):
+            tracer.finish(Trace(trace_id))
+
+        self.assertIsNone(tracer.get("one"))
+        self.assertEqual(tracer.get("three"), {"trace_id": "three", "spans": []})
+
+    def test_finished_spans_are_logged(self):
+        trace = Trace("logged")
+        trace.record("request", trace.started, trace.started + 0.001)
+        with self.assertLogs(level="INFO") as logs:
+            Tracer().finish(trace)
+        self.assertIn("trace=logged span=request", logs.output[0])
+
+
+class TestEndpointProfiler(unittest.TestCase):
+    def test_one_request_in_every_n_is_profiled(self):
+        profiler = EndpointProfiler(every=3)
+        sampled = []
+        for _ in range(6):
+            profile = profiler.start()
+            sampled.append(profile is not None)
+            if profile is not None:
+                sum(range(100))
+                profiler.stop(profile, "/add")
+
+        self.assertEqual(sampled, [False, False, True, False, False, True])
+        self.assertEqual(profiler.samples(), {"/add": 2})
+        self.assertIn("function calls", profiler.report("/add"))
+        self.assertIsNone(profiler.report("/sub"))
+
+    def test_sample_is_skipped_while_another_request_is_profiled(self):
+        profiler = EndpointProfiler(every=1)
+        first = profiler.start()
+        self.assertIsNotNone(first)
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(profiler.start()))
+        thread.start()
+        thread.join()
+        profiler.stop(first, "/add")
+
+        self.assertEqual(other, [None])
+        self.assertEqual(profiler.samples(), {"/add": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
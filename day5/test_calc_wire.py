@@ -0,0 +1,164 @@
+import asyncio
+import math
+import os
+import tempfile
+import threading
+import unittest
+
+import numpy as np
+
+try:
+    from day5 import calc_wire
+    from day5.calc_wire_client import WireClient
+    from day5.day5_wire_cals import start_server
+except ModuleNotFoundError:
+    import calc_wire
+    from calc_wire_client import WireClient
+    from day5_wire_cals import start_server
+
+
+OPS = calc_wire.OPCODES
+CASES = [
+    (OPS["add"], 2.0, 3.5),
+    (OPS["sub"], 1.0, 4.0),
+    (OPS["mul"], 1e308, 10.0),
+    (OPS["div"], 1.0, 3.0),
+    (OPS["div"], 1.0, 0.0),
+    (OPS["div"], math.nan, 0.0),
+    (OPS["add"], 1.0, math.inf),
+    (OPS["sqrt"], 16.0, math.nan),
+    (OPS["sqrt"], -4.0, 0.0),
+    (99, 1.0, 1.0),
+]
+
+
+def evaluate(records, repeat: int = 1):
+    ops, a, b = (list(column) * repeat for column in zip(*records))
+    frame = calc_wire.encode_request(7, ops, a, b)
+    request_id, count = calc_wire.HEADER.unpack_from(frame)
+    response = calc_wire.evaluate_frame(request_id, count, frame[calc_wire.HEADER.size :])
+    return calc_wire.HEADER.unpack_from(response), calc_wire.decode_response(response[calc_wire.HEADER.size :])
+
+
+class TestWireProtocol(unittest.TestCase):
+    def test_statuses_follow_calc_checks(self):
+        header, (statuses, results) = evaluate(CASES)
+        self.assertEqual(header, (7, len(CASES)))
+        self.assertEqual(
+            statuses.tolist(),
+            [
+                calc_wire.STATUS_OK,
+                calc_wire.STATUS_OK,
+                calc_wire.STATUS_OK,
+                calc_wire.STATUS_OK,
+                calc_wire.STATUS_DIVISION_BY_ZERO,
+                calc_wire.STATUS_INVALID_A,
+                calc_wire.STATUS_INVALID_B,
+                calc_wire.STATUS_OK,
+                calc_wire.STATUS_NEGATIVE_SQRT,
+                calc_wire.STATUS_UNKNOWN_OPERATION,
+            ],
+        )
+        self.assertEqual(results[:4].tolist(), [5.5, -3.0, math.inf, 1 / 3])
+        self.assertEqual(results[7], 4.0)
+        self.assertTrue(np.isnan(results[statuses != 0]).all())
+
+    def test_vectorized_frames_match_scalar_frames(self):
+        repeat = calc_wire.VECTORIZE_MIN_RECORDS
+        _, (scalar_statuses, scalar_results) = evaluate(CASES)
+        _, (statuses, results) = evaluate(CASES, repeat=repeat)
+        np.testing.assert_array_equal(statuses, np.tile(scalar_statuses, repeat))
+        np.testing.assert_array_equal(results, np.tile(scalar_results, repeat))
+
+    def test_status_messages(self):
+        self.assertEqual(calc_wire.status_message(calc_wire.STATUS_INVALID_A), "a must be a finite number.")
+        self.assertEqual(calc_wire.status_message(calc_wire.STATUS_INVALID_A, "sqrt"), "value must be a finite number.")
+
+    def test_frame_size_is_bounded(self):
+        with self.assertRaises(calc_wire.ProtocolError):
+            calc_wire.check_count(0)
+        with self.assertRaises(calc_wire.ProtocolError):
+            calc_wire.check_count(calc_wire.MAX_FRAME_RECORDS + 1)
+
+
+class TestWireServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        cls.socket_path = os.path.join(cls.directory.name, "calc.sock")
+        cls.loop = asyncio.new_event_loop()
+        cls.unix_server = cls.loop.run_until_complete(start_server(unix_path=cls.socket_path))
+        cls.tcp_server = cls.loop.run_until_complete(start_server("127.0.0.1", 0))
+        cls.tcp_port = cls.tcp_server.sockets[0].getsockname()[1]
+        cls.thread = threading.Thread(target=cls.loop.run_forever, daemon=True)
+        cls.thread.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        async def shutdown():
+            for server in (cls.unix_server, cls.tcp_server):
+                server.close()
+                await server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), cls.loop).result(timeout=5)
+        cls.loop.call_soon_threadsafe(cls.loop.stop)
+        cls.thread.join(timeout=5)
+        cls.loop.close()
+        cls.directory.cleanup()
+
+    def connect(self, tcp: bool = False) -> WireClient:
+        client = WireClient(f"127.0.0.1:{self.tcp_port}" if tcp else f"unix:{self.socket_path}")
+        self.addCleanup(client.close)
+        return client
+
+    def test_calculate_over_unix_and_tcp(self):
+        for tcp in (False, True):
+            with self.subTest(tcp=tcp):
+                client = self.connect(tcp)
+                self.assertEqual(client.calculate("add", 10, 5), 15.0)
+                self.assertEqual(client.calculate("div", 10, 4), 2.5)
+                self.assertEqual(client.calculate("sqrt", 9), 3.0)
+
+    def test_calculate_raises_calc_errors(self):
+        client = self.connect()
+        with self.assertRaisesRegex(ZeroDivisionError, "Cannot divide by zero."):
+            client.calculate("div", 1, 0)
+        with self.assertRaisesRegex(ValueError, "Cannot calculate square root of a negative number."):
+            client.calculate("sqrt", -1)
+        with self.assertRaisesRegex(ValueError, "b must be a finite number."):
+            client.calculate("add", 1, math.inf)
+        with self.assertRaisesRegex(TypeError, "a must be a real number"):
+            client.calculate("add", True, 1)
+        with self.assertRaises(ValueError):
+            client.calculate("pow", 1, 2)
+        self.assertEqual(client.calculate("mul", 3, 4), 12.0)
+
+    def test_pipelined_frames_come_back_in_order(self):
+        client = self.connect()
+        first = client.send("add", [1, 2], [3, 4])
+        second = client.send(["mul", "div"], [5, 1], [6, 0])
+        self.assertNotEqual(first, second)
+        statuses, results = client.receive()
+        self.assertEqual(results.tolist(), [4.0, 6.0])
+        statuses, results = client.receive()
+        self.assertEqual(statuses.tolist(), [calc_wire.STATUS_OK, calc_wire.STATUS_DIVISION_BY_ZERO])
+        self.assertEqual(results[0], 30.0)
+
+    def test_evaluate_many_splits_into_frames(self):
+        client = self.connect(tcp=True)
+        a = np.arange(1000, dtype=np.float64)
+        b = np.arange(1000, dtype=np.float64) % 7
+        statuses, results = client.evaluate_many("div", a, b, frame_records=64, depth=4)
+        zero = b == 0
+        np.testing.assert_array_equal(statuses[zero], calc_wire.STATUS_DIVISION_BY_ZERO)
+        np.testing.assert_array_equal(results[~zero], a[~zero] / b[~zero])
+
+    def test_malformed_frame_closes_connection(self):
+        client = self.connect()
+        client._socket.sendall(calc_wire.HEADER.pack(1, 0))
+        with self.assertRaises(ConnectionError):
+            client._read(calc_wire.HEADER.size)
+
+
+if __name__ == "__main__":
+    unittest.main()
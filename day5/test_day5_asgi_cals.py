@@ -0,0 +1,132 @@
+import asyncio
+import json
+import math
+import unittest
+
+try:
+    from day5 import day5_asgi_cals
+    from day5.day5_asgi_cals import MAX_BODY_BYTES, app
+    from day5.micro_batch import AsyncMicroBatcher
+except ModuleNotFoundError:
+    import day5_asgi_cals
+    from day5_asgi_cals import MAX_BODY_BYTES, app
+    from micro_batch import AsyncMicroBatcher
+
+
+class TestAsgiCalculatorAPI(unittest.TestCase):
+    def request(self, method: str, path: str, body: bytes = b"", content_type: str = "application/json", chunks=None):
+        scope = {
+            "type": "http",
+            "method": method,
+            "path": path,
+            "headers": [(b"content-type", content_type.encode("latin-1"))],
+        }
+        chunks = list(chunks if chunks is not None else [body])
+        messages = [
+            {"type": "http.request", "body": chunk, "more_body": index < len(chunks) - 1}
+            for index, chunk in enumerate(chunks)
+        ]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        asyncio.run(app(scope, receive, send))
+        status = sent[0]["status"]
+        data = b"".join(message.get("body", b"") for message in sent[1:])
+        return status, data
+
+    def post_json(self, path: str, payload):
+        status, data = self.request("POST", path, json.dumps(payload).encode("utf-8"))
+        return status, json.loads(data)
+
+    def test_home_endpoint(self):
+        status, data = self.request("GET", "/")
+        self.assertEqual(status, 200)
+        payload = json.loads(data)
+        self.assertEqual(payload["message"], "Calculator API")
+        self.assertIn("POST /add", payload["endpoints"])
+
+    def test_health_endpoint(self):
+        self.assertEqual(self.request("GET", "/health"), (200, b'{"status":"ok"}\n'))
+
+    def test_operations_match_flask_contract(self):
+        self.assertEqual(self.post_json("/add", {"a": 10, "b": 5}), (200, {"operation": "add", "a": 10.0, "b": 5.0, "result": 15.0}))
+        self.assertEqual(self.post_json("/sub", {"a": 3, "b": 10})[1]["result"], -7.0)
+        self.assertEqual(self.post_json("/mul", {"a": 2.5, "b": 4})[1]["result"], 10.0)
+        self.assertEqual(self.post_json("/div", {"a": 10, "b": 4})[1]["result"], 2.5)
+        self.assertEqual(self.post_json("/pow", {"a": 2, "b": 10})[1]["result"], 1024.0)
+
+    def test_pow_non_finite_operands(self):
+        self.assertEqual(self.post_json("/pow", {"a": 2, "b": "inf"}), (200, {"operation": "pow", "a": 2.0, "b": math.inf, "result": math.inf}))
+        self.assertEqual(self.post_json("/pow", {"a": "-inf", "b": 3})[1]["result"], -math.inf)
+        self.assertTrue(math.isnan(self.post_json("/pow", {"a": 2, "b": "nan"})[1]["result"]))
+
+    def test_div_by_zero_edge_case(self):
+        self.assertEqual(self.post_json("/div", {"a": 10, "b": 0}), (400, {"error": "Division by zero is not allowed."}))
+        self.assertEqual(self.post_json("/pow", {"a": 0, "b": -1}), (400, {"error": "Cannot raise zero to a negative power."}))
+
+    def test_invalid_input_edge_cases(self):
+        for payload in ({"a": 1}, {"a": "hello", "b": 5}, {"a": None, "b": 2}, {}, [1, 2]):
+            self.assertEqual(self.post_json("/add", payload), (400, {"error": "Please provide numeric 'a' and 'b'."}))
+
+    def test_invalid_content_type_edge_case(self):
+        status, data = self.request("POST", "/add", b"a=1&b=2", content_type="application/x-www-form-urlencoded")
+        self.assertEqual(status, 400)
+        self.assertEqual(json.loads(data)["error"], "Please provide numeric 'a' and 'b'.")
+
+    def test_batch(self):
+        status, payload = self.post_json("/batch", {"op": "div", "a": [1, 1], "b": [4, 0]})
+        self.assertEqual(status, 200)
+        self.assertEqual(payload["results"][0]["result"], 0.25)
+        self.assertEqual(payload["results"][1]["error"], "Division by zero is not allowed.")
+
+    def test_eval_expression(self):
+        self.assertEqual(self.post_json("/eval", {"expression": "2+3*4"}), (200, {"expression": "2+3*4", "result": 14.0}))
+        self.assertEqual(self.post_json("/eval", {"expression": "1/0"})[0], 400)
+
+    def test_reductions(self):
+        self.assertEqual(self.post_json("/sum", {"values": [1, 2, 3]})[1]["result"], 6.0)
+        self.assertEqual(self.post_json("/product", {"values": [2, 5]})[1]["result"], 10.0)
+        self.assertEqual(self.post_json("/mean", {"values": []})[0], 400)
+
+    def test_stream_split_across_chunks(self):
+        chunks = [b'{"op": "add", "a": 1', b', "b": 2}\n{"op": "mul",', b' "a": 3, "b": 4}']
+        status, data = self.request("POST", "/stream", content_type="application/x-ndjson", chunks=chunks)
+        self.assertEqual(status, 200)
+        self.assertEqual([json.loads(line)["result"] for line in data.splitlines()], [3.0, 12.0])
+
+    def test_unknown_route_and_method(self):
+        self.assertEqual(self.request("GET", "/missing")[0], 404)
+        self.assertEqual(self.request("GET", "/add")[0], 405)
+
+    def test_body_too_large_edge_case(self):
+        chunks = [b" " * (MAX_BODY_BYTES // 2)] * 3
+        status, _ = self.request("POST", "/add", chunks=chunks)
+        self.assertEqual(status, 413)
+
+    def test_numeric_modes(self):
+        self.assertEqual(
+            self.post_json("/add", {"a": "0.1", "b": 0.2, "mode": "decimal"}),
+            (200, {"operation": "add", "mode": "decimal", "a": "0.1", "b": 0.2, "result": "0.3"}),
+        )
+        self.assertEqual(self.post_json("/div", {"a": 2, "b": 6, "mode": "fraction"})[1]["result"], "1/3")
+        self.assertEqual(self.post_json("/div", {"a": 2, "b": 0, "mode": "decimal"}), (400, {"error": "Division by zero is not allowed."}))
+        self.assertEqual(self.post_json("/add", {"a": 1, "b": 2, "mode": "float"})[1]["result"], 3.0)
+
+    def test_micro_batched_operations(self):
+        batcher = AsyncMicroBatcher(window=0.001)
+        day5_asgi_cals.MICRO_BATCHER = batcher
+        try:
+            self.assertEqual(self.post_json("/mul", {"a": 3, "b": 4}), (200, {"operation": "mul", "a": 3.0, "b": 4.0, "result": 12.0}))
+            self.assertEqual(self.post_json("/div", {"a": 1, "b": 0})[0], 400)
+        finally:
+            day5_asgi_cals.MICRO_BATCHER = None
+        self.assertEqual(batcher.stats()["items"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+from werkzeug.test import Client
+
+try:
+    from day5.day5_fast_start import LazyApp
+except ModuleNotFoundError:
+    from day5_fast_start import LazyApp
+
+
+class TestFastStart(unittest.TestCase):
+    def test_health_answers_before_the_app_is_loaded(self):
+        lazy = LazyApp()
+        client = Client(lazy)
+
+        response = client.get("/health")
+        self.assertEqual((response.status_code, response.get_data()), (200, b'{"status":"ok"}\n'))
+        self.assertEqual(client.get("/ready").status_code, 503)
+        self.assertFalse(lazy.ready)
+
+    def test_requests_are_served_by_the_full_app(self):
+        lazy = LazyApp()
+        client = Client(lazy)
+
+        response = client.post("/add", json={"a": 10, "b": 5})
+        self.assertEqual(response.json, {"operation": "add", "a": 10.0, "b": 5.0, "result": 15.0})
+        self.assertTrue(lazy.ready)
+        self.assertEqual(client.get("/ready").json, {"ready": True})
+
+    def test_background_warm_up(self):
+        lazy = LazyApp()
+        lazy.warm_in_background().join(timeout=30)
+        self.assertTrue(lazy.ready)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,25 @@
+import json
+import math
+import tempfile
 import unittest
+from pathlib import Path
 
 try:
+    from day5.admission import ConcurrencyLimiter, TokenBucketLimiter
+    from day5.calc_service import compute_exact
     from day5.day5_flask_cals import app
+    from day5.calc_metrics import MetricsRegistry
+    from day5.calc_trace import EndpointProfiler, Tracer
+    from day5.micro_batch import MicroBatcher
+    from day5.result_cache import ResultCache
 except ModuleNotFoundError:
+    from admission import ConcurrencyLimiter, TokenBucketLimiter
+    from calc_metrics import MetricsRegistry
+    from calc_service import compute_exact
+    from calc_trace import EndpointProfiler, Tracer
     from day5_flask_cals import app
+    from micro_batch import MicroBatcher
+    from result_cache import ResultCache
 
 
 class TestFlaskCalculatorAPI(unittest.TestCase):
@@ -27,6 +43,11 @@ class TestFlaskCalculatorAPI(unittest.TestCase):
         self.assertEqual(payload["message"], "Calculator API")
         self.assertIn("POST /add", payload["endpoints"])
 
+    def test_health_endpoint(self):
+        response = self.client.get("/health")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"status": "ok"})
+
     def test_add_valid(self):
         inputs = {"a": 10, "b": 5}
         response = self.client.post("/add", json={"a": 10, "b": 5})
@@ -99,6 +120,78 @@ class TestFlaskCalculatorAPI(unittest.TestCase):
         self.log_case("/div", inputs, response.status_code, payload)
         self.assertEqual(payload["error"], "Division by zero is not allowed.")
 
+    def test_pow_valid(self):
+        inputs = {"a": 2, "b": 10}
+        response = self.client.post("/pow", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/pow", inputs, response.status_code, payload)
+        self.assertEqual(payload, {"operation": "pow", "a": 2.0, "b": 10.0, "result": 1024.0})
+
+    def test_pow_domain_errors(self):
+        cases = (
+            ({"a": 0, "b": -1}, "Cannot raise zero to a negative power."),
+            ({"a": -8, "b": 0.5}, "Cannot raise a negative number to a fractional power."),
+        )
+        for inputs, message in cases:
+            with self.subTest(inputs=inputs):
+                response = self.client.post("/pow", json=inputs)
+                self.assertEqual(response.status_code, 400)
+                payload = response.get_json()
+                self.log_case("/pow", inputs, response.status_code, payload)
+                self.assertEqual(payload["error"], message)
+
+    def test_pow_non_finite_operands(self):
+        cases = (({"a": 2, "b": "inf"}, math.inf), ({"a": "-inf", "b": 3}, -math.inf), ({"a": 10, "b": 400}, math.inf))
+        for inputs, expected in cases:
+            with self.subTest(inputs=inputs):
+                response = self.client.post("/pow", json=inputs)
+                self.assertEqual(response.status_code, 200)
+                payload = response.get_json()
+                self.log_case("/pow", inputs, response.status_code, payload)
+                self.assertEqual(payload["result"], expected)
+
+        response = self.client.post("/pow", json={"a": 2, "b": "nan"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(math.isnan(response.get_json()["result"]))
+
+    def test_pow_non_finite_operands_in_batch_and_stream(self):
+        inputs = [{"op": "pow", "a": 2, "b": "inf"}, {"op": "pow", "a": -8, "b": 0.5}, {"op": "add", "a": 1, "b": 2}]
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/batch", inputs, response.status_code, payload)
+        self.assertEqual(payload["errors"], 1)
+        self.assertEqual([result.get("result") for result in payload["results"]], [math.inf, None, 3.0])
+
+        records = b"".join(json.dumps(item).encode() + b"\n" for item in inputs)
+        response = self.client.post("/stream", data=records, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.log_case("/stream", inputs, response.status_code, lines)
+        self.assertEqual(lines, payload["results"])
+
+    def test_huge_integer_operands_are_item_errors(self):
+        huge = 10**400
+        inputs = [{"op": "add", "a": huge, "b": 1}, {"op": "pow", "a": 2, "b": huge}, {"op": "add", "a": 1, "b": 2}]
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/batch", "10**400 operands", response.status_code, payload)
+        self.assertEqual(payload["errors"], 2)
+        self.assertEqual(payload["results"][0]["error"], "Please provide numeric 'a' and 'b'.")
+        self.assertEqual(payload["results"][2]["result"], 3.0)
+
+        records = b"".join(json.dumps(item).encode() + b"\n" for item in inputs)
+        response = self.client.post("/stream", data=records, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.assertEqual(lines, payload["results"])
+
+        response = self.client.post("/pow", json={"a": 2, "b": huge})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Please provide numeric 'a' and 'b'.")
+
     def test_missing_input_fields_edge_case(self):
         inputs = {"a": 1}
         response = self.client.post("/add", json={"a": 1})
@@ -139,6 +232,430 @@ class TestFlaskCalculatorAPI(unittest.TestCase):
         self.log_case("/add", inputs, response.status_code, payload)
         self.assertEqual(payload["error"], "Please provide numeric 'a' and 'b'.")
 
+    def test_batch_item_list(self):
+        inputs = [
+            {"op": "add", "a": 10, "b": 5},
+            {"op": "div", "a": 9, "b": 0},
+            {"op": "mul", "a": "hello", "b": 5},
+            {"op": "mod", "a": 2, "b": 3},
+            {"op": "sub", "a": 3, "b": 10},
+        ]
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/batch", inputs, response.status_code, payload)
+        self.assertEqual(payload["count"], 5)
+        self.assertEqual(payload["errors"], 3)
+        results = payload["results"]
+        self.assertEqual(results[0], {"operation": "add", "a": 10.0, "b": 5.0, "result": 15.0})
+        self.assertEqual(results[1]["error"], "Division by zero is not allowed.")
+        self.assertEqual(results[2]["error"], "Please provide numeric 'a' and 'b'.")
+        self.assertIn("Unknown operation", results[3]["error"])
+        self.assertEqual(results[4]["result"], -7.0)
+
+    def test_batch_columnar(self):
+        inputs = {"op": "mul", "a": [1, 2.5, 0], "b": [2, 4, 999999]}
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/batch", inputs, response.status_code, payload)
+        self.assertEqual([item["result"] for item in payload["results"]], [2.0, 10.0, 0.0])
+
+    def test_batch_columnar_length_mismatch_edge_case(self):
+        inputs = {"op": "add", "a": [1, 2], "b": [1]}
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 400)
+        payload = response.get_json()
+        self.log_case("/batch", inputs, response.status_code, payload)
+        self.assertEqual(payload["error"], "Columns 'a' and 'b' must have the same length.")
+
+    def test_batch_invalid_payload_edge_case(self):
+        inputs = {"op": "add", "a": 1, "b": 2}
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 400)
+        payload = response.get_json()
+        self.log_case("/batch", inputs, response.status_code, payload)
+        self.assertIn("error", payload)
+
+    def test_batch_non_object_item_edge_case(self):
+        inputs = [{"op": "add", "a": 1, "b": 2}, 7]
+        response = self.client.post("/batch", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/batch", inputs, response.status_code, payload)
+        self.assertEqual(payload["results"][1]["error"], "Please provide numeric 'a' and 'b'.")
+
+    def test_stream_ndjson_records(self):
+        inputs = (
+            b'{"op": "add", "a": 10, "b": 5}\n'
+            b"\n"
+            b'{"op": "div", "a": 1, "b": 0}\n'
+            b"not json\n"
+            b'{"op": "mul", "a": 2.5, "b": 4}'
+        )
+        response = self.client.post("/stream", data=inputs, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        payload = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.log_case("/stream", inputs, response.status_code, payload)
+        self.assertEqual(len(payload), 4)
+        self.assertEqual(payload[0]["result"], 15.0)
+        self.assertEqual(payload[1]["error"], "Division by zero is not allowed.")
+        self.assertIn("JSON object", payload[2]["error"])
+        self.assertEqual(payload[3]["result"], 10.0)
+        # Lines use the same compact, key-sorted encoding as every other response.
+        first_line = response.get_data().splitlines()[0]
+        self.assertEqual(first_line, b'{"a":10.0,"b":5.0,"operation":"add","result":15.0}')
+
+    def test_stream_oversized_record_edge_case(self):
+        inputs = b'{"op": "add", "a": 1, "b": "' + b"9" * 10000 + b'"}\n{"op": "sub", "a": 3, "b": 1}\n'
+        response = self.client.post("/stream", data=inputs, content_type="application/x-ndjson")
+        self.assertEqual(response.status_code, 200)
+        payload = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        self.log_case("/stream", "oversized record", response.status_code, payload)
+        self.assertEqual(payload[0]["error"], "Record exceeds the maximum line length.")
+        self.assertEqual(payload[1]["result"], 2.0)
+
+    def test_eval_expression(self):
+        inputs = {"expression": "-(2+3)*4 + sqrt(16)"}
+        response = self.client.post("/eval", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/eval", inputs, response.status_code, payload)
+        self.assertEqual(payload, {"expression": inputs["expression"], "result": -16.0})
+
+    def test_eval_divide_by_zero_edge_case(self):
+        inputs = {"expression": "1/(3-3)"}
+        response = self.client.post("/eval", json=inputs)
+        self.assertEqual(response.status_code, 400)
+        payload = response.get_json()
+        self.log_case("/eval", inputs, response.status_code, payload)
+        self.assertEqual(payload["error"], "Division by zero is not allowed.")
+
+    def test_eval_invalid_expression_edge_case(self):
+        inputs = {"expression": "2+*3"}
+        response = self.client.post("/eval", json=inputs)
+        self.assertEqual(response.status_code, 400)
+        payload = response.get_json()
+        self.log_case("/eval", inputs, response.status_code, payload)
+        self.assertTrue(payload["error"].startswith("Invalid expression"))
+
+    def test_eval_missing_expression_edge_case(self):
+        inputs = {"expression": 42}
+        response = self.client.post("/eval", json=inputs)
+        self.assertEqual(response.status_code, 400)
+        payload = response.get_json()
+        self.log_case("/eval", inputs, response.status_code, payload)
+        self.assertEqual(payload["error"], "Please provide an 'expression' string.")
+
+    def test_sum_compensated(self):
+        inputs = {"values": [1e100, 1.0, -1e100], "mode": "compensated"}
+        response = self.client.post("/sum", json=inputs)
+        self.assertEqual(response.status_code, 200)
+        payload = response.get_json()
+        self.log_case("/sum", inputs, response.status_code, payload)
+        self.assertEqual(payload, {"operation": "sum", "mode": "compensated", "count": 3, "result": 1.0})
+
+    def test_product_and_mean(self):
+        inputs = {"values": [2, 3, 4]}
+        product = self.client.post("/product", json=inputs).get_json()
+        mean = self.client.post("/mean", json=inputs).get_json()
+        self.log_case("/product, /mean", inputs, 200, [product, mean])
+        self.assertEqual(product["result"], 24.0)
+        self.assertEqual(mean["result"], 3.0)
+        self.assertEqual(mean["mode"], "pairwise")
+
+    def test_reduction_invalid_values_edge_case(self):
+        inputs = {"values": [1, "x", 3]}
+        response = self.client.post("/sum", json=inputs)
+        self.assertEqual(response.status_code, 400)
+        payload = response.get_json()
+        self.log_case("/sum", inputs, response.status_code, payload)
+        self.assertEqual(payload["error"], "values must be a real number (int or float). Failed indices: [1]")
+
+    def test_reduction_huge_integer_edge_case(self):
+        for path in ("/sum", "/product", "/mean"):
+            response = self.client.post(path, json={"values": [1, 10**400, 3]})
+            with self.subTest(path=path):
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.get_json()["error"], "values must be a finite number. Failed indices: [1]")
+
+    def test_reduction_missing_values_and_bad_mode_edge_cases(self):
+        response = self.client.post("/mean", json={"values": []})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post("/sum", json={"values": 5})
+        self.assertEqual(response.get_json()["error"], "Please provide a 'values' list of numbers.")
+        response = self.client.post("/product", json={"values": [1], "mode": "exact"})
+        self.assertEqual(response.status_code, 400)
+        self.log_case("/product", {"values": [1], "mode": "exact"}, response.status_code, response.get_json())
+        self.assertIn("mode must be one of", response.get_json()["error"])
+
+
+class TestFlaskResultCache(unittest.TestCase):
+    def setUp(self):
+        app.config["TESTING"] = True
+        app.config["RESULT_CACHE"] = ResultCache(maxsize=2)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.config["RESULT_CACHE"] = None
+
+    def test_repeated_operation_is_served_from_cache(self):
+        first = self.client.post("/div", json={"a": 10, "b": 4})
+        second = self.client.post("/div", json={"a": 10.0, "b": 4})
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertEqual(second.get_json()["result"], 2.5)
+
+        stats = self.client.get("/cache/stats").get_json()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual((stats["hits"], stats["misses"], stats["size"]), (1, 1, 1))
+
+    def test_errors_are_cached_with_status(self):
+        self.client.post("/div", json={"a": 1, "b": 0})
+        response = self.client.post("/div", json={"a": 1, "b": 0})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Division by zero is not allowed.")
+        self.assertEqual(app.config["RESULT_CACHE"].hits, 1)
+
+    def test_signed_zero_and_operation_are_part_of_key(self):
+        positive = self.client.post("/mul", json={"a": 0.0, "b": 5}).get_json()
+        negative = self.client.post("/mul", json={"a": -0.0, "b": 5}).get_json()
+        self.assertEqual(str(positive["result"]), "0.0")
+        self.assertEqual(str(negative["result"]), "-0.0")
+        self.assertEqual(self.client.post("/add", json={"a": 0.0, "b": 5}).get_json()["result"], 5.0)
+
+    def test_invalid_input_bypasses_cache(self):
+        response = self.client.post("/add", json={"a": "hello", "b": 5})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(app.config["RESULT_CACHE"].stats()["misses"], 0)
+
+    def test_cache_stats_when_disabled(self):
+        app.config["RESULT_CACHE"] = None
+        self.assertEqual(self.client.get("/cache/stats").get_json(), {"enabled": False})
+
+
+class TestFlaskMetrics(unittest.TestCase):
+    def setUp(self):
+        app.config["TESTING"] = True
+        self.previous_metrics = app.config["METRICS"]
+        app.config["METRICS"] = MetricsRegistry()
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.config["METRICS"] = self.previous_metrics
+
+    def test_metrics_count_requests_and_errors_by_cause(self):
+        self.client.post("/add", json={"a": 1, "b": 2})
+        self.client.post("/add", json={"a": 1, "b": 2})
+        self.client.post("/div", json={"a": 1, "b": 0})
+        self.client.post("/mul", json={"a": "hello", "b": 2})
+        self.client.get("/missing")
+
+        response = self.client.get("/metrics")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain; version=0.0.4"))
+        text = response.get_data(as_text=True)
+        self.assertIn('calc_requests_total{endpoint="/add",method="POST",status="200"} 2', text)
+        self.assertIn('calc_request_errors_total{endpoint="/div",cause="divide_by_zero"} 1', text)
+        self.assertIn('calc_request_errors_total{endpoint="/mul",cause="bad_input"} 1', text)
+        self.assertIn('calc_request_errors_total{endpoint="unmatched",cause="not_found"} 1', text)
+        self.assertIn('calc_request_duration_seconds_bucket{endpoint="/add",le="+Inf"} 2', text)
+        self.assertIn('calc_request_duration_seconds_count{endpoint="/add"} 2', text)
+
+    def test_metrics_disabled(self):
+        app.config["METRICS"] = None
+        self.assertEqual(self.client.post("/add", json={"a": 1, "b": 2}).status_code, 200)
+        self.assertEqual(self.client.get("/metrics").status_code, 404)
+
+
+class TestFlaskTracing(unittest.TestCase):
+    def setUp(self):
+        app.config["TESTING"] = True
+        app.config["TRACER"] = Tracer(capacity=8)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.config["TRACER"] = None
+        app.config["PROFILER"] = None
+
+    def span_names(self, trace_id):
+        return [span["name"] for span in self.client.get(f"/trace/{trace_id}").get_json()["spans"]]
+
+    def test_trace_id_is_propagated_and_spans_recorded(self):
+        response = self.client.post("/div", json={"a": 8, "b": 2}, headers={"X-Calc-Trace-Id": "ui-trace-1"})
+        self.assertEqual(response.get_json()["result"], 4.0)
+        self.assertEqual(response.headers["X-Calc-Trace-Id"], "ui-trace-1")
+        self.assertIn("calc.div;dur=", response.headers["Server-Timing"])
+        self.assertEqual(self.span_names("ui-trace-1"), ["parse_numbers", "calc.div", "serialize", "request"])
+
+        self.client.post("/eval", json={"expression": "2*3"}, headers={"X-Calc-Trace-Id": "ui-trace-2"})
+        self.assertEqual(self.span_names("ui-trace-2"), ["parse_json", "calc.eval", "serialize", "request"])
+
+    def test_missing_or_invalid_trace_id_gets_a_new_one(self):
+        response = self.client.post("/add", json={"a": 1, "b": 2}, headers={"X-Calc-Trace-Id": "bad id;dur=1"})
+        trace_id = response.headers["X-Calc-Trace-Id"]
+        self.assertRegex(trace_id, r"^[0-9a-f]{16}$")
+        self.assertEqual(self.client.get(f"/trace/{trace_id}").status_code, 200)
+        self.assertEqual(self.client.get("/trace/unknown").status_code, 404)
+
+    def test_tracing_disabled(self):
+        app.config["TRACER"] = None
+        response = self.client.post("/add", json={"a": 1, "b": 2}, headers={"X-Calc-Trace-Id": "ui-trace-3"})
+        self.assertEqual(response.get_json()["result"], 3.0)
+        self.assertNotIn("X-Calc-Trace-Id", response.headers)
+        self.assertNotIn("Server-Timing", response.headers)
+        self.assertEqual(self.client.get("/trace/ui-trace-3").status_code, 404)
+
+    def test_profiles_are_sampled_per_endpoint_and_dumped(self):
+        app.config["TRACER"] = None
+        app.config["PROFILER"] = EndpointProfiler(every=2)
+        for _ in range(4):
+            self.client.post("/add", json={"a": 1, "b": 2})
+
+        self.assertEqual(self.client.get("/profile").get_json(), {"every": 2, "samples": {"/add": 2}})
+        report = self.client.get("/profile?endpoint=/add&limit=5")
+        self.assertEqual(report.status_code, 200)
+        self.assertIn("function calls", report.get_data(as_text=True))
+        self.assertEqual(self.client.get("/profile?endpoint=/sub").status_code, 404)
+
+        with tempfile.TemporaryDirectory() as directory:
+            previous = app.config["PROFILE_DIR"]
+            app.config["PROFILE_DIR"] = directory
+            try:
+                files = self.client.post("/profile/dump").get_json()["files"]
+            finally:
+                app.config["PROFILE_DIR"] = previous
+            self.assertEqual([Path(file).name for file in files], ["add.prof"])
+            self.assertTrue(Path(files[0]).stat().st_size > 0)
+
+    def test_profiling_disabled(self):
+        self.assertEqual(self.client.get("/profile").status_code, 404)
+        self.assertEqual(self.client.post("/profile/dump").status_code, 404)
+
+
+class TestFlaskMicroBatching(unittest.TestCase):
+    def setUp(self):
+        app.config["TESTING"] = True
+        app.config["MICRO_BATCHER"] = MicroBatcher(window=0.001)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.config["MICRO_BATCHER"] = None
+
+    def test_operations_are_evaluated_through_the_batcher(self):
+        self.assertEqual(self.client.post("/add", json={"a": 10, "b": 5}).get_json()["result"], 15.0)
+        self.assertEqual(self.client.post("/div", json={"a": 10, "b": 4}).get_json()["result"], 2.5)
+        self.assertEqual(self.client.post("/pow", json={"a": 2, "b": 3}).get_json()["result"], 8.0)
+        zero = self.client.post("/div", json={"a": 10, "b": 0})
+        self.assertEqual(zero.status_code, 400)
+
+        stats = self.client.get("/batching/stats").get_json()
+        self.assertTrue(stats["enabled"])
+        self.assertEqual(stats["items"], 3)
+
+    def test_batching_stats_when_disabled(self):
+        app.config["MICRO_BATCHER"] = None
+        self.assertEqual(self.client.get("/batching/stats").get_json(), {"enabled": False})
+
+
+class TestFlaskAdmissionControl(unittest.TestCase):
+    def setUp(self):
+        app.config["TESTING"] = True
+        self.previous_metrics = app.config["METRICS"]
+        app.config["METRICS"] = MetricsRegistry()
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.config["CONCURRENCY_LIMITER"] = None
+        app.config["RATE_LIMITER"] = None
+        app.config["METRICS"] = self.previous_metrics
+
+    def test_overload_fails_fast_with_retry_after(self):
+        limiter = app.config["CONCURRENCY_LIMITER"] = ConcurrencyLimiter(max_concurrent=1)
+        self.assertEqual(self.client.post("/add", json={"a": 1, "b": 2}).status_code, 200)
+        self.assertEqual(limiter.stats()["active"], 0)
+
+        limiter.acquire()
+        response = self.client.post("/add", json={"a": 1, "b": 2})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response.headers["Retry-After"], "1")
+        self.assertEqual(response.get_json()["error"], "The calculator is busy. Please retry shortly.")
+
+        # Monitoring and health checks stay reachable while load is being shed.
+        self.assertEqual(self.client.get("/health").status_code, 200)
+        self.assertEqual(self.client.get("/metrics").status_code, 200)
+        self.assertIn('cause="overloaded"', self.client.get("/metrics").get_data(as_text=True))
+        self.assertEqual(self.client.get("/admission/stats").get_json()["concurrency"]["rejected"], 1)
+
+    def test_rate_limit_per_client(self):
+        app.config["RATE_LIMITER"] = TokenBucketLimiter(rate=0.5, burst=2)
+        statuses = [self.client.post("/mul", json={"a": 2, "b": 3}).status_code for _ in range(3)]
+        self.assertEqual(statuses, [200, 200, 429])
+
+        response = self.client.post("/mul", json={"a": 2, "b": 3})
+        self.assertEqual(response.headers["Retry-After"], "2")
+        self.assertEqual(response.get_json()["error"], "Too many requests. Please slow down.")
+
+        other = self.client.post("/mul", json={"a": 2, "b": 3}, environ_base={"REMOTE_ADDR": "10.0.0.2"})
+        self.assertEqual(other.status_code, 200)
+
+    def test_admission_stats_when_disabled(self):
+        self.assertEqual(self.client.get("/admission/stats").get_json(), {"concurrency": None, "rate_limit": None})
+
+
+class TestFlaskNumericModes(unittest.TestCase):
+    def setUp(self):
+        app.config["TESTING"] = True
+        app.config["RESULT_CACHE"] = ResultCache(maxsize=8)
+        self.client = app.test_client()
+
+    def tearDown(self):
+        app.config["RESULT_CACHE"] = None
+
+    def test_decimal_mode_avoids_overflow_and_binary_rounding(self):
+        response = self.client.post("/add", json={"a": 1e308, "b": 1e308, "mode": "decimal"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json(), {"operation": "add", "mode": "decimal", "a": 1e308, "b": 1e308, "result": "2E+308"}
+        )
+        self.assertEqual(self.client.post("/add", json={"a": 0.1, "b": "0.2", "mode": "decimal"}).get_json()["result"], "0.3")
+
+    def test_fraction_mode(self):
+        self.assertEqual(self.client.post("/div", json={"a": 1, "b": 3, "mode": "fraction"}).get_json()["result"], "1/3")
+        self.assertEqual(self.client.post("/mul", json={"a": "1/3", "b": 3, "mode": "fraction"}).get_json()["result"], "1")
+
+    def test_float_mode_is_the_default(self):
+        explicit = self.client.post("/add", json={"a": 0.1, "b": 0.2, "mode": "float"})
+        self.assertEqual(explicit.get_json()["result"], 0.30000000000000004)
+        self.assertNotIn("mode", explicit.get_json())
+
+    def test_exact_mode_errors(self):
+        response = self.client.post("/div", json={"a": 1, "b": "0", "mode": "fraction"})
+        self.assertEqual((response.status_code, response.get_json()["error"]), (400, "Division by zero is not allowed."))
+        response = self.client.post("/sub", json={"a": "abc", "b": 1, "mode": "decimal"})
+        self.assertEqual((response.status_code, response.get_json()["error"]), (400, "a is not a valid number."))
+        response = self.client.post("/add", json={"a": 1, "b": 2, "mode": "complex"})
+        self.assertEqual((response.status_code, response.get_json()["error"]), (400, "mode must be one of: float, decimal, fraction."))
+
+    def test_pow_exact_modes(self):
+        self.assertEqual(self.client.post("/pow", json={"a": "1/3", "b": 3, "mode": "fraction"}).get_json()["result"], "1/27")
+        self.assertEqual(self.client.post("/pow", json={"a": "1.1", "b": 2, "mode": "decimal"}).get_json()["result"], "1.21")
+        response = self.client.post("/pow", json={"a": 0, "b": -1, "mode": "decimal"})
+        self.assertEqual((response.status_code, response.get_json()["error"]), (400, "Cannot raise zero to a negative power."))
+        response = self.client.post("/pow", json={"a": 2, "b": "1/2", "mode": "fraction"})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("use decimal mode", response.get_json()["error"])
+
+    def test_operation_without_an_exact_backend_is_rejected(self):
+        body, status = compute_exact("mod", {"a": 7, "b": 2, "mode": "decimal"})
+        self.assertEqual((status, body), (400, {"error": "mod does not support the decimal and fraction modes."}))
+
+    def test_exact_modes_bypass_the_float_cache(self):
+        self.client.post("/div", json={"a": 1, "b": 3})
+        exact = self.client.post("/div", json={"a": 1, "b": 3, "mode": "fraction"})
+        self.assertEqual(exact.get_json()["result"], "1/3")
+        self.assertEqual(app.config["RESULT_CACHE"].stats()["hits"], 0)
+
 
 if __name__ == "__main__":
     unittest.main()
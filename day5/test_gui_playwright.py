@@ -6,6 +6,12 @@ from pathlib import Path
 
 from playwright.sync_api import sync_playwright
 
+try:
+	from day5.calc_modes import DIVISION_BY_ZERO_MESSAGE
+	from day5.day5_streamlit_cals import PENDING_MESSAGE
+except ModuleNotFoundError:
+	from calc_modes import DIVISION_BY_ZERO_MESSAGE
+	from day5_streamlit_cals import PENDING_MESSAGE
 
 BASE_URL = "http://127.0.0.1:8501"
 ACTION_WAIT_MS = 1200
@@ -53,6 +59,8 @@ class TestStreamlitCalculatorWithPlaywright(unittest.TestCase):
 			page.wait_for_timeout(ACTION_WAIT_MS)
 
 	def read_display(self, page) -> str:
+		# Remote results arrive in a later rerun, after the pending caption goes away.
+		page.get_by_text(PENDING_MESSAGE).wait_for(state="detached")
 		return page.get_by_label("Display").input_value()
 
 	def wait_and_close(self, page, browser):
@@ -91,16 +99,23 @@ class TestStreamlitCalculatorWithPlaywright(unittest.TestCase):
 		with sync_playwright() as playwright:
 			browser, page = self.open_calculator(playwright)
 			self.click_sequence(page, ["AC", "9", "÷", "0", "="])
-			self.assertTrue(page.get_by_text(ERROR_TEXT).is_visible())
 			self.assertEqual(self.read_display(page), "Error")
+			self.assertTrue(page.get_by_text(DIVISION_BY_ZERO_MESSAGE).is_visible())
 			self.wait_and_close(page, browser)
 
-	def test_equals_without_inputs_shows_error(self):
+	def test_power_via_streamlit_ui(self):
+		with sync_playwright() as playwright:
+			browser, page = self.open_calculator(playwright)
+			self.click_sequence(page, ["AC", "2", "xʸ", "1", "0", "="])
+			self.assertEqual(self.read_display(page), "1024")
+			self.wait_and_close(page, browser)
+
+	def test_equals_without_inputs_keeps_display_empty(self):
 		with sync_playwright() as playwright:
 			browser, page = self.open_calculator(playwright)
 			self.click_sequence(page, ["AC", "="])
-			self.assertTrue(page.get_by_text(ERROR_TEXT).is_visible())
-			self.assertEqual(self.read_display(page), "Error")
+			self.assertEqual(self.read_display(page), "")
+			self.assertFalse(page.get_by_text(ERROR_TEXT).is_visible())
 			self.wait_and_close(page, browser)
 
 	def test_equals_with_only_one_number_shows_error(self):
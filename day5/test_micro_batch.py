@@ -0,0 +1,87 @@
+import asyncio
+import threading
+import unittest
+
+try:
+    from day5.micro_batch import VECTORIZE_MIN_ITEMS, AsyncMicroBatcher, MicroBatcher, evaluate_coalesced
+except ModuleNotFoundError:
+    from micro_batch import VECTORIZE_MIN_ITEMS, AsyncMicroBatcher, MicroBatcher, evaluate_coalesced
+
+
+class TestEvaluateCoalesced(unittest.TestCase):
+    def test_matches_python_float_arithmetic(self):
+        operations = ["add", "sub", "mul", "div", "add", "mul"]
+        a = [0.1, 1e308, 1e308, 1.0, -0.0, 3.0]
+        b = [0.2, -1e308, 10.0, 3.0, 0.0, -0.0]
+        expected = [0.1 + 0.2, 1e308 - -1e308, 1e308 * 10.0, 1.0 / 3.0, -0.0 + 0.0, 3.0 * -0.0]
+        # Small batches take the Python loop; repeated ones take the NumPy path.
+        for repeat in (1, VECTORIZE_MIN_ITEMS):
+            with self.subTest(repeat=repeat):
+                results = evaluate_coalesced(operations * repeat, a * repeat, b * repeat)
+                self.assertEqual([repr(value) for value in results], [repr(value) for value in expected * repeat])
+        self.assertEqual(evaluate_coalesced(["div"], [10.0], [4.0]), [2.5])
+
+    def test_power_overflow_matches_on_both_paths(self):
+        a = [2.0, 10.0, -10.0, -2.0, 2.0]
+        b = [0.5, 400.0, 401.0, -3.0, float("inf")]
+        expected = [2.0**0.5, float("inf"), float("-inf"), -0.125, float("inf")]
+        for repeat in (1, VECTORIZE_MIN_ITEMS):
+            with self.subTest(repeat=repeat):
+                self.assertEqual(evaluate_coalesced(["pow"] * 5 * repeat, a * repeat, b * repeat), expected * repeat)
+
+
+class TestMicroBatcher(unittest.TestCase):
+    def test_concurrent_requests_share_batches(self):
+        batcher = MicroBatcher(window=0.05, max_items=1000)
+        results = [None] * 20
+        start = threading.Barrier(20)
+
+        def worker(index):
+            start.wait()
+            results[index] = batcher.submit("mul", float(index), 2.0)
+
+        threads = [threading.Thread(target=worker, args=(index,)) for index in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [index * 2.0 for index in range(20)])
+        stats = batcher.stats()
+        self.assertEqual(stats["items"], 20)
+        self.assertLess(stats["batches"], 20)
+
+    def test_full_batch_closes_before_the_window(self):
+        batcher = MicroBatcher(window=10.0, max_items=1)
+        self.assertEqual(batcher.submit("add", 1.0, 2.0), 3.0)
+        self.assertEqual(batcher.stats()["batches"], 1)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            MicroBatcher(window=0)
+        with self.assertRaises(ValueError):
+            AsyncMicroBatcher(max_items=0)
+
+
+class TestAsyncMicroBatcher(unittest.TestCase):
+    def test_gathered_requests_share_one_batch(self):
+        batcher = AsyncMicroBatcher(window=0.01, max_items=100)
+
+        async def run():
+            return await asyncio.gather(*(batcher.submit("sub", float(index), 1.0) for index in range(10)))
+
+        self.assertEqual(asyncio.run(run()), [index - 1.0 for index in range(10)])
+        self.assertEqual(batcher.stats()["batches"], 1)
+        self.assertEqual(batcher.stats()["largest_batch"], 10)
+
+    def test_max_items_flushes_immediately(self):
+        batcher = AsyncMicroBatcher(window=10.0, max_items=2)
+
+        async def run():
+            return await asyncio.wait_for(asyncio.gather(batcher.submit("add", 1.0, 1.0), batcher.submit("div", 1.0, 4.0)), 1)
+
+        self.assertEqual(asyncio.run(run()), [2.0, 0.25])
+
+
+if __name__ == "__main__":
+    unittest.main()
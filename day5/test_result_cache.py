@@ -0,0 +1,61 @@
+import unittest
+
+try:
+    from day5.result_cache import ResultCache
+except ModuleNotFoundError:
+    from result_cache import ResultCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache(unittest.TestCase):
+    def test_hit_and_miss_counters(self):
+        cache = ResultCache(maxsize=4)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", b"{}", 200)
+        self.assertEqual(cache.get("k"), (b"{}", 200))
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["hit_ratio"]), (1, 1, 0.5))
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ResultCache(maxsize=2)
+        cache.put("a", b"1", 200)
+        cache.put("b", b"2", 200)
+        cache.get("a")
+        cache.put("c", b"3", 200)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), (b"1", 200))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_entries_expire_after_ttl(self):
+        clock = FakeClock()
+        cache = ResultCache(maxsize=2, ttl=10, clock=clock)
+        cache.put("a", b"1", 200)
+        clock.now = 9.9
+        self.assertIsNotNone(cache.get("a"))
+        clock.now = 10.0
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats()["expirations"], 1)
+        self.assertEqual(cache.stats()["size"], 0)
+
+    def test_clear_resets_entries_and_counters(self):
+        cache = ResultCache(maxsize=2)
+        cache.put("a", b"1", 200)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(cache.stats()["size"], 0)
+        self.assertEqual(cache.stats()["hits"], 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ResultCache(maxsize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()